@@ -0,0 +1,3 @@
+"""Benchmarks for py_dsa, run from the python directory with
+``python -m benchmarks.<name>``. They are not part of the installed package.
+"""
@@ -0,0 +1,103 @@
+"""Compare the MaxFlow methods against the Edmonds-Karp baseline.
+
+With --overhead, instead time every method with and without FlowStats
+collection, to check that the instrumentation costs nothing when it is off.
+
+Usage: python -m benchmarks.bench_flow [--nodes N] [--density P]
+    [--capacity C] [--matching N] [--seed S] [--overhead] [--repeat R]
+"""
+
+import argparse
+import time
+from typing import Callable, Dict
+
+from py_dsa.algorithms import FlowStats, MaxFlow
+from py_dsa.datastructures import MatchingGraph
+
+from benchmarks import generators
+
+
+def run_methods(name: str, build: Callable[[], MatchingGraph]) -> Dict[str, float]:
+    """Solve a fresh copy of an instance with every method, check they agree
+    and print the time and speedup over Edmonds-Karp of each."""
+    mg = build()
+    edges = sum(len(mg.get_edges(node)) for node in mg.get_nodes())
+    print(f"{name}: {len(list(mg.get_nodes()))} nodes, {edges} edges")
+    times, values = {}, {}
+    for method in MaxFlow.METHODS:
+        mg = build()
+        start = time.perf_counter()
+        values[method] = MaxFlow(mg, method=method).max_flow_val()
+        times[method] = time.perf_counter() - start
+    if len(set(values.values())) != 1:
+        raise AssertionError(f"max flow methods disagree: {values}")
+    for method in MaxFlow.METHODS:
+        speedup = times["edmonds_karp"] / times[method]
+        print(f"  {method:14s} {times[method]:8.3f}s {speedup:8.1f}x  flow={values[method]}")
+    return times
+
+
+def stats_overhead(
+    name: str, build: Callable[[], MatchingGraph], repeat: int
+) -> Dict[str, float]:
+    """Time every method on fresh copies of an instance without stats, with
+    stats, and with stats plus a progress callback, and print the best time
+    of repeat runs of each, relative to the run without stats."""
+    print(name)
+    overheads = {}
+    for method in MaxFlow.METHODS:
+        variants = {
+            "off": {},
+            "stats": {"stats": FlowStats()},
+            "progress": {"progress": lambda stats: None, "progress_every": 100},
+        }
+        times = {}
+        for variant, kwargs in variants.items():
+            best = float("inf")
+            for _ in range(repeat):
+                mg = build()
+                solver = MaxFlow(mg, method=method, **kwargs)
+                start = time.perf_counter()
+                solver.max_flow_val()
+                best = min(best, time.perf_counter() - start)
+            times[variant] = best
+        print(
+            f"  {method:14s} off {times['off']:8.3f}s"
+            + "".join(
+                f"  {variant} {times[variant] / times['off'] - 1:+7.1%}"
+                for variant in ("stats", "progress")
+            )
+        )
+        overheads[method] = times["stats"] / times["off"] - 1
+    return overheads
+
+
+def main() -> None:
+    """Run the max flow benchmark on a dense network and a bipartite matching."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=200, help="inner nodes of the dense network")
+    parser.add_argument("--density", type=float, default=0.3)
+    parser.add_argument("--capacity", type=int, default=100)
+    parser.add_argument("--matching", type=int, default=200, help="nodes per side of the matching")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--overhead", action="store_true", help="measure the FlowStats overhead")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per variant with --overhead")
+    args = parser.parse_args()
+
+    instances = {
+        "dense network": lambda: generators.dense_network(
+            args.nodes, args.density, args.capacity, args.seed
+        ),
+        "bipartite matching": lambda: generators.bipartite_matching(
+            args.matching, args.matching, 3, args.seed
+        ),
+    }
+    for name, build in instances.items():
+        if args.overhead:
+            stats_overhead(name, build, args.repeat)
+        else:
+            run_methods(name, build)
+
+
+if __name__ == "__main__":
+    main()
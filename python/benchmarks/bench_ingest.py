@@ -0,0 +1,75 @@
+"""Compare bulk edge ingestion against a per-edge add_edge loop.
+
+Usage: python -m benchmarks.bench_ingest [--edges N] [--nodes N] [--seed S]
+"""
+
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+
+from py_dsa.datastructures import WeightedGraph, UnweightedGraph
+
+
+def timed(fn: Callable[[], object]) -> float:
+    """Return the wall time of a single call to fn."""
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the ingestion benchmark and print edges/s for every method."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    src = rng.integers(0, args.nodes, args.edges)
+    dst = rng.integers(0, args.nodes, args.edges)
+    weights = rng.random(args.edges)
+    edges = list(zip(src.tolist(), dst.tolist(), weights.tolist()))
+    pairs = [(u, v) for u, v, _ in edges]
+
+    def per_edge_weighted() -> None:
+        g = WeightedGraph()
+        for u, v, w in edges:
+            g.add_edge(u, v, w)
+
+    def per_edge_unweighted() -> None:
+        g = UnweightedGraph()
+        for u, v in pairs:
+            g.add_edge(u, v)
+
+    cases = [
+        ("WeightedGraph.add_edge loop", per_edge_weighted),
+        ("WeightedGraph.add_edges_from", lambda: WeightedGraph().add_edges_from(edges)),
+        (
+            "WeightedGraph.add_edges_from_arrays",
+            lambda: WeightedGraph().add_edges_from_arrays(src, dst, weights),
+        ),
+        ("UnweightedGraph.add_edge loop", per_edge_unweighted),
+        ("UnweightedGraph.add_edges_from", lambda: UnweightedGraph().add_edges_from(pairs)),
+        (
+            "UnweightedGraph.add_edges_from_arrays",
+            lambda: UnweightedGraph().add_edges_from_arrays(src, dst),
+        ),
+    ]
+
+    print(f"{args.edges} edges over {args.nodes} nodes")
+    baseline = None
+    for name, fn in cases:
+        elapsed = timed(fn)
+        if name.endswith("loop"):
+            baseline = elapsed
+        speedup = baseline / elapsed if baseline else 1.0
+        print(
+            f"{name:40s} {elapsed:8.3f}s {args.edges / elapsed:14,.0f} edges/s {speedup:6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compare the shortest path searches against networkx on a road-like grid.
+
+The graph is generators.road_grid, whose street lengths make the Manhattan
+distance between grid positions an admissible A* heuristic. Every search
+runs on the same random queries and their path lengths are checked against
+each other.
+
+Usage: python -m benchmarks.bench_shortest_paths [--rows R] [--cols C]
+    [--queries Q] [--seed S]
+"""
+
+import argparse
+import math
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+from py_dsa.algorithms import astar_path, bidirectional_dijkstra, dijkstra, dijkstra_path
+from py_dsa.datastructures import CSRGraph
+
+from benchmarks import generators
+
+
+def time_queries(
+    search: Callable[[int, int], float], queries: List[Tuple[int, int]]
+) -> Tuple[float, List[float]]:
+    """Run search on every query, returning the total time and the lengths."""
+    start = time.perf_counter()
+    lengths = [search(s, t) for s, t in queries]
+    return time.perf_counter() - start, lengths
+
+
+def main() -> None:
+    """Time every search of py_dsa and networkx on the same queries."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=300)
+    parser.add_argument("--cols", type=int, default=300)
+    parser.add_argument("--queries", type=int, default=20, help="point to point queries")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    import networkx as nx
+
+    cols = args.cols
+    g = generators.road_grid(args.rows, cols, args.seed)
+    csr: CSRGraph = g.to_csr()
+    start = time.perf_counter()
+    csr.reverse()
+    reverse_time = time.perf_counter() - start
+    nxg = nx.DiGraph()
+    nxg.add_weighted_edges_from(
+        (u, v, w) for u in g.get_nodes() for v, w in g.get_edges(u).items()
+    )
+    print(f"grid {args.rows}x{cols}: {csr.num_nodes()} nodes, {csr.num_edges()} edges")
+    print(f"  CSRGraph.reverse   {reverse_time:8.3f}s (once, cached)")
+
+    start = time.perf_counter()
+    dist, _ = dijkstra(csr, 0)
+    ours = time.perf_counter() - start
+    start = time.perf_counter()
+    nx_dist = nx.single_source_dijkstra_path_length(nxg, 0)
+    theirs = time.perf_counter() - start
+    if any(not math.isclose(dist[v], d) for v, d in nx_dist.items()):
+        raise AssertionError("single source distances disagree with networkx")
+    print(f"  single source      {ours:8.3f}s  networkx {theirs:8.3f}s  {theirs / ours:5.2f}x")
+
+    def manhattan(u: int, v: int) -> float:
+        return abs(u // cols - v // cols) + abs(u % cols - v % cols)
+
+    rng = random.Random(args.seed)
+    n = csr.num_nodes()
+    queries = [(rng.randrange(n), rng.randrange(n)) for _ in range(args.queries)]
+    searches: Dict[str, Tuple[Callable[[int, int], float], Callable[[int, int], float]]] = {
+        "dijkstra": (
+            lambda s, t: dijkstra_path(csr, s, t)[0],
+            lambda s, t: nx.dijkstra_path_length(nxg, s, t),
+        ),
+        "bidirectional": (
+            lambda s, t: bidirectional_dijkstra(csr, s, t)[0],
+            lambda s, t: nx.bidirectional_dijkstra(nxg, s, t)[0],
+        ),
+        "astar": (
+            lambda s, t: astar_path(csr, s, t, manhattan)[0],
+            lambda s, t: nx.astar_path_length(nxg, s, t, heuristic=manhattan),
+        ),
+    }
+    for name, (search, nx_search) in searches.items():
+        ours, lengths = time_queries(search, queries)
+        theirs, nx_lengths = time_queries(nx_search, queries)
+        if any(not math.isclose(a, b) for a, b in zip(lengths, nx_lengths)):
+            raise AssertionError(f"{name} path lengths disagree with networkx")
+        print(
+            f"  {name:18s} {ours:8.3f}s  networkx {theirs:8.3f}s  {theirs / ours:5.2f}x"
+            f"  ({len(queries)} queries)"
+        )
+
+
+if __name__ == "__main__":
+    main()
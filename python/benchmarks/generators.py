@@ -0,0 +1,248 @@
+"""Seeded synthetic graph generators for the benchmarks.
+
+Every generator takes a seed and returns the same graph for the same
+arguments on every platform, so benchmark runs are comparable. Nodes are the
+integers 0..n-1 unless stated otherwise.
+"""
+
+import random
+from typing import List, Tuple
+
+from py_dsa.datastructures import MatchingGraph, UnweightedGraph, WeightedGraph
+
+WeightedEdge = Tuple[int, int, float]
+
+
+def erdos_renyi(n: int, m: int, seed: int = 0) -> List[WeightedEdge]:
+    """Return a G(n, m) random directed graph with uniform weights in [0, 1).
+
+    Args:
+        n (int): Number of nodes.
+        m (int): Number of distinct edges, without self loops.
+        seed (int, optional): Seed for the random number generator.
+
+    Returns:
+        List[WeightedEdge]: The edges as (source, dest, weight) triples.
+
+    Raises:
+        ValueError: If m exceeds the n * (n - 1) possible edges.
+
+    """
+    if m > n * (n - 1):
+        raise ValueError(f"G({n}, m) has at most {n * (n - 1)} edges, got {m}")
+    rng = random.Random(seed)
+    seen = set()
+    edges = []
+    while len(edges) < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v and (u, v) not in seen:
+            seen.add((u, v))
+            edges.append((u, v, rng.random()))
+    return edges
+
+
+def grid(rows: int, cols: int, seed: int = 0) -> List[WeightedEdge]:
+    """Return a rows x cols grid with uniform weights in [0, 1).
+
+    Each node is connected to its right and lower neighbour, so the graph is
+    connected and has rows * (cols - 1) + cols * (rows - 1) edges. Node
+    (r, c) is numbered r * cols + c.
+
+    Args:
+        rows (int): Number of rows.
+        cols (int): Number of columns.
+        seed (int, optional): Seed for the random number generator.
+
+    Returns:
+        List[WeightedEdge]: The edges as (source, dest, weight) triples.
+
+    """
+    rng = random.Random(seed)
+    edges = []
+    for r in range(rows):
+        for c in range(cols):
+            u = r * cols + c
+            if c + 1 < cols:
+                edges.append((u, u + 1, rng.random()))
+            if r + 1 < rows:
+                edges.append((u, u + cols, rng.random()))
+    return edges
+
+
+def road_grid(rows: int, cols: int, seed: int = 0) -> WeightedGraph:
+    """Return a road-like rows x cols grid with every street both ways.
+
+    Street lengths are in [1, 2), so the Manhattan distance between grid
+    positions never overestimates a shortest path and can drive A*.
+
+    Args:
+        rows (int): Number of rows.
+        cols (int): Number of columns.
+        seed (int, optional): Seed for the random number generator.
+
+    Returns:
+        WeightedGraph: The grid, node (r, c) is numbered r * cols + c.
+
+    """
+    g = WeightedGraph()
+    for u, v, w in grid(rows, cols, seed):
+        g.add_edge(u, v, 1 + w)
+        g.add_edge(v, u, 1 + w)
+    return g
+
+
+def power_law(n: int, k: int, seed: int = 0) -> List[WeightedEdge]:
+    """Return a Barabási–Albert preferential attachment graph.
+
+    Starting from k + 1 nodes, every new node links to k distinct earlier
+    nodes chosen with probability proportional to their degree, which gives a
+    power-law degree distribution. Edges point from the newer to the older
+    node, so the graph is also a DAG.
+
+    Args:
+        n (int): Number of nodes, at least k + 1.
+        k (int): Edges added per new node.
+        seed (int, optional): Seed for the random number generator.
+
+    Returns:
+        List[WeightedEdge]: The edges as (source, dest, weight) triples.
+
+    """
+    rng = random.Random(seed)
+    edges = []
+    # every node appears here once per incident edge, so uniform picks from it
+    # are degree proportional
+    endpoints = list(range(k + 1))
+    for u in range(k + 1, n):
+        targets = set()
+        while len(targets) < k:
+            targets.add(rng.choice(endpoints))
+        for v in sorted(targets):
+            edges.append((u, v, rng.random()))
+            endpoints.append(v)
+        endpoints.extend([u] * k)
+    return edges
+
+
+def layered_dag(layers: int, width: int, degree: int, seed: int = 0) -> UnweightedGraph:
+    """Return a DAG of layers x width nodes where every node links to degree
+    random nodes of the next layer.
+
+    Nodes are added in a shuffled order so ids don't follow the topological
+    order.
+
+    Args:
+        layers (int): Number of layers.
+        width (int): Nodes per layer.
+        degree (int): Out-degree of every node outside the last layer.
+        seed (int, optional): Seed for the random number generator.
+
+    Returns:
+        UnweightedGraph: The DAG, node (layer, i) is numbered layer * width + i.
+
+    """
+    rng = random.Random(seed)
+    g = UnweightedGraph()
+    nodes = list(range(layers * width))
+    rng.shuffle(nodes)
+    for node in nodes:
+        g.add_node(node)
+    degree = min(degree, width)
+    edges = []
+    for layer in range(layers - 1):
+        next_layer = range((layer + 1) * width, (layer + 2) * width)
+        for u in range(layer * width, (layer + 1) * width):
+            edges.extend((u, v) for v in rng.sample(next_layer, degree))
+    g.add_edges_from(edges)
+    return g
+
+
+def bipartite_matching(
+    left: int, right: int, degree: int, seed: int = 0, max_cost: int = 0
+) -> MatchingGraph:
+    """Return a unit capacity matching instance.
+
+    The source links to every left node ("l", i), every left node links to
+    degree random right nodes ("r", j), and every right node links to the sink.
+
+    Args:
+        left (int): Number of left nodes.
+        right (int): Number of right nodes.
+        degree (int): Out-degree of every left node.
+        seed (int, optional): Seed for the random number generator.
+        max_cost (int, optional): Left to right edges get a cost uniform in
+            [0, max_cost]. Defaults to 0, no costs.
+
+    Returns:
+        MatchingGraph: The instance, with source "s" and sink "t".
+
+    """
+    rng = random.Random(seed)
+    mg = MatchingGraph("s", "t")
+    degree = min(degree, right)
+    for i in range(left):
+        mg.add_edge("s", ("l", i))
+        for j in rng.sample(range(right), degree):
+            cost = rng.randint(0, max_cost) if max_cost else 0
+            mg.add_edge(("l", i), ("r", j), cost=cost)
+    for j in range(right):
+        mg.add_edge(("r", j), "t")
+    return mg
+
+
+def dense_network(n: int, density: float, max_capacity: int, seed: int = 0) -> MatchingGraph:
+    """Return a dense random flow network.
+
+    Every ordered pair of the n inner nodes is an edge with probability
+    density, and so is the source to every inner node and every inner node to
+    the sink. Capacities are uniform in [1, max_capacity]. Such graphs have
+    many short augmenting paths.
+
+    Args:
+        n (int): Number of inner nodes.
+        density (float): Edge probability.
+        max_capacity (int): Largest edge capacity.
+        seed (int, optional): Seed for the random number generator.
+
+    Returns:
+        MatchingGraph: The network, with source "s" and sink "t".
+
+    """
+    rng = random.Random(seed)
+    mg = MatchingGraph("s", "t")
+    for u in range(n):
+        if rng.random() < density:
+            mg.add_edge("s", u, rng.randint(1, max_capacity))
+        if rng.random() < density:
+            mg.add_edge(u, "t", rng.randint(1, max_capacity))
+        for v in range(n):
+            if u != v and rng.random() < density:
+                mg.add_edge(u, v, rng.randint(1, max_capacity))
+    return mg
+
+
+def eulerian_circuit(n: int, m: int, seed: int = 0) -> List[List[int]]:
+    """Return the edges of a random closed walk over n nodes, in shuffled
+    order, so an Eulerian circuit is guaranteed to exist.
+
+    Args:
+        n (int): Number of nodes, at least 2.
+        m (int): Number of edges, one more is added if the walk would
+            otherwise need a self loop to close.
+        seed (int, optional): Seed for the random number generator.
+
+    Returns:
+        List[List[int]]: The edges as [source, dest] pairs.
+
+    """
+    rng = random.Random(seed)
+    walk = [rng.randrange(n)]
+    for _ in range(m - 1):
+        walk.append((walk[-1] + rng.randrange(1, n)) % n)
+    walk.append(walk[0])
+    if walk[-1] == walk[-2]:
+        # the walk returned to its start node early, detour through a neighbour
+        walk.insert(-1, (walk[0] + 1) % n)
+    pairs = [[u, v] for u, v in zip(walk, walk[1:])]
+    rng.shuffle(pairs)
+    return pairs
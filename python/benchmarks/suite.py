@@ -0,0 +1,427 @@
+"""Scaling benchmarks for the graph algorithms.
+
+Runs every case over a range of size tiers on the seeded generators in
+benchmarks.generators, recording wall time, peak memory and ops/s (graph
+nodes plus edges processed per second) to JSON. Two JSON runs can then be
+compared to flag regressions.
+
+Usage:
+    python -m benchmarks.suite run [--tiers small medium] [--cases NAME ...]
+        [--repeat N] [--seed S] [--out FILE]
+    python -m benchmarks.suite compare BASELINE CANDIDATE [--threshold 0.1]
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from py_dsa.algorithms import (
+    MST,
+    EularianPath,
+    GomoryHuTree,
+    MaxFlow,
+    MinCostFlow,
+    assignment,
+    dijkstra,
+    max_bipartite_matching,
+    topological_sort,
+)
+from py_dsa.datastructures import UnweightedGraph, WeightedGraph
+
+from benchmarks import generators
+
+TIERS = ("small", "medium", "large")
+
+
+class Case(NamedTuple):
+    """A benchmarked algorithm on one family of generated inputs.
+
+    setup builds a fresh input of the given size outside the timed region,
+    run is timed on it, and ops counts the nodes plus edges of the input.
+    """
+
+    name: str
+    sizes: Dict[str, int]
+    setup: Callable[[int, int], Any]
+    run: Callable[[Any], Any]
+    ops: Callable[[Any], int]
+
+
+def _dag_from_edges(edges: List[generators.WeightedEdge]) -> UnweightedGraph:
+    g = UnweightedGraph()
+    g.add_edges_from((u, v) for u, v, _ in edges)
+    return g
+
+
+def _undirected(n: int, edges: List[generators.WeightedEdge]) -> WeightedGraph:
+    """Add every edge both ways with an integer capacity, keeping the first
+    of two opposite edges."""
+    g = WeightedGraph()
+    for node in range(n):
+        g.add_node(node)
+    for u, v, w in edges:
+        if not g.has_edge(v, u):
+            capacity = int(w * 100) + 1
+            g.add_edge(u, v, capacity)
+            g.add_edge(v, u, capacity)
+    return g
+
+
+def _graph_ops(g: Any) -> int:
+    return g.num_nodes() + sum(g.degree(node) for node in g.get_nodes())
+
+
+def _mst(n: int, edges: List[generators.WeightedEdge]) -> MST:
+    mst = MST(n)
+    for u, v, w in edges:
+        mst.add_edge(u, v, w, u, v)
+    return mst
+
+
+def _grid_mst(size: int, seed: int) -> MST:
+    side = math.isqrt(size)
+    return _mst(side * side, generators.grid(side, side, seed))
+
+
+def _cost_matrix(size: int, seed: int) -> Any:
+    # numpy is only needed by the assignment case
+    import numpy as np
+
+    return np.random.default_rng(seed).integers(0, 1_000, (size, size))
+
+
+def _matching_ops(mg: Any) -> int:
+    nodes = list(mg.get_nodes())
+    return len(nodes) + sum(len(mg.get_edges(node)) for node in nodes)
+
+
+CASES = [
+    Case(
+        "topological_sort/layered_dag",
+        {"small": 1_000, "medium": 10_000, "large": 100_000},
+        lambda size, seed: generators.layered_dag(size // 100, 100, 4, seed),
+        topological_sort,
+        _graph_ops,
+    ),
+    Case(
+        "topological_sort/power_law",
+        {"small": 1_000, "medium": 10_000, "large": 100_000},
+        lambda size, seed: _dag_from_edges(generators.power_law(size, 3, seed)),
+        topological_sort,
+        _graph_ops,
+    ),
+    Case(
+        "max_flow/bipartite",
+        {"small": 50, "medium": 100, "large": 200},
+        lambda size, seed: generators.bipartite_matching(size, size, 3, seed),
+        lambda mg: MaxFlow(mg).max_flow_val(),
+        _matching_ops,
+    ),
+    Case(
+        "max_flow/dense",
+        {"small": 50, "medium": 100, "large": 200},
+        lambda size, seed: generators.dense_network(size, 0.1, 100, seed),
+        lambda mg: MaxFlow(mg).max_flow_val(),
+        _matching_ops,
+    ),
+    Case(
+        "max_flow_dinic/bipartite",
+        {"small": 1_000, "medium": 10_000, "large": 50_000},
+        lambda size, seed: generators.bipartite_matching(size, size, 3, seed),
+        lambda mg: MaxFlow(mg, method="dinic").max_flow_val(),
+        _matching_ops,
+    ),
+    Case(
+        "max_flow_dinic/dense",
+        {"small": 100, "medium": 300, "large": 1_000},
+        lambda size, seed: generators.dense_network(size, 0.1, 100, seed),
+        lambda mg: MaxFlow(mg, method="dinic").max_flow_val(),
+        _matching_ops,
+    ),
+    Case(
+        "max_flow_push_relabel/bipartite",
+        {"small": 1_000, "medium": 10_000, "large": 50_000},
+        lambda size, seed: generators.bipartite_matching(size, size, 3, seed),
+        lambda mg: MaxFlow(mg, method="push_relabel").max_flow_val(),
+        _matching_ops,
+    ),
+    Case(
+        "max_flow_push_relabel/dense",
+        {"small": 100, "medium": 300, "large": 1_000},
+        lambda size, seed: generators.dense_network(size, 0.1, 100, seed),
+        lambda mg: MaxFlow(mg, method="push_relabel").max_flow_val(),
+        _matching_ops,
+    ),
+    Case(
+        "hopcroft_karp/bipartite",
+        {"small": 1_000, "medium": 10_000, "large": 50_000},
+        lambda size, seed: generators.bipartite_matching(size, size, 3, seed),
+        max_bipartite_matching,
+        _matching_ops,
+    ),
+    Case(
+        "min_cost_flow/assignment",
+        {"small": 500, "medium": 2_000, "large": 5_000},
+        lambda size, seed: generators.bipartite_matching(size, size, 3, seed, max_cost=100),
+        lambda mg: MinCostFlow(mg).min_cost_flow(),
+        _matching_ops,
+    ),
+    Case(
+        "assignment/dense",
+        {"small": 200, "medium": 1_000, "large": 2_000},
+        _cost_matrix,
+        assignment,
+        lambda cost: cost.size,
+    ),
+    Case(
+        # serial, so results don't depend on the number of CPUs
+        "gomory_hu/erdos_renyi",
+        {"small": 50, "medium": 200, "large": 500},
+        lambda size, seed: _undirected(size, generators.erdos_renyi(size, 4 * size, seed)),
+        lambda g: GomoryHuTree(g, max_workers=1),
+        _graph_ops,
+    ),
+    Case(
+        "dijkstra/grid",
+        {"small": 1_024, "medium": 10_000, "large": 102_400},
+        lambda size, seed: generators.road_grid(math.isqrt(size), math.isqrt(size), seed).to_csr(),
+        lambda csr: dijkstra(csr, 0),
+        lambda csr: csr.num_nodes() + csr.num_edges(),
+    ),
+    Case(
+        "kruskal/grid",
+        {"small": 1_024, "medium": 10_000, "large": 102_400},
+        _grid_mst,
+        MST.kruskal,
+        lambda mst: mst.num_nodes + len(mst.edges),
+    ),
+    Case(
+        "kruskal/power_law",
+        {"small": 1_000, "medium": 10_000, "large": 100_000},
+        lambda size, seed: _mst(size, generators.power_law(size, 3, seed)),
+        MST.kruskal,
+        lambda mst: mst.num_nodes + len(mst.edges),
+    ),
+    Case(
+        # EularianPath recurses once per edge, keep the tiers within reach of
+        # the raised recursion limit
+        "eularian_path/circuit",
+        {"small": 1_000, "medium": 10_000, "large": 50_000},
+        lambda size, seed: generators.eulerian_circuit(max(2, size // 10), size, seed),
+        EularianPath,
+        len,
+    ),
+]
+
+
+def measure(case: Case, tier: str, repeat: int, seed: int) -> Dict[str, Any]:
+    """Benchmark one case on one tier.
+
+    The wall time is the best of repeat runs, each on a freshly built input.
+    Peak memory comes from one extra run under tracemalloc, since tracing
+    slows the timed runs down, and only counts allocations made by run.
+
+    Args:
+        case (Case): The case to run.
+        tier (str): The size tier, a key of case.sizes.
+        repeat (int): Number of timed runs.
+        seed (int): Seed passed to the input generator.
+
+    Returns:
+        Dict[str, Any]: The result record written to JSON.
+
+    """
+    size = case.sizes[tier]
+    best = math.inf
+    for _ in range(repeat):
+        data = case.setup(size, seed)
+        start = time.perf_counter()
+        case.run(data)
+        best = min(best, time.perf_counter() - start)
+
+    data = case.setup(size, seed)
+    ops = case.ops(data)
+    tracemalloc.start()
+    try:
+        case.run(data)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "case": case.name,
+        "tier": tier,
+        "size": size,
+        "ops": ops,
+        "seconds": best,
+        "peak_bytes": peak,
+        "ops_per_sec": ops / best if best else math.inf,
+    }
+
+
+def run(
+    tiers: List[str],
+    cases: Optional[List[str]] = None,
+    repeat: int = 3,
+    seed: int = 0,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Run the selected cases on the selected tiers.
+
+    Args:
+        tiers (List[str]): Tiers to run, from TIERS.
+        cases (Optional[List[str]], optional): Case names, or prefixes such as
+            "kruskal", to run. Defaults to all cases.
+        repeat (int, optional): Timed runs per case and tier. Defaults to 3.
+        seed (int, optional): Seed for the input generators. Defaults to 0.
+        progress (Optional[Callable], optional): Called with every result as
+            it is produced.
+
+    Returns:
+        Dict[str, Any]: A report with "meta" and "results" keys.
+
+    Raises:
+        ValueError: If a tier or case name is unknown.
+
+    """
+    unknown = set(tiers) - set(TIERS)
+    if unknown:
+        raise ValueError(f"Unknown tiers: {sorted(unknown)}")
+    selected = [
+        case
+        for case in CASES
+        if cases is None
+        or any(case.name == name or case.name.startswith(name + "/") for name in cases)
+    ]
+    if not selected:
+        raise ValueError(f"No benchmark cases match {cases}")
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 100_000))
+    results = []
+    try:
+        for case in selected:
+            for tier in tiers:
+                result = measure(case, tier, repeat, seed)
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    finally:
+        sys.setrecursionlimit(limit)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], candidate: Dict[str, Any], threshold: float = 0.1
+) -> List[Dict[str, Any]]:
+    """Find results where the candidate run is slower or uses more memory than
+    the baseline run by more than threshold.
+
+    Results are matched by case and tier, results only present in one run
+    are ignored.
+
+    Args:
+        baseline (Dict[str, Any]): A report returned by run.
+        candidate (Dict[str, Any]): A report returned by run.
+        threshold (float, optional): Allowed relative increase, 0.1 allows
+            10%. Defaults to 0.1.
+
+    Returns:
+        List[Dict[str, Any]]: One record per regressed metric, with the case,
+            tier, metric, both values and their ratio.
+
+    """
+    before = {(r["case"], r["tier"]): r for r in baseline["results"]}
+    regressions = []
+    for result in candidate["results"]:
+        old = before.get((result["case"], result["tier"]))
+        if old is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if not old[metric]:
+                continue
+            ratio = result[metric] / old[metric]
+            if ratio > 1 + threshold:
+                regressions.append(
+                    {
+                        "case": result["case"],
+                        "tier": result["tier"],
+                        "metric": metric,
+                        "baseline": old[metric],
+                        "candidate": result[metric],
+                        "ratio": ratio,
+                    }
+                )
+    return regressions
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    print(
+        f"{result['case']:32s} {result['tier']:7s} {result['size']:>8,d}"
+        f" {result['seconds']:9.4f}s {result['peak_bytes'] / 2**20:9.2f} MiB"
+        f" {result['ops_per_sec']:14,.0f} ops/s"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point, returns the process exit status."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--tiers", nargs="+", default=["small"], choices=TIERS)
+    run_parser.add_argument("--cases", nargs="+", default=None)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--out", default=None, help="write the report to this JSON file")
+
+    compare_parser = commands.add_parser("compare", help="compare two JSON reports")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run(args.tiers, args.cases, args.repeat, args.seed, _print_result)
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump(report, f, indent=2)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+    regressions = compare(baseline, candidate, args.threshold)
+    for r in regressions:
+        print(
+            f"REGRESSION {r['case']} [{r['tier']}] {r['metric']}:"
+            f" {r['baseline']:.4g} -> {r['candidate']:.4g} ({r['ratio']:.2f}x)"
+        )
+    if not regressions:
+        print(f"No regressions above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,15 @@
-"""__init__ provides the core functionalities of the py_dsa package."""
+"""__init__ provides the core functionalities of the py_dsa package.
 
-from . import datastructures
-from . import algorithms
+Subpackages are imported lazily on first attribute access.
+"""
 
-__all__ = ["datastructures", "algorithms"]
+from typing import TYPE_CHECKING
+
+from ._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__, {}, submodules=["datastructures", "algorithms"]
+)
+
+if TYPE_CHECKING:
+    from . import datastructures, algorithms  # noqa: F401
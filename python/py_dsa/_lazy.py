@@ -0,0 +1,64 @@
+"""Helpers for PEP 562 lazy attribute loading in the py_dsa package tree."""
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def attach(
+    package: str, attrs: Dict[str, str], submodules: Iterable[str] = ()
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """Build the module level ``__getattr__``, ``__dir__`` and ``__all__`` for a
+    package whose public names live in submodules.
+
+    A submodule is only imported the first time one of its names is accessed.
+    Once a submodule is loaded, by us or by a direct ``import pkg.submodule``,
+    all of its names are bound in the package namespace so later lookups never
+    reach ``__getattr__`` again. Binding on load also keeps a function that
+    shares its submodule's name (e.g. ``lru_cache``) from being shadowed by the
+    submodule object the import system sets on the package.
+
+    Args:
+        package (str): The ``__name__`` of the package being made lazy.
+        attrs (Dict[str, str]): Maps each public name to the submodule (relative
+            to ``package``) that defines it.
+        submodules (Iterable[str], optional): Submodules that are themselves
+            public names of the package.
+
+    Returns:
+        Tuple: ``(__getattr__, __dir__, __all__)`` to assign in the package.
+
+    """
+    submodules = tuple(submodules)
+    __all__ = list(submodules) + list(attrs)
+    exports: Dict[str, List[str]] = {}
+    for attr, owner in attrs.items():
+        exports.setdefault(owner, []).append(attr)
+
+    def bind(namespace: Dict[str, Any], module: ModuleType, submodule: str) -> None:
+        for attr in exports.get(submodule, ()):
+            namespace[attr] = getattr(module, attr)
+
+    class LazyModule(ModuleType):
+        def __setattr__(self, name: str, value: Any) -> None:
+            super().__setattr__(name, value)
+            if isinstance(value, ModuleType) and value.__name__ == f"{package}.{name}":
+                bind(vars(self), value, name)
+
+    sys.modules[package].__class__ = LazyModule
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+        if name not in attrs:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(f"{package}.{attrs[name]}")
+        namespace = vars(sys.modules[package])
+        bind(namespace, module, attrs[name])
+        return namespace[name]
+
+    def __dir__() -> List[str]:
+        return sorted(set(__all__) | set(vars(sys.modules[package])))
+
+    return __getattr__, __dir__, __all__
@@ -0,0 +1,27 @@
+"""Helpers for importing optional dependencies on first use."""
+
+import importlib
+from types import ModuleType
+
+
+def require(module: str, feature: str, extra: str) -> ModuleType:
+    """Import an optional dependency, with an install hint if it is missing.
+
+    Args:
+        module (str): The name of the module to import.
+        feature (str): What needs the module, used in the error message.
+        extra (str): The py_dsa extra that installs the module.
+
+    Returns:
+        ModuleType: The imported module.
+
+    Raises:
+        ImportError: If the module is not installed.
+
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"{feature} requires {module}, install it with `pip install py_dsa[{extra}]`"
+        ) from e
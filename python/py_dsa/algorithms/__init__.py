@@ -1,12 +1,85 @@
-"""Import all functions and classes in algorithms as top level modules"""
-
-from .blind_dfs import *  # noqa: F401,F403
-from .closest_points import *  # noqa: F401,F403
-from .eularian_path import *  # noqa: F401,F403
-from .fast_mult import *  # noqa: F401,F403
-from .flow import *  # noqa: F401,F403
-from .kruskals import *  # noqa: F401,F403
-from .map_reduce import *  # noqa: F401,F403
-from .seq_alignment import *  # noqa: F401,F403
-from .top_sort import *  # noqa: F401,F403
-from .weighted_intervals import *  # noqa: F401,F403
+"""Expose all functions and classes in algorithms as top level names.
+
+Each submodule is only imported the first time one of its names is accessed
+(PEP 562), so using one algorithm doesn't pay for the imports of the rest.
+"""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "ArbitrageDetector": "arbitrage_bellman_ford",
+        "find_arbitrage": "arbitrage_bellman_ford",
+        "assignment": "assignment",
+        "matching_cost_matrix": "assignment",
+        "max_bipartite_matching": "bipartite_matching",
+        "Robot": "blind_dfs",
+        "blindDFS": "blind_dfs",
+        "d": "closest_points",
+        "specialdict": "closest_points",
+        "closest_pair": "closest_points",
+        "DagRun": "dag_executor",
+        "TaskStats": "dag_executor",
+        "run_dag": "dag_executor",
+        "EularianPath": "eularian_path",
+        "bin_list_to_int": "fast_mult",
+        "int_to_bin_list": "fast_mult",
+        "bin_list_addition": "fast_mult",
+        "reference_multiply": "fast_mult",
+        "karatsuba": "fast_mult",
+        "forward_fft": "fast_mult",
+        "inverse_fft": "fast_mult",
+        "fft": "fast_mult",
+        "FlowStats": "flow",
+        "MaxFlow": "flow",
+        "GomoryHuTree": "gomory_hu",
+        "ResidualNetwork": "residual_network",
+        "MST": "kruskals",
+        "MinCostFlow": "min_cost_flow",
+        "read_file": "map_reduce",
+        "name_node": "map_reduce",
+        "map_func": "map_reduce",
+        "reduce_func": "map_reduce",
+        "task_tracker": "map_reduce",
+        "combiner_func": "map_reduce",
+        "thread_splitter": "map_reduce",
+        "sequence_align_slow": "seq_alignment",
+        "space_efficient_alignment": "seq_alignment",
+        "sequence_align_fast": "seq_alignment",
+        "dijkstra": "shortest_paths",
+        "dijkstra_path": "shortest_paths",
+        "bidirectional_dijkstra": "shortest_paths",
+        "astar_path": "shortest_paths",
+        "topological_sort": "top_sort",
+        "topological_layers": "top_sort",
+        "validTree": "top_sort",
+        "is_bipartite": "top_sort",
+        "strongly_connected_components": "top_sort",
+        "condensation": "top_sort",
+        "DynamicTopologicalOrder": "top_sort",
+        "jobScheduling": "weighted_intervals",
+    },
+)
+
+if TYPE_CHECKING:
+    from .arbitrage_bellman_ford import *  # noqa: F401,F403
+    from .assignment import *  # noqa: F401,F403
+    from .bipartite_matching import *  # noqa: F401,F403
+    from .blind_dfs import *  # noqa: F401,F403
+    from .closest_points import *  # noqa: F401,F403
+    from .dag_executor import *  # noqa: F401,F403
+    from .eularian_path import *  # noqa: F401,F403
+    from .fast_mult import *  # noqa: F401,F403
+    from .flow import *  # noqa: F401,F403
+    from .gomory_hu import *  # noqa: F401,F403
+    from .kruskals import *  # noqa: F401,F403
+    from .map_reduce import *  # noqa: F401,F403
+    from .min_cost_flow import *  # noqa: F401,F403
+    from .residual_network import *  # noqa: F401,F403
+    from .seq_alignment import *  # noqa: F401,F403
+    from .shortest_paths import *  # noqa: F401,F403
+    from .top_sort import *  # noqa: F401,F403
+    from .weighted_intervals import *  # noqa: F401,F403
@@ -0,0 +1,249 @@
+import importlib.util
+import math
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from py_dsa._optional import require
+from py_dsa.datastructures import CSRGraph, EdgeNotFoundError, WeightedGraph
+
+
+def _pred_cycle(pred: Sequence[int], starts: Sequence[int]) -> Optional[List[int]]:
+    """Return a cycle of the predecessor graph reachable backwards from one
+    of starts, in edge order, or None if there is none.
+
+    Every node is walked at most once, so this is O(n).
+    """
+    walk = [-1] * len(pred)
+    for i, start in enumerate(starts):
+        u = start
+        while u >= 0 and walk[u] < 0:
+            walk[u] = i
+            u = pred[u]
+        if u >= 0 and walk[u] == i:
+            # u is on the cycle this walk ran into
+            cycle = [u]
+            v = pred[u]
+            while v != u:
+                cycle.append(v)
+                v = pred[v]
+            cycle.reverse()
+            return cycle
+    return None
+
+
+class ArbitrageDetector:
+    """Finds arbitrage loops in a graph of currency conversion rates.
+
+    An edge u -> v of weight r means one unit of u buys r units of v. A loop
+    whose rates multiply to more than 1 is an arbitrage, and with edge
+    weights -log(r) it is exactly a negative cycle, which Bellman-Ford
+    detects. Every node starts at distance 0, as if a virtual source linked
+    to all of them, so loops anywhere in the graph are found in one run.
+
+    With NumPy, every Bellman-Ford round relaxes all edges at once over the
+    edge arrays, grouping the candidate distances by destination with
+    np.minimum.at. Without it, or with method="spfa", a queue based
+    Bellman-Ford (SPFA) only rescans edges out of nodes whose distance
+    changed. Either way the run stops early once no distance changes, and a
+    negative cycle shows up as a cycle of the predecessor pointers.
+
+    The edge arrays are built once, so for live rates keep one detector and
+    call set_rate for every tick before find_cycle.
+    """
+
+    METHODS = ("auto", "numpy", "spfa")
+
+    def __init__(
+        self,
+        graph: Union[WeightedGraph, CSRGraph],
+        method: str = "auto",
+        tolerance: float = 1e-12,
+    ):
+        """Build the edge arrays of graph.
+
+        Args:
+            graph (Union[WeightedGraph, CSRGraph]): The conversion rates.
+            method (str, optional): "numpy", "spfa", or "auto" for numpy if
+                it is installed. Defaults to "auto".
+            tolerance (float, optional): A distance must drop by more than
+                this to count, in log space, so rounding errors around loops
+                that multiply to exactly 1 aren't reported. Defaults to
+                1e-12.
+
+        Raises:
+            ValueError: If method is unknown or a rate isn't positive.
+            TypeError: If the graph is unweighted.
+            ImportError: If method is "numpy" and NumPy is not installed.
+
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method {method!r}, expected one of {self.METHODS}")
+        if method == "auto":
+            method = "numpy" if importlib.util.find_spec("numpy") else "spfa"
+        self.method = method
+        self.tolerance = tolerance
+
+        csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+        if not csr.is_weighted():
+            raise TypeError("ArbitrageDetector needs a weighted graph")
+        self.csr = csr
+        self.n = csr.num_nodes()
+        offsets, targets = csr.offsets, csr.targets
+        src: List[int] = []
+        for u in range(self.n):
+            src.extend([u] * (offsets[u + 1] - offsets[u]))
+        self._src = src
+        self._dst = targets.tolist()
+        weights = []
+        for rate in csr.weights:
+            if not rate > 0:
+                raise ValueError(f"Conversion rates must be positive, got {rate}")
+            weights.append(-math.log(rate))
+        self._weight = weights
+        self._edge_idx: Dict[Tuple[int, int], int] = {
+            (u, v): e for e, (u, v) in enumerate(zip(src, self._dst))
+        }
+        # out-edges of every node as edge positions, for SPFA
+        self._out = [range(offsets[u], offsets[u + 1]) for u in range(self.n)]
+
+        if method == "numpy":
+            np = require("numpy", "ArbitrageDetector(method='numpy')", "numpy")
+            self._np = np
+            self._src_arr = np.array(src, dtype=np.intp)
+            self._dst_arr = np.array(self._dst, dtype=np.intp)
+            self._weight_arr = np.array(weights, dtype=float)
+
+    def set_rate(self, source: Any, dest: Any, rate: float) -> None:
+        """Update the rate of an existing conversion, in O(1).
+
+        Args:
+            source (Any): The currency sold.
+            dest (Any): The currency bought.
+            rate (float): Units of dest per unit of source.
+
+        Raises:
+            NodeNotFoundError: If either currency isn't in the graph.
+            EdgeNotFoundError: If the graph has no such conversion.
+            ValueError: If rate isn't positive.
+
+        """
+        key = (self.csr.get_idx(source), self.csr.get_idx(dest))
+        if key not in self._edge_idx:
+            raise EdgeNotFoundError(f"No edge from {source} to {dest}")
+        if not rate > 0:
+            raise ValueError(f"Conversion rates must be positive, got {rate}")
+        e = self._edge_idx[key]
+        self._weight[e] = -math.log(rate)
+        if self.method == "numpy":
+            self._weight_arr[e] = self._weight[e]
+
+    def find_cycle(self) -> Optional[List[Any]]:
+        """Find an arbitrage loop.
+
+        Returns:
+            Optional[List[Any]]: The currencies of a loop whose rates
+                multiply to more than 1, in trading order and with the first
+                repeated at the end, e.g. [USD, EUR, JPY, USD]. None if there
+                is no arbitrage.
+
+        """
+        if self.n == 0:
+            return None
+        cycle = self._numpy_cycle() if self.method == "numpy" else self._spfa_cycle()
+        if cycle is None:
+            return None
+        node_at = self.csr.node_at
+        return [node_at(u) for u in cycle] + [node_at(cycle[0])]
+
+    def cycle_rate(self, cycle: Sequence[Any]) -> float:
+        """Return the product of the rates along a loop from find_cycle.
+
+        Args:
+            cycle (Sequence[Any]): The currencies, first repeated at the end.
+
+        Returns:
+            float: Units of the first currency after trading one unit around
+                the loop.
+
+        """
+        get_idx, weight = self.csr.get_idx, self._weight
+        total = sum(
+            weight[self._edge_idx[get_idx(u), get_idx(v)]] for u, v in zip(cycle, cycle[1:])
+        )
+        return math.exp(-total)
+
+    def _numpy_cycle(self) -> Optional[List[int]]:
+        np = self._np
+        src, dst, weight = self._src_arr, self._dst_arr, self._weight_arr
+        tolerance = self.tolerance
+        dist = np.zeros(self.n)
+        pred = np.full(self.n, -1, dtype=np.intp)
+        # with the virtual source there are n + 1 nodes, so distances settle
+        # within n rounds unless there is a negative cycle
+        for _ in range(self.n + 1):
+            candidate = dist[src] + weight
+            improving = candidate < dist[dst] - tolerance
+            if not improving.any():
+                return None
+            new_dist = dist.copy()
+            np.minimum.at(new_dist, dst[improving], candidate[improving])
+            # the edges that achieved the new minimum become predecessors
+            best = improving & (candidate == new_dist[dst])
+            pred[dst[best]] = src[best]
+            dist = new_dist
+            cycle = _pred_cycle(pred.tolist(), dst[best].tolist())
+            if cycle is not None:
+                return cycle
+        return None
+
+    def _spfa_cycle(self) -> Optional[List[int]]:
+        n = self.n
+        src, dst, weight, out = self._src, self._dst, self._weight, self._out
+        tolerance = self.tolerance
+        dist = [0.0] * n
+        pred = [-1] * n
+        queue = deque(range(n))
+        queued = [True] * n
+        # a negative cycle keeps the queue from draining, but it soon shows
+        # up in the predecessors, look for it every n relaxations
+        relaxations = 0
+        while queue:
+            u = queue.popleft()
+            queued[u] = False
+            d = dist[u]
+            for e in out[u]:
+                v = dst[e]
+                nd = d + weight[e]
+                if nd < dist[v] - tolerance:
+                    dist[v] = nd
+                    pred[v] = src[e]
+                    relaxations += 1
+                    if relaxations == n:
+                        relaxations = 0
+                        cycle = _pred_cycle(pred, range(n))
+                        if cycle is not None:
+                            return cycle
+                    if not queued[v]:
+                        queued[v] = True
+                        queue.append(v)
+        return None
+
+
+def find_arbitrage(
+    graph: Union[WeightedGraph, CSRGraph], method: str = "auto"
+) -> Optional[List[Any]]:
+    """Find an arbitrage loop in a graph of conversion rates, see
+    ArbitrageDetector.
+
+    Args:
+        graph (Union[WeightedGraph, CSRGraph]): The conversion rates, an edge
+            u -> v of weight r means one unit of u buys r units of v.
+        method (str, optional): "numpy", "spfa" or "auto". Defaults to
+            "auto".
+
+    Returns:
+        Optional[List[Any]]: The currencies of a profitable loop, first
+            repeated at the end, or None if there is no arbitrage.
+
+    """
+    return ArbitrageDetector(graph, method).find_cycle()
@@ -0,0 +1,166 @@
+from typing import Any, List, Tuple
+
+from py_dsa._optional import require
+from py_dsa.algorithms.bipartite_matching import _bipartition
+from py_dsa.datastructures import MatchingGraph
+
+
+def assignment(cost_matrix: Any, maximize: bool = False) -> Tuple[Any, Any]:
+    """Solve the linear assignment problem on a dense cost matrix.
+
+    Every row is assigned a distinct column, or every column a distinct row
+    if there are fewer columns than rows, minimizing the total cost. This is
+    the shortest augmenting path form of the Hungarian algorithm used by
+    Jonker-Volgenant: rows are reduced by their minimum (and columns too for
+    square matrices), rows landing on a free zero are assigned greedily, and
+    every remaining row is assigned by a Dijkstra search over the columns
+    whose relaxation step is one NumPy operation on a whole row of reduced
+    costs. That is O(n^2 m) in the worst case, but only O(m) interpreted
+    steps per scanned column.
+
+    Args:
+        cost_matrix (Any): An n x m array-like of costs, np.inf marks a pair
+            that can't be assigned.
+        maximize (bool, optional): Maximize the total instead. Defaults to
+            False.
+
+    Returns:
+        Tuple[Any, Any]: The row indices and the column indices of the
+            assigned pairs as integer NumPy arrays, sorted by row, so the
+            total cost is cost_matrix[rows, cols].sum().
+
+    Raises:
+        ValueError: If the matrix isn't 2-D, contains NaN or -inf (inf when
+            maximizing), or has no assignment of finite cost.
+        ImportError: If NumPy is not installed.
+
+    """
+    np = require("numpy", "assignment", "numpy")
+    # the one copy of the matrix, reduced in place below
+    cost = np.array(cost_matrix, dtype=float)
+    if cost.ndim != 2:
+        raise ValueError("cost_matrix must be 2-D")
+    if maximize:
+        np.negative(cost, out=cost)
+    if np.isnan(cost).any() or np.isneginf(cost).any():
+        raise ValueError("cost_matrix contains invalid numeric entries")
+
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    n, m = cost.shape
+    if n == 0:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+
+    # subtracting a constant from a row doesn't change which assignment is
+    # cheapest, and the same holds for columns once every column is assigned
+    row_min = cost.min(axis=1)
+    if np.isinf(row_min).any():
+        raise ValueError("cost matrix is infeasible")
+    cost -= row_min[:, None]
+    if n == m:
+        col_min = cost.min(axis=0)
+        if np.isinf(col_min).any():
+            raise ValueError("cost matrix is infeasible")
+        cost -= col_min[None, :]
+
+    # dual variables, reduced costs cost[i, j] - u[i] - v[j] stay >= 0
+    u = np.zeros(n)
+    v = np.zeros(m)
+    col4row = np.full(n, -1, dtype=np.intp)
+    row4col = np.full(m, -1, dtype=np.intp)
+
+    # greedy start, every row takes its first free zero
+    for i in range(n):
+        for j in np.flatnonzero(cost[i] == 0):
+            if row4col[j] < 0:
+                row4col[j] = i
+                col4row[i] = j
+                break
+
+    inf = np.inf
+    for cur_row in np.flatnonzero(col4row < 0):
+        shortest = np.full(m, inf)
+        path = np.full(m, -1, dtype=np.intp)
+        scanned_cols = np.zeros(m, dtype=bool)
+        scanned_rows = np.zeros(n, dtype=bool)
+        min_val = 0.0
+        i = cur_row
+        sink = -1
+        while sink < 0:
+            scanned_rows[i] = True
+            reduced = min_val + cost[i] - u[i] - v
+            better = ~scanned_cols & (reduced < shortest)
+            path[better] = i
+            shortest[better] = reduced[better]
+
+            remaining = np.where(scanned_cols, inf, shortest)
+            j = int(remaining.argmin())
+            min_val = remaining[j]
+            if min_val == inf:
+                raise ValueError("cost matrix is infeasible")
+            if row4col[j] >= 0:
+                # on ties prefer a free column, which ends the search
+                free = np.flatnonzero((remaining == min_val) & (row4col < 0))
+                if len(free):
+                    j = int(free[0])
+            scanned_cols[j] = True
+            if row4col[j] < 0:
+                sink = j
+            else:
+                i = row4col[j]
+
+        # update the duals so the new path has reduced cost 0
+        u[cur_row] += min_val
+        rows = np.flatnonzero(scanned_rows)
+        rows = rows[rows != cur_row]
+        u[rows] += min_val - shortest[col4row[rows]]
+        v[scanned_cols] -= min_val - shortest[scanned_cols]
+
+        # augment along the path
+        j = sink
+        while True:
+            i = path[j]
+            row4col[j] = i
+            col4row[i], j = j, col4row[i]
+            if i == cur_row:
+                break
+
+    if transposed:
+        order = np.argsort(col4row)
+        return col4row[order], order.astype(np.intp)
+    return np.arange(n, dtype=np.intp), col4row
+
+
+def matching_cost_matrix(mg: MatchingGraph) -> Tuple[Any, List[Any], List[Any]]:
+    """Build the cost matrix of a weighted bipartite MatchingGraph, for
+    assignment.
+
+    The graph must have the unit capacity source -> left -> right -> sink
+    structure of max_bipartite_matching, with the costs of the left to right
+    edges set with MatchingGraph.add_edge(u, v, w, cost).
+
+    Args:
+        mg (MatchingGraph): The assignment graph.
+
+    Returns:
+        Tuple[Any, List[Any], List[Any]]: The len(left) x len(right) cost
+            matrix, np.inf where there is no edge, and the left and right
+            nodes of its rows and columns.
+
+    Raises:
+        ValueError: If mg isn't a unit capacity bipartite graph.
+        ImportError: If NumPy is not installed.
+
+    """
+    np = require("numpy", "matching_cost_matrix", "numpy")
+    left, right = _bipartition(mg)
+    right_idx = {v: j for j, v in enumerate(right)}
+    cost = np.full((len(left), len(right)), np.inf)
+    for i, u in enumerate(left):
+        costs = mg.get_edge_costs(u)
+        for v, w in mg.get_edges(u).items():
+            if w > 0:
+                cost[i, right_idx[v]] = costs.get(v, 0)
+    return cost, left, right
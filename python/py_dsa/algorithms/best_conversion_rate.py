@@ -1,8 +1,11 @@
-from py_dsa.datastructures import WeightedGraph
+from py_dsa.datastructures import WeightedGraph, CSRGraph
 from functools import cache
+from typing import Union
 
 
-def best_conversion_rate(graph: WeightedGraph, source: str, destination: str) -> float:
+def best_conversion_rate(
+    graph: Union[WeightedGraph, CSRGraph], source: str, destination: str
+) -> float:
     """Given a graph (type WeightedGraph) of potential currency conversions,
     and a source and destination currency, find the best achievable conversion
     rate from source to destination. Assume graph is a complete graph, structured
@@ -10,19 +13,33 @@ def best_conversion_rate(graph: WeightedGraph, source: str, destination: str) ->
     node twice/have a cycle.
     This is an NP-hard problem. Brute force TC is factorial, below solution is
     O(n^2*2^n). Analogous to the travelling salesman problem.
+    The search runs over the int ids of a CSR snapshot, which is taken from
+    graph if it isn't one already. The rate is 0 if destination isn't in the
+    graph, and NodeNotFoundError is raised if source isn't.
     """
+    if not isinstance(graph, CSRGraph):
+        graph = graph.to_csr()
+    if not graph.is_weighted():
+        raise TypeError("best_conversion_rate needs a weighted graph")
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    if source == destination:
+        return 1
+    source_idx = graph.get_idx(source)
+    # nothing converts into a currency the graph doesn't have
+    if not graph.has_node(destination):
+        return 0
+    dest_idx = graph.get_idx(destination)
 
     @cache
-    def dfs(node: str, visited: int) -> float:
-        if node == destination:
+    def dfs(node_idx: int, visited: int) -> float:
+        if node_idx == dest_idx:
             return 1
-        node_idx = graph.get_idx(node)
         visited |= 1 << node_idx
         result = 0
-        for neighbor, weight in graph.get_edges(node).items():
-            neighbor_idx = graph.get_idx(neighbor)
+        for e in range(offsets[node_idx], offsets[node_idx + 1]):
+            neighbor_idx = targets[e]
             if not (visited & (1 << neighbor_idx)):
-                result = max(result, weight * dfs(neighbor, visited))
+                result = max(result, weights[e] * dfs(neighbor_idx, visited))
         return result
 
-    return dfs(source, 0)
+    return dfs(source_idx, 0)
@@ -0,0 +1,144 @@
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+from py_dsa.datastructures import MatchingGraph
+
+
+def _bipartition(mg: MatchingGraph) -> Tuple[List[Any], List[Any]]:
+    """Split the nodes of a unit capacity source -> left -> right -> sink
+    graph into its left and right sides.
+
+    Raises:
+        ValueError: If mg doesn't have that structure.
+
+    """
+    source, sink = mg.get_source(), mg.get_sink()
+    left = [u for u, w in mg.get_edges(source).items() if w > 0]
+    left_set = set(left)
+    right_set = set()
+    for u in mg.get_nodes():
+        for v, w in mg.get_edges(u).items():
+            if w <= 0:
+                continue
+            if w != 1:
+                raise ValueError(f"Edge {u} -> {v} has capacity {w}, expected 1")
+            if v == sink:
+                right_set.add(u)
+            elif not (u == source or u in left_set):
+                raise ValueError(f"Edge {u} -> {v} doesn't leave the source or a left node")
+    if sink in left_set or left_set & right_set:
+        raise ValueError("A node is linked to both the source and the sink")
+    right = [v for v in mg.get_nodes() if v in right_set]
+    for u in left:
+        for v, w in mg.get_edges(u).items():
+            if w > 0 and v not in right_set:
+                raise ValueError(f"Edge {u} -> {v} doesn't end at a right node")
+    return left, right
+
+
+def max_bipartite_matching(mg: MatchingGraph) -> List[Tuple[Any, Any]]:
+    """Find a maximum matching of a unit capacity bipartite MatchingGraph with
+    the Hopcroft-Karp algorithm.
+
+    The graph must have the assignment structure source -> left -> right ->
+    sink with every capacity equal to 1. Pairs assigned with
+    preliminary_assignment, or by an earlier max flow run, are used as the
+    starting matching. Every phase finds a maximal set of vertex disjoint
+    shortest augmenting paths with a BFS and a DFS over the left nodes, and
+    there are O(sqrt(V)) phases, so the total time is O(E sqrt(V)). The
+    matching is written back to the residual graph, so a MaxFlow on mg
+    afterwards sees it.
+
+    Args:
+        mg (MatchingGraph): The assignment graph.
+
+    Returns:
+        List[Tuple[Any, Any]]: The matched (left, right) pairs.
+
+    Raises:
+        ValueError: If mg isn't a unit capacity bipartite graph, or its
+            residual graph doesn't hold a matching.
+
+    """
+    source, sink = mg.get_source(), mg.get_sink()
+    left, right = _bipartition(mg)
+    right_idx: Dict[Any, int] = {v: i for i, v in enumerate(right)}
+    adj = [
+        [right_idx[v] for v, w in mg.get_edges(u).items() if w > 0] for u in left
+    ]
+
+    # warm start from the flow already in the residual graph
+    match_l = [-1] * len(left)
+    match_r = [-1] * len(right)
+    for i, u in enumerate(left):
+        for v, f in mg.get_residual_edges(u).items():
+            if f <= 0 or v not in right_idx:
+                continue
+            j = right_idx[v]
+            if match_l[i] != -1 or match_r[j] != -1:
+                raise ValueError(f"Residual graph assigns {u} or {v} more than once")
+            match_l[i], match_r[j] = j, i
+
+    inf = len(left) + 1
+    while True:
+        # BFS from the free left nodes, layering the left nodes by the length
+        # of the shortest alternating path reaching them
+        dist = [inf] * len(left)
+        queue = deque()
+        for i in range(len(left)):
+            if match_l[i] == -1:
+                dist[i] = 0
+                queue.append(i)
+        free_dist = inf
+        while queue:
+            i = queue.popleft()
+            if dist[i] >= free_dist:
+                continue
+            for j in adj[i]:
+                k = match_r[j]
+                if k == -1:
+                    free_dist = min(free_dist, dist[i] + 1)
+                elif dist[k] == inf:
+                    dist[k] = dist[i] + 1
+                    queue.append(k)
+        if free_dist == inf:
+            break
+
+        # DFS along the layers for vertex disjoint augmenting paths, stack
+        # holds the left nodes of the path and via the right nodes between
+        current = [0] * len(left)
+        for root in range(len(left)):
+            if match_l[root] != -1:
+                continue
+            stack, via = [root], []
+            while stack:
+                i = stack[-1]
+                edges = adj[i]
+                if current[i] == len(edges):
+                    # dead end, no augmenting path through i in this phase
+                    dist[i] = inf
+                    stack.pop()
+                    if via:
+                        via.pop()
+                    continue
+                j = edges[current[i]]
+                current[i] += 1
+                k = match_r[j]
+                if k == -1:
+                    if dist[i] + 1 == free_dist:
+                        via.append(j)
+                        for i, j in zip(stack, via):
+                            match_l[i], match_r[j] = j, i
+                        break
+                elif dist[k] == dist[i] + 1:
+                    stack.append(k)
+                    via.append(j)
+
+    pairs = [(left[i], right[j]) for i, j in enumerate(match_l) if j != -1]
+
+    mg.reset_residual_graph()
+    for u, v in pairs:
+        mg.update_residual_edge_weight(source, u, 1)
+        mg.update_residual_edge_weight(u, v, 1)
+        mg.update_residual_edge_weight(v, sink, 1)
+    return pairs
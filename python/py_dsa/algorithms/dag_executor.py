@@ -0,0 +1,229 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from py_dsa.algorithms.top_sort import topological_sort
+from py_dsa.datastructures import CycleError, Graph
+
+
+class TaskStats:
+    """Timing of one task of a run_dag run.
+
+    Attributes:
+        status (str): "done", "failed", "cancelled" if fail_fast stopped it
+            before it ran, or "skipped" if a task it depends on didn't
+            finish.
+        submitted (Optional[float]): Seconds from the start of the run until
+            the task was handed to the executor, None if it never was.
+        finished (Optional[float]): Seconds from the start of the run until
+            its result was collected.
+        seconds (float): Time the task itself ran, measured where it ran.
+
+    """
+
+    def __init__(self):
+        self.status = "skipped"
+        self.submitted: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the timing as a dict, e.g. to dump to JSON.
+
+        Returns:
+            Dict[str, Any]: Every attribute by name.
+
+        """
+        return {
+            "status": self.status,
+            "submitted": self.submitted,
+            "finished": self.finished,
+            "seconds": self.seconds,
+        }
+
+    def __repr__(self) -> str:
+        return f"TaskStats(status={self.status!r}, seconds={self.seconds:.6f})"
+
+
+class DagRun:
+    """Outcome of a run_dag run.
+
+    Attributes:
+        results (Dict[Any, Any]): Return value of every task that finished.
+        errors (Dict[Any, BaseException]): Exception of every task that
+            failed.
+        stats (Dict[Any, TaskStats]): Timing of every node of the graph.
+        elapsed (float): Wall time of the whole run.
+
+    """
+
+    def __init__(self):
+        self.results: Dict[Any, Any] = {}
+        self.errors: Dict[Any, BaseException] = {}
+        self.stats: Dict[Any, TaskStats] = {}
+        self.elapsed = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every task finished without an error."""
+        return all(stats.status == "done" for stats in self.stats.values())
+
+    def __repr__(self) -> str:
+        return (
+            f"DagRun(done={len(self.results)}, failed={len(self.errors)}, "
+            f"tasks={len(self.stats)}, elapsed={self.elapsed:.6f})"
+        )
+
+
+def _timed_call(task: Callable[[], Any]) -> Tuple[Any, float]:
+    """Run a task and time it, in the worker so queueing isn't counted."""
+    start = time.perf_counter()
+    result = task()
+    return result, time.perf_counter() - start
+
+
+def run_dag(
+    G: Graph,
+    tasks: Dict[Any, Callable[[], Any]],
+    executor: Union[str, Executor] = "thread",
+    max_workers: Optional[int] = None,
+    fail_fast: bool = True,
+) -> DagRun:
+    """Run a callable per node of a DAG, each once every node with an edge
+    into it has finished.
+
+    A node is dispatched as soon as its last dependency finishes, tracked by
+    in-degree counts as in Kahn's algorithm, rather than waiting for the rest
+    of its topological layer. At most max_workers tasks are in the executor
+    at once. Nodes without a task finish immediately, so they can group
+    other nodes.
+
+    Args:
+        G (Graph): The dependency graph, an edge u -> v means v runs after u.
+        tasks (Dict[Any, Callable[[], Any]]): The callable to run for each
+            node, taking no arguments. With a process pool they must be
+            picklable, e.g. module level functions or functools.partial.
+        executor (Union[str, Executor], optional): "thread" or "process" to
+            run on a new pool of max_workers that is shut down afterwards, or
+            an existing Executor, which is left running. Defaults to
+            "thread".
+        max_workers (Optional[int], optional): The most tasks running at
+            once. Defaults to the number of CPUs.
+        fail_fast (bool, optional): After the first failure, dispatch
+            nothing more and cancel tasks that haven't started. Otherwise
+            keep running every task that doesn't depend on a failed one.
+            Defaults to True.
+
+    Returns:
+        DagRun: The results, errors and per-task timings. Task exceptions are
+            collected in DagRun.errors, not raised.
+
+    Raises:
+        CycleError: If the graph has a cycle, before anything runs.
+        NodeNotFoundError: If a task is given for a node not in the graph.
+        ValueError: If executor is an unknown name or max_workers < 1.
+
+    """
+    for node in tasks:
+        G.get_idx(node)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    node_indices = G.node_indices()
+    neighbors_idx = G.neighbors_idx
+    node_at = G.node_at
+    indegree = [0] * G.index_bound()
+    for u_idx in node_indices:
+        for v_idx in neighbors_idx(u_idx):
+            indegree[v_idx] += 1
+    ready = deque(i for i in node_indices if not indegree[i])
+    # nodes on a cycle would never become ready, find it up front
+    if G.num_nodes() and not topological_sort(G):
+        raise CycleError("Graph has a cycle")
+
+    if isinstance(executor, Executor):
+        pool, owned = executor, False
+    elif executor == "thread":
+        pool, owned = ThreadPoolExecutor(max_workers=max_workers), True
+    elif executor == "process":
+        pool, owned = ProcessPoolExecutor(max_workers=max_workers), True
+    else:
+        raise ValueError(f"Unknown executor {executor!r}, use 'thread' or 'process'")
+
+    run = DagRun()
+    stats = run.stats
+    for idx in node_indices:
+        stats[node_at(idx)] = TaskStats()
+    running: Dict[Future, int] = {}
+    stopping = False
+    start = time.perf_counter()
+
+    def finish(u_idx: int) -> None:
+        for v_idx in neighbors_idx(u_idx):
+            indegree[v_idx] -= 1
+            if not indegree[v_idx]:
+                ready.append(v_idx)
+
+    try:
+        while True:
+            while ready and not stopping and len(running) < max_workers:
+                u_idx = ready.popleft()
+                node = node_at(u_idx)
+                task = tasks.get(node)
+                task_stats = stats[node]
+                task_stats.submitted = time.perf_counter() - start
+                if task is None:
+                    task_stats.status = "done"
+                    task_stats.finished = task_stats.submitted
+                    run.results[node] = None
+                    finish(u_idx)
+                    continue
+                running[pool.submit(_timed_call, task)] = u_idx
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                u_idx = running.pop(future)
+                node = node_at(u_idx)
+                task_stats = stats[node]
+                task_stats.finished = time.perf_counter() - start
+                if future.cancelled():
+                    task_stats.status = "cancelled"
+                    continue
+                try:
+                    result, task_stats.seconds = future.result()
+                except Exception as exc:
+                    task_stats.status = "failed"
+                    run.errors[node] = exc
+                    if fail_fast and not stopping:
+                        stopping = True
+                        for pending in running:
+                            pending.cancel()
+                    continue
+                task_stats.status = "done"
+                run.results[node] = result
+                finish(u_idx)
+    finally:
+        # only left running if we are unwinding from an exception of our own
+        for future in running:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=True)
+
+    if stopping:
+        for idx in ready:
+            stats[node_at(idx)].status = "cancelled"
+    run.elapsed = time.perf_counter() - start
+    return run
@@ -1,15 +1,197 @@
+import time
 from collections import deque
 from py_dsa.datastructures import MatchingGraph
-from typing import List, Any, Optional, Tuple
+from py_dsa.algorithms.residual_network import ResidualNetwork
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
+
+
+class FlowStats:
+    """Counters and timings of a MaxFlow run, collected when a FlowStats is
+    passed to MaxFlow.
+
+    Attributes:
+        augmentations (int): Augmenting paths sent by Edmonds-Karp and
+            Dinic, or pushes made by push-relabel.
+        phases (int): BFS level graphs built by Dinic, or global relabels
+            run by push-relabel.
+        vertices_visited (int): Nodes taken off a BFS queue, or discharged
+            by push-relabel.
+        arcs_scanned (int): Arcs looked at by the searches. Dinic counts
+            the current-arc pointer advances of its blocking flows and
+            push-relabel the arcs of pushes and relabels.
+        seconds (Dict[str, float]): Wall time spent in every phase of the
+            method, e.g. "search", "bottleneck" and "augment" for
+            Edmonds-Karp.
+        elapsed (float): Wall time of the whole run.
+
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Set every counter and timing back to zero."""
+        self.augmentations = 0
+        self.phases = 0
+        self.vertices_visited = 0
+        self.arcs_scanned = 0
+        self.seconds: Dict[str, float] = {}
+        self.elapsed = 0.0
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """Add seconds to the time spent in phase.
+
+        Args:
+            phase (str): The phase name.
+            seconds (float): The time to add.
+
+        """
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a dict, e.g. to dump to JSON.
+
+        Returns:
+            Dict[str, Any]: Every attribute by name.
+
+        """
+        return {
+            "augmentations": self.augmentations,
+            "phases": self.phases,
+            "vertices_visited": self.vertices_visited,
+            "arcs_scanned": self.arcs_scanned,
+            "seconds": dict(self.seconds),
+            "elapsed": self.elapsed,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"FlowStats(augmentations={self.augmentations}, phases={self.phases}, "
+            f"vertices_visited={self.vertices_visited}, arcs_scanned={self.arcs_scanned}, "
+            f"elapsed={self.elapsed:.6f})"
+        )
 
 
 class MaxFlow:
-    def __init__(self, MG: MatchingGraph):
+    METHODS = ("edmonds_karp", "dinic", "push_relabel")
+
+    def __init__(
+        self,
+        MG: MatchingGraph,
+        method: str = "edmonds_karp",
+        stats: Optional[FlowStats] = None,
+        progress: Optional[Callable[[FlowStats], None]] = None,
+        progress_every: int = 1000,
+    ):
+        """Initialize the solver.
+
+        Args:
+            MG (MatchingGraph): The graph to compute a maximum flow on. The
+                flow is stored in its residual graph.
+            method (str, optional): "edmonds_karp" augments along BFS paths of
+                the MatchingGraph itself, "dinic" runs Dinic's algorithm on an
+                array-backed ResidualNetwork, which is much faster on large
+                graphs, and "push_relabel" runs FIFO push-relabel on the same
+                network, which suits dense graphs with many short augmenting
+                paths. Defaults to "edmonds_karp".
+            stats (Optional[FlowStats], optional): Filled with the counters
+                and timings of every max_flow_val run, which resets it first.
+                Without it the solvers only pay for a None check per
+                augmentation, phase or BFS node. Defaults to None.
+            progress (Optional[Callable[[FlowStats], None]], optional): Called
+                with the stats every progress_every augmentations. A
+                FlowStats is created if stats isn't given. Defaults to None.
+            progress_every (int, optional): Augmentations between progress
+                calls. Defaults to 1000.
+
+        Raises:
+            ValueError: If method is unknown or progress_every isn't positive.
+
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown max flow method {method!r}, expected one of {self.METHODS}")
+        if progress_every <= 0:
+            raise ValueError("progress_every must be positive")
         self.MG = MG
+        self.method = method
+        if stats is None and progress is not None:
+            stats = FlowStats()
+        self.stats = stats
+        self.progress = progress
+        self.progress_every = progress_every
+        # kept between runs so a re-solve only applies what changed in MG
+        self._net: Optional[ResidualNetwork] = None
+        self._residual_version = None
+        self._change_version: Optional[int] = None
+
+    def network(self) -> ResidualNetwork:
+        """Return the residual network of the MatchingGraph, carrying the flow
+        of the last run.
+
+        The network is kept between calls. If only capacities or costs
+        changed since the last run, just the changed edges are updated, and
+        capacity decreases below the current flow are repaired locally (see
+        ResidualNetwork.set_capacity) instead of starting over. The network
+        is rebuilt if the residual graph was changed by anything else, e.g.
+        reset_residual_graph or preliminary_assignment.
+
+        Returns:
+            ResidualNetwork: The up to date residual network.
+
+        """
+        MG = self.MG
+        changed = MG.changes_since(self._change_version)
+        self._change_version = MG.get_change_version()
+        if (
+            self._net is None
+            or changed is None
+            or MG.get_residual_version() != self._residual_version
+        ):
+            self._net = ResidualNetwork(MG)
+        else:
+            for u, v in changed:
+                self._net.set_capacity(
+                    u,
+                    v,
+                    MG.get_edge_weight(u, v),
+                    MG.get_residual_edge_weight(u, v),
+                    MG.get_edge_cost(u, v),
+                )
+        return self._net
+
+    def _write_back(self, net: ResidualNetwork) -> None:
+        """Store the flow of net in the MatchingGraph and remember the
+        resulting residual graph version."""
+        net.write_back(self.MG)
+        self._residual_version = self.MG.get_residual_version()
+
+    def _augmented(self, count: int = 1) -> None:
+        """Count augmentations in the stats and call progress every
+        progress_every of them."""
+        stats = self.stats
+        before = stats.augmentations
+        stats.augmentations += count
+        if self.progress is not None and (
+            before // self.progress_every != stats.augmentations // self.progress_every
+        ):
+            self.progress(stats)
 
-    def find_path(self) -> Optional[List[Any]]:
+    def _timed(self, phase: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Call func, adding its wall time to phase in the stats if any."""
+        if self.stats is None:
+            return func(*args)
+        start = time.perf_counter()
+        result = func(*args)
+        self.stats.add_time(phase, time.perf_counter() - start)
+        return result
+
+    def find_path(self, stats: Optional[FlowStats] = None) -> Optional[List[Any]]:
         """Find a simple path from source to sink using BFS.
 
+        Args:
+            stats (Optional[FlowStats], optional): Counts the visited nodes and
+                scanned edges if given. Defaults to None.
+
         Returns:
             List[int]: A list of vertices representing the path from source to sink, or None if no path exists.
 
@@ -26,8 +208,12 @@ class MaxFlow:
 
         while queue:
             u = queue.popleft()
+            edges = self.MG.get_edges(u)
+            if stats is not None:
+                stats.vertices_visited += 1
+                stats.arcs_scanned += len(edges)
             # push forward on edges with excess capacity
-            for v in self.MG.get_edges(u):
+            for v in edges:
                 if v == u or not self.MG.edge_exists(u, v):
                     continue
                 residual = self.MG.get_edge_weight(
@@ -45,13 +231,11 @@ class MaxFlow:
             # in real graph) to opposite direction
             # In other words, allows us to redirect flow that might
             # have been sent on a suboptimal path
-            for v in self.MG.get_residual_nodes():
-                if (
-                    not v == u
-                    and v not in visited
-                    and self.MG.residual_edge_exists(v, u)
-                    and self.MG.get_residual_edge_weight(v, u) > 0
-                ):
+            in_edges = self.MG.get_residual_in_edges(u)
+            if stats is not None:
+                stats.arcs_scanned += len(in_edges)
+            for v, f in in_edges.items():
+                if not v == u and v not in visited and f > 0:
                     # print(u, v)
                     queue.append(v)
                     # visited[v] = True
@@ -95,7 +279,7 @@ class MaxFlow:
         # path is a simple path from s to t
         b = float("inf")
         for u, v in path:
-            if self.MG.edge_exists(u, v):  # Forward edge
+            if self._is_forward(u, v):  # Forward edge
                 b = min(
                     b,
                     self.MG.get_edge_weight(u, v)
@@ -107,6 +291,14 @@ class MaxFlow:
         #     print(b)
         return b
 
+    def _is_forward(self, u: Any, v: Any) -> bool:
+        # with antiparallel edges u -> v and v -> u, a path step from u to v
+        # may only be possible by cancelling flow on v -> u
+        return (
+            self.MG.edge_exists(u, v)
+            and self.MG.get_edge_weight(u, v) - self.MG.get_residual_edge_weight(u, v) > 0
+        )
+
     # update residual graph with bottleneck
     def augment(self, path: List[Tuple[Any, Any]], b: float) -> None:
         """Augment the flow along the given path by the bottleneck value.
@@ -119,13 +311,227 @@ class MaxFlow:
         # print(path)
         # augment flow along path by b
         for u, v in path:
-            F_uv = self.MG.get_residual_edge_weight(u, v)
-            if self.MG.edge_exists(u, v):  # Forward edge
+            if self._is_forward(u, v):  # Forward edge
+                F_uv = self.MG.get_residual_edge_weight(u, v)
                 self.MG.update_residual_edge_weight(u, v, F_uv + b)
-            else:  # Backward edge
-                # print(u, v)
-                # print(F[v][u])
-                self.MG.update_residual_edge_weight(u, v, F_uv - b)
+            else:  # Backward edge, cancel flow on v -> u
+                F_vu = self.MG.get_residual_edge_weight(v, u)
+                self.MG.update_residual_edge_weight(v, u, F_vu - b)
+
+    def dinic(self) -> int:
+        """Compute a maximum flow with Dinic's algorithm and store it in the
+        residual graph of the MatchingGraph.
+
+        Every phase labels nodes with their BFS distance from the source in
+        the residual network, then sends a blocking flow along arcs that go up
+        exactly one level, using a current-arc pointer per node so every arc
+        is discarded at most once per phase. There are at most V phases, and
+        O(E sqrt(V)) work in total on unit capacity graphs such as bipartite
+        matchings. The search is iterative, so deep graphs don't hit the
+        recursion limit.
+
+        Returns:
+            int: The maximum flow value.
+
+        """
+        net = self._timed("repair", self.network)
+        adj, head, cap = net.adj, net.head, net.cap
+        s, t, n = net.source, net.sink, net.num_nodes()
+        stats = self.stats
+
+        while True:
+            if stats is not None:
+                phase_start = time.perf_counter()
+            # build the level graph
+            level = [-1] * n
+            level[s] = 0
+            queue = deque([s])
+            while queue and level[t] < 0:
+                u = queue.popleft()
+                for a in adj[u]:
+                    v = head[a]
+                    if cap[a] and level[v] < 0:
+                        level[v] = level[u] + 1
+                        queue.append(v)
+            if stats is not None:
+                # every labelled node but those left in the queue was scanned
+                labelled = [u for u in range(n) if level[u] >= 0]
+                stats.phases += 1
+                stats.vertices_visited += len(labelled) - len(queue)
+                stats.arcs_scanned += sum(len(adj[u]) for u in labelled)
+                stats.arcs_scanned -= sum(len(adj[u]) for u in queue)
+                now = time.perf_counter()
+                stats.add_time("bfs", now - phase_start)
+                phase_start = now
+            if level[t] < 0:
+                break
+
+            # blocking flow, path holds the arcs from s to u
+            current = [0] * n
+            path: List[int] = []
+            u = s
+            while True:
+                if u == t:
+                    b = min(cap[a] for a in path)
+                    for a in path:
+                        cap[a] -= b
+                        cap[a ^ 1] += b
+                    # retreat to the tail of the first saturated arc
+                    k = next(i for i, a in enumerate(path) if not cap[a])
+                    del path[k:]
+                    u = head[path[-1]] if path else s
+                    if stats is not None:
+                        self._augmented()
+                    continue
+                arcs = adj[u]
+                next_level = level[u] + 1
+                for i in range(current[u], len(arcs)):
+                    a = arcs[i]
+                    if cap[a] and level[head[a]] == next_level:
+                        current[u] = i
+                        path.append(a)
+                        u = head[a]
+                        break
+                else:
+                    if u == s:
+                        break
+                    # dead end, no path to t through u in this phase
+                    current[u] = len(arcs)
+                    level[u] = -1
+                    u = head[path.pop() ^ 1]
+                    current[u] += 1
+            if stats is not None:
+                stats.arcs_scanned += sum(current)
+                stats.add_time("blocking_flow", time.perf_counter() - phase_start)
+
+        self._timed("write_back", self._write_back, net)
+        return net.flow_value()
+
+    def push_relabel(self) -> int:
+        """Compute a maximum flow with the FIFO push-relabel algorithm and
+        store it in the residual graph of the MatchingGraph.
+
+        Nodes with excess flow are discharged in FIFO order, pushing along
+        admissible arcs (label one lower) and relabelling when none is left.
+        Two heuristics keep the labels close to exact distances: a global
+        relabel sets every label to its residual BFS distance to the sink (or
+        n plus the distance to the source, for nodes that can only return
+        excess) after every n relabels, and when no node is left with some
+        label k < n, every node labelled between k and n is cut off from the
+        sink and is lifted to n + 1 at once (gap relabelling).
+
+        Returns:
+            int: The maximum flow value, net of flow returned to the source.
+
+        """
+        net = self._timed("repair", self.network)
+        adj, head, cap = net.adj, net.head, net.cap
+        s, t, n = net.source, net.sink, net.num_nodes()
+        stats = self.stats
+
+        label = [0] * n
+        excess = [0] * n
+        current = [0] * n
+        # number of nodes with every label below n, for gap detection
+        count = [0] * (n + 1)
+        active = deque()
+
+        def global_relabel() -> None:
+            for u in range(n):
+                label[u] = 2 * n
+            for root, base in ((t, 0), (s, n)):
+                label[root] = base
+                queue = deque([root])
+                while queue:
+                    v = queue.popleft()
+                    for a in adj[v]:
+                        # head[a] -> v is arc a ^ 1
+                        u = head[a]
+                        if cap[a ^ 1] and label[u] == 2 * n and u != s:
+                            label[u] = label[v] + 1
+                            queue.append(u)
+            for k in range(n + 1):
+                count[k] = 0
+            for u in range(n):
+                if label[u] < n:
+                    count[label[u]] += 1
+                current[u] = 0
+            if stats is not None:
+                labelled = [u for u in range(n) if label[u] < 2 * n]
+                stats.phases += 1
+                stats.vertices_visited += len(labelled)
+                stats.arcs_scanned += sum(len(adj[u]) for u in labelled)
+
+        # saturate every arc out of the source
+        for a in adj[s]:
+            excess[head[a]] += cap[a]
+            cap[a ^ 1] += cap[a]
+            cap[a] = 0
+        active.extend(u for u in range(n) if excess[u] and u != s and u != t)
+        self._timed("global_relabel", global_relabel)
+
+        if stats is not None:
+            discharge_start = time.perf_counter()
+            relabel_seconds = stats.seconds["global_relabel"]
+        relabels = 0
+        while active:
+            u = active.popleft()
+            arcs = adj[u]
+            if stats is not None:
+                stats.vertices_visited += 1
+            while excess[u]:
+                if current[u] == len(arcs):
+                    # relabel to one above the lowest residual neighbour
+                    old = label[u]
+                    new = 1 + min(label[head[a]] for a in arcs if cap[a])
+                    if stats is not None:
+                        stats.arcs_scanned += len(arcs)
+                    current[u] = 0
+                    relabels += 1
+                    if old < n:
+                        count[old] -= 1
+                        if not count[old]:
+                            # gap, nothing labelled between old and n can
+                            # reach t any more
+                            for v in range(n):
+                                if old < label[v] < n:
+                                    count[label[v]] -= 1
+                                    label[v] = n + 1
+                            new = max(new, n + 1)
+                    if new < n:
+                        count[new] += 1
+                    label[u] = new
+                    continue
+
+                a = arcs[current[u]]
+                v = head[a]
+                if cap[a] and label[u] == label[v] + 1:
+                    delta = min(excess[u], cap[a])
+                    cap[a] -= delta
+                    cap[a ^ 1] += delta
+                    excess[u] -= delta
+                    if not excess[v] and v != s and v != t:
+                        active.append(v)
+                    excess[v] += delta
+                    if stats is not None:
+                        stats.arcs_scanned += 1
+                        self._augmented()
+                else:
+                    current[u] += 1
+
+            if relabels >= n:
+                relabels = 0
+                self._timed("global_relabel", global_relabel)
+
+        if stats is not None:
+            # the discharge loop minus the global relabels run inside it
+            stats.add_time(
+                "discharge",
+                time.perf_counter() - discharge_start
+                - (stats.seconds["global_relabel"] - relabel_seconds),
+            )
+        self._timed("write_back", self._write_back, net)
+        return net.flow_value()
 
     def max_flow_val(self) -> float:
         """Calculate the maximum flow value from source to sink.
@@ -134,23 +540,153 @@ class MaxFlow:
             float: The maximum flow value.
 
         """
-        path = self.find_path()
+        stats = self.stats
+        if stats is not None:
+            stats.reset()
+            start = time.perf_counter()
+        if self.method == "dinic":
+            max_flow_value = self.dinic()
+        elif self.method == "push_relabel":
+            max_flow_value = self.push_relabel()
+        else:
+            max_flow_value = self._edmonds_karp()
+        if stats is not None:
+            stats.elapsed = time.perf_counter() - start
+        return max_flow_value
+
+    def _edmonds_karp(self) -> float:
+        stats = self.stats
+        # repair capacity decreases before augmenting from the current flow
+        self._timed("repair", lambda: self._write_back(self.network()))
+        path = self._timed("search", self.find_path, stats)
         # i = 0
         while path:
             # if i == 5:
             #     break
             # print("step",  i)
             # i += 1
-            b = self.bottleneck(path)
+            b = self._timed("bottleneck", self.bottleneck, path)
             # print("b", b, "i", i)
-            self.augment(path, b)
-            new_path = self.find_path()
-            if path == new_path:
+            # the same edges can come back as a new path in other directions,
+            # so only stop when no flow can be pushed
+            if b <= 0:
                 break
-            path = new_path
+            self._timed("augment", self.augment, path, b)
+            if stats is not None:
+                self._augmented()
+            path = self._timed("search", self.find_path, stats)
 
         max_flow_value = sum(
             self.MG.get_residual_edge_weight(self.MG.get_source(), v)
             for v in self.MG.get_edges(self.MG.get_source())
         )
+        # a repaired flow may route some of it back into the source
+        max_flow_value -= sum(
+            self.MG.get_residual_edge_weight(u, self.MG.get_source())
+            for u in self.MG.get_nodes()
+            if self.MG.get_edges(u).get(self.MG.get_source(), 0) > 0
+        )
         return max_flow_value
+
+    def min_cut(self) -> Tuple[Set[Any], Set[Any], List[Tuple[Any, Any]]]:
+        """Return a minimum s-t cut of the flow found by the last run.
+
+        The source side is every node still reachable from the source in the
+        residual network, found with one BFS over its arcs, so the cut takes
+        O(V + E). Call it after max_flow_val, on a flow that isn't maximum
+        the result is just a cut.
+
+        Returns:
+            Tuple[Set[Any], Set[Any], List[Tuple[Any, Any]]]: The source
+                side, the sink side, and the (u, v) edges crossing from the
+                source side to the sink side, which are all saturated.
+
+        """
+        net = self.network()
+        nodes, adj, head, cap = net.nodes, net.adj, net.head, net.cap
+        reached = [False] * net.num_nodes()
+        reached[net.source] = True
+        queue = deque([net.source])
+        while queue:
+            u = queue.popleft()
+            for a in adj[u]:
+                v = head[a]
+                if cap[a] and not reached[v]:
+                    reached[v] = True
+                    queue.append(v)
+
+        source_side = {node for node, r in zip(nodes, reached) if r}
+        sink_side = {node for node, r in zip(nodes, reached) if not r}
+        cut_edges = [
+            (nodes[head[a + 1]], nodes[head[a]])
+            for a in range(0, len(head), 2)
+            if reached[head[a + 1]] and not reached[head[a]] and cap[a + 1]
+        ]
+        return source_side, sink_side, cut_edges
+
+    def flow_paths(self) -> List[Tuple[List[Any], int]]:
+        """Decompose the flow found by the last run into source to sink paths.
+
+        Paths are followed from the source along edges still carrying flow,
+        with a current-edge pointer per node so every edge is passed over at
+        most once. Flow going around a cycle doesn't add to the flow value,
+        so cycles met on the way are cancelled instead of reported. There are
+        at most E paths, each found in O(V) amortized.
+
+        Returns:
+            List[Tuple[List[Any], int]]: Every path as its list of nodes from
+                source to sink, with the flow it carries.
+
+        """
+        net = self.network()
+        nodes, head = net.nodes, net.head
+        s, t = net.source, net.sink
+        flow = net.cap[1::2]
+        out = [[a >> 1 for a in arcs if not a & 1] for arcs in net.adj]
+        current = [0] * net.num_nodes()
+
+        paths = []
+        while True:
+            # stack holds the nodes of the walk, edges the edges between them
+            stack, edges = [s], []
+            position = {s: 0}
+            u = s
+            while u != t:
+                out_u, i = out[u], current[u]
+                while i < len(out_u) and not flow[out_u[i]]:
+                    i += 1
+                current[u] = i
+                if i == len(out_u):
+                    if u == s:
+                        return paths
+                    # stranded flow, only left by a flow that isn't valid
+                    stack.pop()
+                    del position[u]
+                    edges.pop()
+                    u = stack[-1]
+                    current[u] += 1
+                    continue
+                k = out_u[i]
+                v = head[2 * k]
+                if v in position:
+                    # cancel the cycle back to v
+                    p = position[v]
+                    cycle = edges[p:] + [k]
+                    b = min(flow[e] for e in cycle)
+                    for e in cycle:
+                        flow[e] -= b
+                    for node in stack[p + 1:]:
+                        del position[node]
+                    del stack[p + 1:]
+                    del edges[p:]
+                    u = v
+                    continue
+                position[v] = len(stack)
+                stack.append(v)
+                edges.append(k)
+                u = v
+
+            b = min(flow[e] for e in edges)
+            for e in edges:
+                flow[e] -= b
+            paths.append(([nodes[i] for i in stack], b))
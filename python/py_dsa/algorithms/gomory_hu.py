@@ -0,0 +1,351 @@
+import os
+from array import array
+from collections.abc import Mapping
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+from py_dsa.datastructures import Graph
+
+NODE_T = TypeVar("NODE_T")
+
+# (offsets, arcs, head, cap) of the undirected network every worker process
+# cuts, set once per process by _init_worker
+_network: Optional[Tuple[List[int], List[int], List[int], List[float]]] = None
+
+
+def _min_cut(
+    network: Tuple[List[int], List[int], List[int], List[float]], s: int, t: int
+) -> Tuple[float, bytes]:
+    """Find a minimum s-t cut of an undirected network with Dinic's algorithm.
+
+    The network is in CSR form: the arcs leaving node u are
+    arcs[offsets[u]:offsets[u + 1]], and every undirected edge k is the arc
+    pair 2k, 2k + 1 with the capacity of the edge in both directions, so
+    a ^ 1 is the reverse of arc a. cap is copied, not changed.
+
+    Returns:
+        Tuple[float, bytes]: The cut value, and a 0/1 byte per node that is 1
+            for the nodes on the side of s.
+
+    """
+    offsets, arcs, head, cap = network
+    cap = cap[:]
+    n = len(offsets) - 1
+    value = 0
+    while True:
+        level = [-1] * n
+        level[s] = 0
+        queue = deque([s])
+        while queue and level[t] < 0:
+            u = queue.popleft()
+            for i in range(offsets[u], offsets[u + 1]):
+                a = arcs[i]
+                v = head[a]
+                if cap[a] > 0 and level[v] < 0:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+        if level[t] < 0:
+            break
+
+        # blocking flow along arcs going up one level, path holds the arcs
+        # from s to u and current the next arc position of every node
+        current = offsets[:-1]
+        path: List[int] = []
+        u = s
+        while True:
+            if u == t:
+                b = min(cap[a] for a in path)
+                for a in path:
+                    cap[a] -= b
+                    cap[a ^ 1] += b
+                value += b
+                k = next(i for i, a in enumerate(path) if cap[a] <= 0)
+                del path[k:]
+                u = head[path[-1]] if path else s
+                continue
+            end = offsets[u + 1]
+            next_level = level[u] + 1
+            i = current[u]
+            while i < end:
+                a = arcs[i]
+                if cap[a] > 0 and level[head[a]] == next_level:
+                    break
+                i += 1
+            current[u] = i
+            if i < end:
+                a = arcs[i]
+                path.append(a)
+                u = head[a]
+            else:
+                if u == s:
+                    break
+                level[u] = -1
+                u = head[path.pop() ^ 1]
+                current[u] += 1
+
+    # the side of s is everything it still reaches, level[t] < 0 here so the
+    # last BFS ran to completion
+    side = bytes(1 if d >= 0 else 0 for d in level)
+    return value, side
+
+
+def _init_worker(offsets: array, arcs: array, head: array, cap: array) -> None:
+    """Store the network in the worker process, once, so tasks only carry
+    node indices."""
+    global _network
+    _network = (offsets.tolist(), arcs.tolist(), head.tolist(), cap.tolist())
+
+
+def _worker_min_cut(s: int, t: int) -> Tuple[float, bytes]:
+    return _min_cut(_network, s, t)
+
+
+class GomoryHuTree(Generic[NODE_T]):
+    """Gomory-Hu tree of an undirected capacitated graph.
+
+    The tree has the nodes of the graph, and for every pair u, v the
+    minimum u-v cut value of the graph is the smallest weight on the tree
+    path from u to v. Removing that tree edge splits the nodes into a
+    minimum u-v cut. It is built with Gusfield's algorithm from n - 1 max
+    flow computations, after which every pairwise query only walks the tree.
+
+    The graph is read as undirected: an edge u -> v of weight w is an
+    undirected edge of capacity w, and unweighted graphs have capacity 1.
+    Graphs built undirected by adding every edge both ways are read the same
+    way, as long as both directions have the same weight.
+
+    Flows are computed by a pool of worker processes. The capacity arrays
+    are sent to every worker once, through the pool initializer, and a task
+    only carries the two node indices of its cut. Gusfield's algorithm is
+    sequential, the pair cut for a node depends on the cuts before it, so the
+    pool computes batches of cuts for the pairs as they stand, and a cut is
+    recomputed when an earlier result has changed its pair in the meantime.
+    Finished cuts are kept, so no pair is cut twice.
+    """
+
+    def __init__(
+        self,
+        G: Graph[NODE_T],
+        max_workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ):
+        """Build the tree.
+
+        Args:
+            G (Graph[NODE_T]): The undirected graph.
+            max_workers (Optional[int], optional): Worker processes computing
+                flows, 1 or less computes them in this process. Defaults to
+                the number of CPUs, see ProcessPoolExecutor.
+            batch_size (Optional[int], optional): Cuts dispatched at a time.
+                Defaults to twice the number of workers.
+
+        Raises:
+            ValueError: If an edge has a negative capacity, or its two
+                directions have different capacities.
+
+        """
+        self.nodes: List[NODE_T] = list(G.get_nodes())
+        self.node_to_idx: Dict[NODE_T, int] = {node: i for i, node in enumerate(self.nodes)}
+        n = len(self.nodes)
+        network = self._build_network(G)
+
+        # parent and the weight of the edge to it, node 0 is the root
+        self.parent: List[int] = [0] * n
+        self.weight: List[float] = [0] * n
+        if n > 1:
+            if max_workers is not None and max_workers <= 1:
+                self._gusfield_serial(network)
+            else:
+                try:
+                    self._gusfield_pool(network, max_workers, batch_size)
+                except (OSError, NotImplementedError, BrokenProcessPool):
+                    # no process support here, e.g. a sandbox without
+                    # semaphores, fall back to computing in this process
+                    self.parent = [0] * n
+                    self.weight = [0] * n
+                    self._gusfield_serial(network)
+
+        self.depth = [0] * n
+        children: List[List[int]] = [[] for _ in range(n)]
+        for u in range(1, n):
+            children[self.parent[u]].append(u)
+        stack = [0] if n else []
+        while stack:
+            u = stack.pop()
+            for v in children[u]:
+                self.depth[v] = self.depth[u] + 1
+                stack.append(v)
+
+    def _build_network(self, G: Graph[NODE_T]) -> Tuple[array, array, array, array]:
+        """Return the CSR arrays of the undirected network of G, see
+        _min_cut."""
+        node_to_idx = self.node_to_idx
+        capacity: Dict[Tuple[int, int], float] = {}
+        for u in self.nodes:
+            edges = G.get_edges(u)
+            u_idx = node_to_idx[u]
+            # weighted graphs map neighbours to weights, unweighted ones are
+            # sets of neighbours
+            weighted = edges.items() if isinstance(edges, Mapping) else ((v, 1) for v in edges)
+            for v, w in weighted:
+                v_idx = node_to_idx[v]
+                if u_idx == v_idx:
+                    continue
+                if w < 0:
+                    raise ValueError(f"Edge {u} -> {v} has negative capacity {w}")
+                key = (min(u_idx, v_idx), max(u_idx, v_idx))
+                if key in capacity and capacity[key] != w:
+                    raise ValueError(
+                        f"Edge {u} - {v} has capacity {w} one way and {capacity[key]} the other"
+                    )
+                capacity[key] = w
+
+        typecode = "q" if all(isinstance(w, int) for w in capacity.values()) else "d"
+        n = len(self.nodes)
+        head, cap = array("q"), array(typecode)
+        out: List[List[int]] = [[] for _ in range(n)]
+        for (u, v), w in capacity.items():
+            if not w:
+                continue
+            out[u].append(len(head))
+            head.append(v)
+            cap.append(w)
+            out[v].append(len(head))
+            head.append(u)
+            cap.append(w)
+        offsets, arcs = array("q", [0]), array("q")
+        for u_arcs in out:
+            arcs.extend(u_arcs)
+            offsets.append(len(arcs))
+        return offsets, arcs, head, cap
+
+    def _apply_cut(self, s: int, value: float, side: bytes) -> None:
+        """Gusfield's update after cutting s from its parent t, with side
+        the nodes on the side of s."""
+        parent, weight = self.parent, self.weight
+        t = parent[s]
+        weight[s] = value
+        for i in range(len(parent)):
+            if i != s and side[i] and parent[i] == t:
+                parent[i] = s
+        if side[parent[t]]:
+            parent[s] = parent[t]
+            parent[t] = s
+            weight[s] = weight[t]
+            weight[t] = value
+
+    def _gusfield_serial(self, network: Tuple[array, array, array, array]) -> None:
+        offsets, arcs, head, cap = network
+        lists = (offsets.tolist(), arcs.tolist(), head.tolist(), cap.tolist())
+        for s in range(1, len(self.nodes)):
+            self._apply_cut(s, *_min_cut(lists, s, self.parent[s]))
+
+    def _gusfield_pool(
+        self,
+        network: Tuple[array, array, array, array],
+        max_workers: Optional[int],
+        batch_size: Optional[int],
+    ) -> None:
+        n = len(self.nodes)
+        # finished cuts by (s, t), dropped once s is processed
+        cuts: Dict[Tuple[int, int], Tuple[float, bytes]] = {}
+        workers = max_workers or os.cpu_count() or 1
+        if batch_size is None:
+            batch_size = 2 * workers
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=network
+        ) as pool:
+            s = 1
+            while s < n:
+                # cut the next pairs as they stand, the first one is always
+                # still valid when its turn comes
+                pairs = [
+                    (u, self.parent[u])
+                    for u in range(s, min(n, s + batch_size))
+                    if (u, self.parent[u]) not in cuts
+                ]
+                for pair, cut in zip(pairs, pool.map(_worker_min_cut, *zip(*pairs))):
+                    cuts[pair] = cut
+                while s < n and (s, self.parent[s]) in cuts:
+                    self._apply_cut(s, *cuts[s, self.parent[s]])
+                    for key in [key for key in cuts if key[0] == s]:
+                        del cuts[key]
+                    s += 1
+
+    def edges(self) -> List[Tuple[NODE_T, NODE_T, float]]:
+        """Return the edges of the tree.
+
+        Returns:
+            List[Tuple[NODE_T, NODE_T, float]]: (node, parent, weight) for
+                every node but the root.
+
+        """
+        nodes = self.nodes
+        return [(nodes[u], nodes[self.parent[u]], self.weight[u]) for u in range(1, len(nodes))]
+
+    def _lightest_edge(self, u: NODE_T, v: NODE_T) -> int:
+        """Return the node whose edge to its parent is the lightest edge on
+        the tree path between u and v."""
+        if u not in self.node_to_idx or v not in self.node_to_idx:
+            raise KeyError(f"Node {u} or {v} not in the tree")
+        a, b = self.node_to_idx[u], self.node_to_idx[v]
+        if a == b:
+            raise ValueError("Cannot cut a node from itself")
+        parent, weight, depth = self.parent, self.weight, self.depth
+        best = -1
+        while a != b:
+            if depth[a] < depth[b]:
+                a, b = b, a
+            if best < 0 or weight[a] < weight[best]:
+                best = a
+            a = parent[a]
+        return best
+
+    def min_cut_value(self, u: NODE_T, v: NODE_T) -> float:
+        """Return the value of a minimum u-v cut of the graph.
+
+        Args:
+            u (NODE_T): One node.
+            v (NODE_T): Another node.
+
+        Returns:
+            float: The minimum cut value, which is also the max flow value.
+
+        Raises:
+            KeyError: If u or v isn't a node of the graph.
+            ValueError: If u and v are the same node.
+
+        """
+        return self.weight[self._lightest_edge(u, v)]
+
+    def min_cut(self, u: NODE_T, v: NODE_T) -> Tuple[float, Set[NODE_T]]:
+        """Return a minimum u-v cut of the graph.
+
+        Args:
+            u (NODE_T): One node.
+            v (NODE_T): Another node.
+
+        Returns:
+            Tuple[float, Set[NODE_T]]: The cut value and the side of u.
+
+        Raises:
+            KeyError: If u or v isn't a node of the graph.
+            ValueError: If u and v are the same node.
+
+        """
+        cut = self._lightest_edge(u, v)
+        # removing the edge from cut to its parent leaves cut's subtree
+        n = len(self.nodes)
+        children: List[List[int]] = [[] for _ in range(n)]
+        for i in range(1, n):
+            children[self.parent[i]].append(i)
+        subtree, stack = set(), [cut]
+        while stack:
+            i = stack.pop()
+            subtree.add(i)
+            stack.extend(children[i])
+        u_idx = self.node_to_idx[u]
+        side = subtree if u_idx in subtree else set(range(n)) - subtree
+        return self.weight[cut], {self.nodes[i] for i in side}
@@ -0,0 +1,197 @@
+from collections import deque
+from heapq import heappop, heappush
+from typing import List, Optional, Tuple
+
+from py_dsa.algorithms.residual_network import ResidualNetwork
+from py_dsa.datastructures import MatchingGraph
+
+
+class MinCostFlow:
+    """Minimum cost flow on a MatchingGraph, using the per-unit edge costs set
+    with MatchingGraph.add_edge(u, v, w, cost).
+
+    Uses successive shortest paths: flow is always augmented along a
+    cheapest source to sink path of the residual network. Johnson potentials
+    keep every residual arc's reduced cost non-negative, so shortest paths are
+    found by a binary heap Dijkstra in O(E log V). After each Dijkstra all the
+    cheapest paths use only arcs of reduced cost 0, so rather than one path
+    per Dijkstra, a Dinic style blocking flow saturates all of them before the
+    next one (the primal-dual method).
+    """
+
+    # reduced costs at most this far above 0 count as 0, for float costs
+    EPSILON = 1e-9
+
+    def __init__(self, MG: MatchingGraph):
+        self.MG = MG
+
+    def _initial_potentials(self, net: ResidualNetwork) -> List[float]:
+        """Return shortest path distances from the source, or 0 for nodes it
+        can't reach, as potentials making every reduced cost non-negative.
+        Only needed when some costs are negative, found with the queue based
+        Bellman-Ford (SPFA).
+
+        Raises:
+            ValueError: If the network has a negative cost cycle.
+
+        """
+        adj, head, cap, cost = net.adj, net.head, net.cap, net.cost
+        n = net.num_nodes()
+        dist = [0.0] * n
+        reached = [False] * n
+        reached[net.source] = True
+        in_queue = [False] * n
+        relaxed = [0] * n
+        queue = deque([net.source])
+        in_queue[net.source] = True
+        while queue:
+            u = queue.popleft()
+            in_queue[u] = False
+            for a in adj[u]:
+                if not cap[a]:
+                    continue
+                v = head[a]
+                d = dist[u] + cost[a]
+                if not reached[v] or d < dist[v]:
+                    reached[v] = True
+                    dist[v] = d
+                    if not in_queue[v]:
+                        relaxed[v] += 1
+                        if relaxed[v] > n:
+                            raise ValueError("Graph has a negative cost cycle")
+                        in_queue[v] = True
+                        queue.append(v)
+        return dist
+
+    def min_cost_flow(self, flow_limit: Optional[int] = None) -> Tuple[int, float]:
+        """Send as much flow as possible, up to flow_limit, from source to sink
+        at the least total cost, and store it in the residual graph of the
+        MatchingGraph.
+
+        Any flow already in the residual graph is discarded, since it may
+        not be of minimum cost.
+
+        Args:
+            flow_limit (Optional[int], optional): The amount of flow to send.
+                Defaults to the maximum flow.
+
+        Returns:
+            Tuple[int, float]: The flow value and its total cost.
+
+        Raises:
+            ValueError: If flow_limit is negative, or the network has a
+                negative cost cycle.
+
+        """
+        if flow_limit is not None and flow_limit < 0:
+            raise ValueError("Flow limit cannot be negative")
+        net = ResidualNetwork(self.MG)
+        net.clear_flow()
+        adj, head, cap, cost = net.adj, net.head, net.cap, net.cost
+        s, t, n = net.source, net.sink, net.num_nodes()
+
+        if any(c < 0 for c in cost[::2]):
+            potential = self._initial_potentials(net)
+        else:
+            potential = [0.0] * n
+
+        inf = float("inf")
+        flow, total_cost = 0, 0.0
+        while flow_limit is None or flow < flow_limit:
+            # Dijkstra on reduced costs cost[a] + potential[u] - potential[v]
+            dist = [inf] * n
+            dist[s] = 0.0
+            via = [-1] * n
+            heap = [(0.0, s)]
+            while heap:
+                d, u = heappop(heap)
+                if d > dist[u]:
+                    continue
+                if u == t:
+                    break
+                p_u = potential[u]
+                for a in adj[u]:
+                    if cap[a]:
+                        v = head[a]
+                        # clamp float rounding, reduced costs are >= 0
+                        nd = d + max(0.0, cost[a] + p_u - potential[v])
+                        if nd < dist[v]:
+                            dist[v] = nd
+                            via[v] = a
+                            heappush(heap, (nd, v))
+            if dist[t] == inf:
+                break
+            # the search stopped at t, capping the distances of nodes it
+            # didn't settle at dist[t] keeps every reduced cost >= 0
+            d_t = dist[t]
+            for u in range(n):
+                potential[u] += min(dist[u], d_t)
+            path_cost = potential[t] - potential[s]
+
+            while flow_limit is None or flow < flow_limit:
+                sent = self._blocking_flow(
+                    net, potential, inf if flow_limit is None else flow_limit - flow
+                )
+                if not sent:
+                    break
+                flow += sent
+                total_cost += sent * path_cost
+
+        net.write_back(self.MG)
+        return flow, total_cost
+
+    def _blocking_flow(self, net: ResidualNetwork, potential: List[float], limit: float) -> int:
+        """Send a blocking flow of at most limit along shortest source to sink
+        paths of arcs with reduced cost 0, and return its value."""
+        adj, head, cap, cost = net.adj, net.head, net.cap, net.cost
+        s, t, n = net.source, net.sink, net.num_nodes()
+        eps = self.EPSILON
+
+        level = [-1] * n
+        level[s] = 0
+        queue = deque([s])
+        while queue and level[t] < 0:
+            u = queue.popleft()
+            p_u = potential[u]
+            for a in adj[u]:
+                v = head[a]
+                if cap[a] and level[v] < 0 and cost[a] + p_u - potential[v] <= eps:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+        if level[t] < 0:
+            return 0
+
+        sent = 0
+        current = [0] * n
+        path: List[int] = []
+        u = s
+        while sent < limit:
+            if u == t:
+                b = min(limit - sent, min(cap[a] for a in path))
+                for a in path:
+                    cap[a] -= b
+                    cap[a ^ 1] += b
+                sent += b
+                k = next((i for i, a in enumerate(path) if not cap[a]), 0)
+                del path[k:]
+                u = head[path[-1]] if path else s
+                continue
+            arcs = adj[u]
+            next_level = level[u] + 1
+            p_u = potential[u]
+            for i in range(current[u], len(arcs)):
+                a = arcs[i]
+                v = head[a]
+                if cap[a] and level[v] == next_level and cost[a] + p_u - potential[v] <= eps:
+                    current[u] = i
+                    path.append(a)
+                    u = v
+                    break
+            else:
+                if u == s:
+                    break
+                current[u] = len(arcs)
+                level[u] = -1
+                u = head[path.pop() ^ 1]
+                current[u] += 1
+        return sent
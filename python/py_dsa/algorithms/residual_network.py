@@ -0,0 +1,272 @@
+from collections import deque
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
+
+from py_dsa.datastructures import MatchingGraph
+
+NODE_T = TypeVar("NODE_T")
+
+
+class ResidualNetwork(Generic[NODE_T]):
+    """Array-backed residual network of a MatchingGraph.
+
+    Nodes are numbered 0..n-1. Every edge u -> v with capacity c and flow f
+    becomes a pair of arcs: arc 2k from u to v with residual capacity c - f,
+    and arc 2k + 1 from v to u with residual capacity f. The reverse of arc a
+    is therefore a ^ 1, its tail is head[a ^ 1], and the flow on edge k is
+    cap[2k + 1]. adj[u] lists the arcs leaving u in both directions, so a
+    traversal of the residual graph never has to look for backward edges.
+    Arc 2k costs the edge's cost per unit of flow and arc 2k + 1 the
+    negation, since pushing flow back refunds it.
+
+    Attributes:
+        nodes (List[NODE_T]): The node of every index.
+        node_to_idx (Dict[NODE_T, int]): The index of every node.
+        source (int): Index of the source.
+        sink (int): Index of the sink.
+        adj (List[List[int]]): The arcs leaving every node.
+        head (List[int]): The node every arc points to.
+        cap (List[int]): The residual capacity of every arc.
+        cost (List[float]): The cost per unit of flow of every arc.
+
+    """
+
+    def __init__(self, MG: MatchingGraph[NODE_T]):
+        """Build the network from the capacities and current flow of MG.
+
+        Flow already recorded in MG's residual graph, e.g. by
+        preliminary_assignment or an earlier run, is kept, so solvers resume
+        from it instead of starting over. Edges carrying more flow than their
+        capacity, after a capacity decrease, are repaired as in set_capacity.
+
+        Args:
+            MG (MatchingGraph[NODE_T]): The graph to build the network from.
+
+        """
+        source, sink = MG.get_source(), MG.get_sink()
+        self.nodes: List[NODE_T] = [source, sink]
+        self.nodes.extend(node for node in MG.get_nodes() if node != source and node != sink)
+        self.node_to_idx: Dict[NODE_T, int] = {node: i for i, node in enumerate(self.nodes)}
+        self.source, self.sink = 0, 1
+        self.adj: List[List[int]] = [[] for _ in self.nodes]
+        self.head: List[int] = []
+        self.cap: List[int] = []
+        self.cost: List[float] = []
+        # flow of every edge as last read from or written to the MatchingGraph
+        self._synced: List[int] = []
+        # (u, v) index pairs to edge numbers, built when first needed
+        self._edge_of: Optional[Dict[Tuple[int, int], int]] = None
+
+        node_to_idx, adj, head, cap, cost = (
+            self.node_to_idx, self.adj, self.head, self.cap, self.cost
+        )
+        for u in self.nodes:
+            flows = MG.get_residual_edges(u)
+            costs = MG.get_edge_costs(u)
+            u_idx = node_to_idx[u]
+            for v, c in MG.get_edges(u).items():
+                f = flows.get(v, 0)
+                if v == u or (c <= 0 and not f):
+                    continue
+                v_idx = node_to_idx[v]
+                w = costs.get(v, 0)
+                adj[u_idx].append(len(head))
+                head.append(v_idx)
+                cap.append(c - f)
+                cost.append(w)
+                adj[v_idx].append(len(head))
+                head.append(u_idx)
+                cap.append(f)
+                cost.append(-w)
+                self._synced.append(f)
+
+        for a in range(0, len(cap), 2):
+            if cap[a] < 0:
+                self._set_edge_capacity(a >> 1, cap[a] + cap[a + 1])
+
+    def num_nodes(self) -> int:
+        """Return the number of nodes in the network.
+
+        Returns:
+            int: The number of nodes.
+
+        """
+        return len(self.nodes)
+
+    def num_edges(self) -> int:
+        """Return the number of edges, half the number of arcs.
+
+        Returns:
+            int: The number of edges.
+
+        """
+        return len(self.head) // 2
+
+    def add_node(self, node: NODE_T) -> int:
+        """Add a node to the network, if it isn't in it yet.
+
+        Args:
+            node (NODE_T): The node.
+
+        Returns:
+            int: The index of the node.
+
+        """
+        if node not in self.node_to_idx:
+            self.node_to_idx[node] = len(self.nodes)
+            self.nodes.append(node)
+            self.adj.append([])
+        return self.node_to_idx[node]
+
+    def set_capacity(self, u: NODE_T, v: NODE_T, capacity: int, flow: int = 0, cost: float = 0) -> None:
+        """Change the capacity and cost of edge u -> v, adding the edge with
+        the given flow if the network doesn't have it yet.
+
+        When the capacity drops below the flow on the edge, the flow is
+        repaired locally: the surplus is first rerouted from u to v around the
+        edge, and only what can't be rerouted is cancelled, by returning it
+        from u to the source and pulling it back from the sink to v. Either
+        way the result is a valid flow, and the other flow paths are kept.
+
+        Args:
+            u (NODE_T): The source node.
+            v (NODE_T): The destination node.
+            capacity (int): The new capacity.
+            flow (int, optional): The flow on the edge, only used when it is
+                added. Defaults to 0.
+            cost (float, optional): The new cost of the edge. Defaults to 0.
+
+        """
+        if u == v:
+            return
+        u_idx, v_idx = self.add_node(u), self.add_node(v)
+        edge_of = self._edge_index()
+        k = edge_of.get((u_idx, v_idx))
+        if k is None:
+            if capacity <= 0 and not flow:
+                return
+            k = edge_of[(u_idx, v_idx)] = len(self.head) >> 1
+            self.adj[u_idx].append(len(self.head))
+            self.head.append(v_idx)
+            self.cap.append(capacity - flow)
+            self.cost.append(cost)
+            self.adj[v_idx].append(len(self.head))
+            self.head.append(u_idx)
+            self.cap.append(flow)
+            self.cost.append(-cost)
+            self._synced.append(flow)
+        else:
+            self.cost[2 * k] = cost
+            self.cost[2 * k + 1] = -cost
+        self._set_edge_capacity(k, capacity)
+
+    def _edge_index(self) -> Dict[Tuple[int, int], int]:
+        if self._edge_of is None:
+            head = self.head
+            self._edge_of = {(head[a + 1], head[a]): a >> 1 for a in range(0, len(head), 2)}
+        return self._edge_of
+
+    def _set_edge_capacity(self, k: int, capacity: int) -> None:
+        cap, head = self.cap, self.head
+        flow = cap[2 * k + 1]
+        if capacity >= flow:
+            cap[2 * k] = capacity - flow
+            return
+        surplus = flow - capacity
+        cap[2 * k], cap[2 * k + 1] = 0, capacity
+        u, v = head[2 * k + 1], head[2 * k]
+        # u now has surplus excess and v the same deficit
+        surplus -= self.augment(u, v, surplus)
+        if surplus:
+            if u != self.source and u != self.sink:
+                self.augment(u, self.source, surplus)
+            if v != self.source and v != self.sink:
+                self.augment(self.sink, v, surplus)
+
+    def augment(self, start: int, end: int, limit: int) -> int:
+        """Push up to limit units of flow from node index start to end along
+        BFS paths of the residual network.
+
+        Args:
+            start (int): Index of the node to push from.
+            end (int): Index of the node to push to.
+            limit (int): The most flow to push.
+
+        Returns:
+            int: The flow pushed.
+
+        """
+        adj, head, cap = self.adj, self.head, self.cap
+        pushed = 0
+        while pushed < limit:
+            via = {start: -1}
+            queue = deque([start])
+            while queue and end not in via:
+                u = queue.popleft()
+                for a in adj[u]:
+                    v = head[a]
+                    if cap[a] and v not in via:
+                        via[v] = a
+                        queue.append(v)
+            if end not in via:
+                break
+            b, v = limit - pushed, end
+            while v != start:
+                b = min(b, cap[via[v]])
+                v = head[via[v] ^ 1]
+            v = end
+            while v != start:
+                a = via[v]
+                cap[a] -= b
+                cap[a ^ 1] += b
+                v = head[a ^ 1]
+            pushed += b
+        return pushed
+
+    def clear_flow(self) -> None:
+        """Set the flow on every edge back to zero."""
+        cap = self.cap
+        for a in range(0, len(cap), 2):
+            cap[a] += cap[a + 1]
+            cap[a + 1] = 0
+
+    def flow_value(self) -> int:
+        """Return the net flow out of the source.
+
+        Returns:
+            int: The value of the current flow.
+
+        """
+        cap = self.cap
+        # a forward arc out of s carries cap[a ^ 1], a reverse arc out of s
+        # belongs to an edge into s carrying cap[a]
+        return sum(-cap[a] if a & 1 else cap[a ^ 1] for a in self.adj[self.source])
+
+    def edge_flows(self) -> Dict[NODE_T, Dict[NODE_T, int]]:
+        """Return the flow on every edge, keyed like MatchingGraph's residual
+        graph.
+
+        Returns:
+            Dict[NODE_T, Dict[NODE_T, int]]: Maps u to v to the flow on u -> v.
+
+        """
+        nodes, head, cap = self.nodes, self.head, self.cap
+        flows: Dict[NODE_T, Dict[NODE_T, int]] = {}
+        for a in range(0, len(head), 2):
+            flows.setdefault(nodes[head[a + 1]], {})[nodes[head[a]]] = cap[a + 1]
+        return flows
+
+    def write_back(self, MG: MatchingGraph[NODE_T]) -> None:
+        """Store the flow of every edge in MG's residual graph, where
+        MaxFlow.max_flow_val and the other MatchingGraph users read it. Only
+        edges whose flow changed since the network was built or last written
+        back are updated.
+
+        Args:
+            MG (MatchingGraph[NODE_T]): The graph the network was built from.
+
+        """
+        nodes, head, cap, synced = self.nodes, self.head, self.cap, self._synced
+        for k, f in enumerate(cap[1::2]):
+            if f != synced[k]:
+                MG.update_residual_edge_weight(nodes[head[2 * k + 1]], nodes[head[2 * k]], f)
+                synced[k] = f
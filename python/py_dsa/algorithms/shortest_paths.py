@@ -0,0 +1,310 @@
+import math
+from heapq import heappop, heappush
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Tuple
+
+from py_dsa.datastructures import CSRGraph, Graph
+
+
+def _snapshot(G: Graph) -> CSRGraph:
+    """Return G itself if it is a CSRGraph, otherwise a CSR snapshot of it.
+
+    Snapshots are O(V + E) to build, so callers running many queries on the
+    same graph should take one with to_csr and pass it in.
+    """
+    if isinstance(G, CSRGraph):
+        return G
+    return G.to_csr()
+
+
+def _row(csr: CSRGraph, u: int) -> Any:
+    """Return (target, weight) pairs for the out-edges of node id u, weight 1
+    on unweighted snapshots."""
+    start, end = csr.offsets[u], csr.offsets[u + 1]
+    weights = csr.weights
+    return zip(csr.targets[start:end], repeat(1) if weights is None else weights[start:end])
+
+
+def _negative_weight(csr: CSRGraph, u: int, v: int, w: float) -> ValueError:
+    """Return the error for a negative edge u -> v, Dijkstra can't use it."""
+    return ValueError(f"Edge {csr.node_at(u)} -> {csr.node_at(v)} has negative weight {w}")
+
+
+def _path(csr: CSRGraph, pred: Dict[int, int], u: int) -> List[Any]:
+    """Walk pred back from node id u to the source, returning the nodes of
+    the path from the source to u."""
+    path = [u]
+    while u in pred:
+        u = pred[u]
+        path.append(u)
+    path.reverse()
+    return [csr.node_at(idx) for idx in path]
+
+
+def _dijkstra_all(csr: CSRGraph, source: int) -> Tuple[List[float], List[int]]:
+    """Dijkstra over node ids settling every reachable node, with flat lists
+    since all of them are touched anyway.
+
+    Returns:
+        Tuple[List[float], List[int]]: The distance of every node id, inf if
+            unreachable, and its predecessor on a shortest path, -1 for none.
+
+    """
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    n = len(offsets) - 1
+    dist = [math.inf] * n
+    dist[source] = 0
+    pred = [-1] * n
+    done = bytearray(n)
+    heap = [(0, source)]
+    while heap:
+        d, u = heappop(heap)
+        if done[u]:
+            continue
+        done[u] = 1
+        start, end = offsets[u], offsets[u + 1]
+        row = zip(targets[start:end], repeat(1) if weights is None else weights[start:end])
+        for v, w in row:
+            if w < 0:
+                raise _negative_weight(csr, u, v, w)
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                heappush(heap, (nd, v))
+    return dist, pred
+
+
+def _dijkstra(csr: CSRGraph, source: int, target: int) -> Tuple[Dict[int, float], Dict[int, int]]:
+    """Dijkstra over node ids, stopping once target is settled. Dicts keep
+    the cost proportional to the nodes reached rather than the graph size.
+
+    Returns:
+        Tuple[Dict[int, float], Dict[int, int]]: The distance and the
+            predecessor on a shortest path of every settled node id.
+
+    """
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    # tentative distances, settled ones move to dist
+    best: Dict[int, float] = {source: 0}
+    dist: Dict[int, float] = {}
+    pred: Dict[int, int] = {}
+    heap = [(0, source)]
+    while heap:
+        d, u = heappop(heap)
+        if u in dist:
+            continue
+        dist[u] = d
+        if u == target:
+            break
+        start, end = offsets[u], offsets[u + 1]
+        row = zip(targets[start:end], repeat(1) if weights is None else weights[start:end])
+        for v, w in row:
+            if w < 0:
+                raise _negative_weight(csr, u, v, w)
+            nd = d + w
+            if nd < best.get(v, math.inf):
+                best[v] = nd
+                pred[v] = u
+                heappush(heap, (nd, v))
+    return dist, {v: pred[v] for v in dist if v in pred}
+
+
+def dijkstra(G: Graph, source: Any, target: Any = None) -> Tuple[Dict[Any, float], Dict[Any, Any]]:
+    """Single-source shortest paths with Dijkstra's algorithm.
+
+    Runs over node ids of a CSR snapshot with a binary heap, in
+    O((V + E) log V). If target is given the search stops as soon as the
+    target's distance is final, so only nodes closer than it are settled.
+
+    Args:
+        G (Graph): The graph, a CSRGraph or a graph with to_csr. Edge weights
+            must be non-negative, unweighted graphs have weight 1.
+        source (Any): The start node.
+        target (Any, optional): Stop once this node is reached. Defaults to
+            None, which settles every reachable node.
+
+    Returns:
+        Tuple[Dict[Any, float], Dict[Any, Any]]: The distance from source of
+            every settled node, and its predecessor on a shortest path
+            (source has none).
+
+    Raises:
+        NodeNotFoundError: If source or target isn't in the graph.
+        ValueError: If a negative edge weight is reached.
+
+    """
+    csr = _snapshot(G)
+    s = csr.get_idx(source)
+    if target is None:
+        dist_list, pred_list = _dijkstra_all(csr, s)
+        nodes = csr.get_nodes()
+        inf = math.inf
+        return (
+            {nodes[u]: d for u, d in enumerate(dist_list) if d < inf},
+            {nodes[v]: nodes[u] for v, u in enumerate(pred_list) if u >= 0},
+        )
+    # only the settled nodes, so don't copy the node list
+    dist, pred = _dijkstra(csr, s, csr.get_idx(target))
+    node_at = csr.node_at
+    return (
+        {node_at(u): d for u, d in dist.items()},
+        {node_at(v): node_at(u) for v, u in pred.items()},
+    )
+
+
+def dijkstra_path(G: Graph, source: Any, target: Any) -> Tuple[float, List[Any]]:
+    """Shortest path between two nodes with early-exit Dijkstra.
+
+    Args:
+        G (Graph): The graph, see dijkstra.
+        source (Any): The start node.
+        target (Any): The end node.
+
+    Returns:
+        Tuple[float, List[Any]]: The length of a shortest path and its nodes
+            from source to target, or (math.inf, []) if target is
+            unreachable.
+
+    Raises:
+        NodeNotFoundError: If source or target isn't in the graph.
+        ValueError: If a negative edge weight is reached.
+
+    """
+    csr = _snapshot(G)
+    s, t = csr.get_idx(source), csr.get_idx(target)
+    dist, pred = _dijkstra(csr, s, t)
+    if t not in dist:
+        return math.inf, []
+    return dist[t], _path(csr, pred, t)
+
+
+def bidirectional_dijkstra(G: Graph, source: Any, target: Any) -> Tuple[float, List[Any]]:
+    """Shortest path between two nodes, searching from both ends at once.
+
+    A forward Dijkstra from source and a backward one from target over the
+    reversed snapshot (see CSRGraph.reverse) take turns, each expanding the
+    side whose next distance is smaller. The best path through a node seen
+    by both is kept, and the search stops once the two next distances add up
+    to at least its length. On road-like graphs the two balls settle far
+    fewer nodes than one ball reaching all the way to target.
+
+    Args:
+        G (Graph): The graph, see dijkstra. The reverse of a CSRGraph is
+            cached, so pass a snapshot to amortize it over many queries.
+        source (Any): The start node.
+        target (Any): The end node.
+
+    Returns:
+        Tuple[float, List[Any]]: The length of a shortest path and its nodes
+            from source to target, or (math.inf, []) if target is
+            unreachable.
+
+    Raises:
+        NodeNotFoundError: If source or target isn't in the graph.
+        ValueError: If a negative edge weight is reached.
+
+    """
+    csr = _snapshot(G)
+    s, t = csr.get_idx(source), csr.get_idx(target)
+    if s == t:
+        return 0, [source]
+    graphs = (csr, csr.reverse())
+    best: Tuple[Dict[int, float], Dict[int, float]] = ({s: 0}, {t: 0})
+    dist: Tuple[Dict[int, float], Dict[int, float]] = ({}, {})
+    pred: Tuple[Dict[int, int], Dict[int, int]] = ({}, {})
+    heaps = ([(0, s)], [(0, t)])
+    length, meet = math.inf, -1
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= length:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        d, u = heappop(heaps[side])
+        if u in dist[side]:
+            continue
+        dist[side][u] = d
+        other = best[1 - side]
+        side_best, side_pred, heap = best[side], pred[side], heaps[side]
+        for v, w in _row(graphs[side], u):
+            if w < 0:
+                a, b = (u, v) if side == 0 else (v, u)
+                raise _negative_weight(csr, a, b, w)
+            nd = d + w
+            if nd < side_best.get(v, math.inf):
+                side_best[v] = nd
+                side_pred[v] = u
+                heappush(heap, (nd, v))
+            if v in other and nd + other[v] < length:
+                length, meet = nd + other[v], v
+        if u in other and d + other[u] < length:
+            length, meet = d + other[u], u
+
+    if meet < 0:
+        return math.inf, []
+    path = _path(csr, pred[0], meet)
+    u = meet
+    while u in pred[1]:
+        u = pred[1][u]
+        path.append(csr.node_at(u))
+    return length, path
+
+
+def astar_path(
+    G: Graph, source: Any, target: Any, heuristic: Callable[[Any, Any], float]
+) -> Tuple[float, List[Any]]:
+    """Shortest path between two nodes with A* search.
+
+    Dijkstra ordered by distance plus heuristic(node, target), an estimate
+    of the remaining distance, so the search heads towards target. The path
+    is shortest if the heuristic never overestimates; with a consistent
+    heuristic (h(u) <= w(u, v) + h(v)) every node is expanded at most once.
+    The heuristic is called once per node reached.
+
+    Args:
+        G (Graph): The graph, see dijkstra.
+        source (Any): The start node.
+        target (Any): The end node.
+        heuristic (Callable[[Any, Any], float]): Estimate of the distance
+            from a node to target, called as heuristic(node, target), e.g.
+            the straight line distance between coordinates.
+
+    Returns:
+        Tuple[float, List[Any]]: The length of the path found and its nodes
+            from source to target, or (math.inf, []) if target is
+            unreachable.
+
+    Raises:
+        NodeNotFoundError: If source or target isn't in the graph.
+        ValueError: If a negative edge weight is reached.
+
+    """
+    csr = _snapshot(G)
+    s, t = csr.get_idx(source), csr.get_idx(target)
+    node_at = csr.node_at
+    estimate: Dict[int, float] = {}
+    best: Dict[int, float] = {s: 0}
+    pred: Dict[int, int] = {}
+    closed = set()
+    heap = [(heuristic(source, target), 0, s)]
+    while heap:
+        _, d, u = heappop(heap)
+        if u == t:
+            return d, _path(csr, pred, t)
+        if u in closed or d > best[u]:
+            continue
+        closed.add(u)
+        for v, w in _row(csr, u):
+            if w < 0:
+                raise _negative_weight(csr, u, v, w)
+            nd = d + w
+            if nd < best.get(v, math.inf):
+                best[v] = nd
+                pred[v] = u
+                # an inconsistent heuristic can improve a closed node, which
+                # then has to be expanded again
+                closed.discard(v)
+                h = estimate.get(v)
+                if h is None:
+                    h = estimate[v] = heuristic(node_at(v), target)
+                heappush(heap, (nd + h, nd, v))
+    return math.inf, []
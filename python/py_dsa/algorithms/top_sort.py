@@ -1,6 +1,9 @@
-from collections import defaultdict, deque
-from typing import List, Any
-from py_dsa.datastructures import Graph
+from array import array
+from collections import deque
+from typing import Any, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
+from py_dsa.datastructures import CSRGraph, CycleError, Graph, UnweightedGraph
+
+NODE_T = TypeVar("NODE_T")
 
 
 # Khan's algorithm
@@ -9,8 +12,13 @@ from py_dsa.datastructures import Graph
 def topological_sort(G: Graph) -> List[Any]:
     """Perform topological sorting on a directed graph.
 
+    Runs over node indices through G.neighbors_idx and G.node_at, so it is
+    O(V + E) on BaseGraph and CSRGraph, neither of which copy adjacency.
+    Indices left unused by removed nodes are skipped.
+
     Args:
-        G (Graph): The graph to be sorted.
+        G (Graph): The graph to be sorted, e.g. a WeightedGraph, an
+            UnweightedGraph or a CSRGraph snapshot.
 
     Returns:
         List[Any]: A list of nodes in topologically sorted order if the graph is acyclic,
@@ -18,14 +26,16 @@ def topological_sort(G: Graph) -> List[Any]:
 
     """
     n = G.num_nodes()
-    indegree = [0] * n
-    for u in G.get_nodes():
-        for v in G.get_edges(u):
-            indegree[G.get_idx(v)] += 1
+    node_indices = G.node_indices()
+    neighbors_idx = G.neighbors_idx
+    indegree = [0] * G.index_bound()
+    for u_idx in node_indices:
+        for v_idx in neighbors_idx(u_idx):
+            indegree[v_idx] += 1
 
     dq = deque()
 
-    for i in range(n):
+    for i in node_indices:
         if not indegree[i]:
             dq.append(i)
 
@@ -34,9 +44,7 @@ def topological_sort(G: Graph) -> List[Any]:
         u_idx = dq.popleft()
         top_sorted_idxs.append(u_idx)
 
-        u_val = G.get_nodes()[u_idx]
-        for v_val in G.get_edges(u_val):
-            v_idx = G.get_idx(v_val)
+        for v_idx in neighbors_idx(u_idx):
             indegree[v_idx] -= 1
 
             if not indegree[v_idx]:
@@ -45,92 +53,549 @@ def topological_sort(G: Graph) -> List[Any]:
     # Check for cycle
     if len(top_sorted_idxs) != n:
         return []
-    return [G.get_nodes()[idx] for idx in top_sorted_idxs]
+    return [G.node_at(idx) for idx in top_sorted_idxs]
+
+
+def topological_layers(G: Graph) -> List[List[Any]]:
+    """Split a directed graph into Kahn frontiers.
+
+    The first layer is every node without in-edges, and each next layer the
+    nodes whose in-edges all come from earlier layers, so the nodes of a
+    layer don't depend on each other and can be processed concurrently.
+    O(V + E) over node indices, like topological_sort.
+
+    Args:
+        G (Graph): The graph to be layered.
+
+    Returns:
+        List[List[Any]]: The layers in order if the graph is acyclic,
+            otherwise an empty list.
+
+    """
+    node_indices = G.node_indices()
+    neighbors_idx = G.neighbors_idx
+    indegree = [0] * G.index_bound()
+    for u_idx in node_indices:
+        for v_idx in neighbors_idx(u_idx):
+            indegree[v_idx] += 1
+
+    layer = [i for i in node_indices if not indegree[i]]
+    layers = []
+    seen = 0
+    while layer:
+        layers.append(layer)
+        seen += len(layer)
+        next_layer = []
+        for u_idx in layer:
+            for v_idx in neighbors_idx(u_idx):
+                indegree[v_idx] -= 1
+                if not indegree[v_idx]:
+                    next_layer.append(v_idx)
+        layer = next_layer
+
+    # Check for cycle
+    if seen != G.num_nodes():
+        return []
+    node_at = G.node_at
+    return [[node_at(idx) for idx in layer] for layer in layers]
+
+
+def _undirected(G: Graph) -> Tuple[array, array]:
+    """Return the undirected adjacency of G in CSR form over its node
+    indices.
+
+    Every edge u -> v is read as the undirected edge u - v, so the neighbors
+    of u are targets[offsets[u]:offsets[u + 1]]. An edge stored in both
+    directions appears once in each row, and a self loop once in its row.
+    """
+    bound = G.index_bound()
+    node_indices = G.node_indices()
+    neighbors_idx = G.neighbors_idx
+    offsets = array("i", [0]) * (bound + 1)
+    for u_idx in node_indices:
+        for v_idx in neighbors_idx(u_idx):
+            offsets[u_idx + 1] += 1
+            if v_idx != u_idx:
+                offsets[v_idx + 1] += 1
+    for i in range(bound):
+        offsets[i + 1] += offsets[i]
+
+    # both directions of a mirrored edge land in each row, drop the second
+    # copy while compacting
+    targets = array("i", [0]) * offsets[bound]
+    fill = offsets[:bound]
+    for u_idx in node_indices:
+        for v_idx in neighbors_idx(u_idx):
+            targets[fill[u_idx]] = v_idx
+            fill[u_idx] += 1
+            if v_idx != u_idx:
+                targets[fill[v_idx]] = u_idx
+                fill[v_idx] += 1
+
+    mark = [-1] * bound
+    end = 0
+    for u_idx in range(bound):
+        start, stop = offsets[u_idx], offsets[u_idx + 1]
+        offsets[u_idx] = end
+        for i in range(start, stop):
+            v_idx = targets[i]
+            if mark[v_idx] != u_idx:
+                mark[v_idx] = u_idx
+                targets[end] = v_idx
+                end += 1
+    offsets[bound] = end
+    del targets[end:]
+    return offsets, targets
+
 
+def _find(parent: List[int], u: int) -> int:
+    """Return the root of u in a union-find forest, halving the path."""
+    while parent[u] != u:
+        parent[u] = parent[parent[u]]
+        u = parent[u]
+    return u
 
-# detect cycle in undirected graph
-# TODO: add support for graph class
-def validTree(n: int, edges: List[List[int]]) -> bool:
+
+# detect cycle in undirected graph with union-find
+def validTree(n: Union[int, Graph], edges: Optional[Iterable[Sequence[int]]] = None) -> bool:
     """Determine if the given edges form a valid tree.
 
+    Edges are merged into a union-find forest as they are read, so edges can
+    be streamed from any iterable, and the check stops at the first edge that
+    closes a cycle. No recursion, so path-like graphs of any size are fine.
+
     Args:
-        n (int): The number of nodes.
-        edges (List[List[int]]): The edges of the graph.
+        n (Union[int, Graph]): The number of nodes, 0 to n - 1, or an
+            undirected graph, e.g. an UnweightedGraph or a CSRGraph snapshot.
+            An edge of a graph stored in both directions counts once.
+        edges (Optional[Iterable[Sequence[int]]], optional): The edges of the
+            graph when n is a number. A repeated edge, in either direction,
+            counts once. Defaults to None.
 
     Returns:
         bool: True if the edges form a valid tree, False otherwise.
 
     """
-    visited = set()
-    G = defaultdict(set)
-    for a, b in edges:
-        G[a].add(b)
-        G[b].add(a)
-
-    def dfs(u: int, parent: int) -> bool:
-        # print(u, parent)
-        visited.add(u)
-        for v in G[u]:
-            if v not in visited:
-                if not dfs(v, u):
-                    # print(v, u)
-                    return False
-            # cycle detected
-            # if you have visited a node already
-            # in your adjacency list that isnt your
-            # parent, then at some point another branch of
-            # dfs has visited that point
-            # meaning that there is a cycle
-            elif v != parent:
-                return False
+    if isinstance(n, Graph):
+        offsets, targets = _undirected(n)
+        indices = n.node_indices()
+        num_nodes = n.num_nodes()
+        edges = (
+            (u_idx, targets[i])
+            for u_idx in indices
+            for i in range(offsets[u_idx], offsets[u_idx + 1])
+            if targets[i] >= u_idx
+        )
+        parent = list(range(n.index_bound()))
+        # _undirected already has each edge once
+        merged = None
+    else:
+        num_nodes = n
+        parent = list(range(n))
+        # the edges merged so far, to tell repeats from cycles
+        merged = set()
 
-        return True
+    size = [1] * len(parent)
+    remaining = num_nodes - 1
+    for u, v in edges:
+        a, b = _find(parent, u), _find(parent, v)
+        if a == b:
+            if merged is not None and ((u, v) in merged or (v, u) in merged):
+                continue
+            # cycle detected, a and b are already connected
+            return False
+        if merged is not None:
+            merged.add((u, v))
+        if size[a] < size[b]:
+            a, b = b, a
+        parent[b] = a
+        size[a] += size[b]
+        remaining -= 1
 
-    if dfs(0, None):
-        # print(len(visited))
-        return len(visited) == n
-    return False
+    # n - 1 edges without a cycle connect all n nodes
+    return remaining == 0
 
 
-# TODO: add support for graph class
-def is_bipartite(g_l: dict) -> bool:
-    """Test if a given graph is bipartite using BFS.
+def is_bipartite(
+    g: Union[Graph, Dict[Any, Iterable[Any]]], witness: bool = False
+) -> Union[bool, Tuple[bool, Optional[List[Any]]]]:
+    """Test if a given undirected graph is bipartite using BFS.
+
+    The BFS runs over node indices with an explicit queue, in O(V + E). When
+    an edge joins two nodes of the same color, the two BFS tree paths from
+    its ends up to their common ancestor close an odd cycle, which proves the
+    graph isn't bipartite.
 
     Args:
-        g_l (dict): A dictionary of adjacency lists representing the graph.
+        g (Union[Graph, Dict[Any, Iterable[Any]]]): The graph, e.g. an
+            UnweightedGraph or a CSRGraph snapshot, or a dictionary of
+            adjacency lists. Edges are read as undirected.
+        witness (bool, optional): Also return an odd cycle when the graph
+            isn't bipartite. Defaults to False.
 
     Returns:
-        bool: True if the graph is bipartite, False otherwise.
+        Union[bool, Tuple[bool, Optional[List[Any]]]]: True if the graph is
+            bipartite, False otherwise. With witness, a tuple of that and the
+            nodes of an odd cycle in order, or None if the graph is
+            bipartite.
 
     """
-    node_colors = {k: None for k in g_l}
+    if not isinstance(g, Graph):
+        g_l = g
+        g = UnweightedGraph()
+        for node in g_l:
+            g.add_node(node)
+        g.add_edges_from((u, v) for u in g_l for v in g_l[u])
+    offsets, targets = _undirected(g)
+
+    color = [-1] * g.index_bound()
+    parent = [-1] * g.index_bound()
+    depth = [0] * g.index_bound()
+    cycle = None
     # perform BFS for each connected component
-    for starting_node in g_l:
-        if node_colors[starting_node] is not None:
+    for root in g.node_indices():
+        if color[root] >= 0:
+            continue
+        color[root] = 0
+        queue = deque([root])
+        while queue and cycle is None:
+            u = queue.popleft()
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if color[v] < 0:
+                    color[v] = color[u] ^ 1
+                    parent[v] = u
+                    depth[v] = depth[u] + 1
+                    queue.append(v)
+                elif color[v] == color[u]:
+                    cycle = (u, v)
+                    break
+        if cycle is not None:
+            break
+
+    if not witness:
+        return cycle is None
+    if cycle is None:
+        return True, None
+    # same color means same BFS depth, so walk both ends up in step
+    u, v = cycle
+    up, down = [], []
+    while u != v:
+        up.append(u)
+        down.append(v)
+        u, v = parent[u], parent[v]
+    up.append(u)
+    up.extend(reversed(down))
+    return False, [g.node_at(idx) for idx in up]
+
+
+# Tarjan's algorithm, with an explicit stack instead of recursion
+def strongly_connected_components(G: Graph) -> Tuple[int, List[int]]:
+    """Find the strongly connected components of a directed graph.
+
+    Iterative Tarjan over node indices through G.neighbors_idx, so it is
+    O(V + E) and doesn't hit the recursion limit on long paths. Components
+    are numbered in topological order: every edge goes from a component to
+    itself or to a component with a larger id.
+
+    Args:
+        G (Graph): The directed graph, e.g. a WeightedGraph, an
+            UnweightedGraph or a CSRGraph snapshot.
+
+    Returns:
+        Tuple[int, List[int]]: The number of components, and the component
+            id of every node index, -1 for indices left unused by removed
+            nodes.
+
+    """
+    bound = G.index_bound()
+    neighbors_idx = G.neighbors_idx
+    order = [-1] * bound
+    low = [0] * bound
+    comp = [-1] * bound
+    stack = []
+    count = 0
+    counter = 0
+
+    for root in G.node_indices():
+        if order[root] >= 0:
             continue
-        # see if any neighbor is already set to try to set the color
-        # correctly initially
-        if g_l[starting_node]:
-            for neighbor in g_l[starting_node]:
-                if node_colors[neighbor] is not None:
-                    node_colors[starting_node] = node_colors[neighbor] ^ 1
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        # (node, iterator over its remaining neighbors) for the DFS path
+        work = [(root, iter(neighbors_idx(root)))]
+        while work:
+            u, neighbors = work[-1]
+            for v in neighbors:
+                if order[v] < 0:
+                    order[v] = low[v] = counter
+                    counter += 1
+                    stack.append(v)
+                    work.append((v, iter(neighbors_idx(v))))
                     break
-        # if still not set, then set it to color 0
-        if node_colors[starting_node] is None:
-            node_colors[starting_node] = 0
-        queue = deque([starting_node])
-        # BFS to check if the graph is bipartite
-        # dont need to check for visited nodes
-        # as they are being colored
-        while queue:
-            node = queue.popleft()
-            for neighbor in g_l[node]:
-                if node_colors[neighbor] is None:
-                    node_colors[neighbor] = node_colors[node] ^ 1
-                    queue.append(neighbor)
-                elif node_colors[neighbor] == node_colors[node]:
-                    return False
-    return True
-
-
-# TODO: add strongly connected components
+                # visited without a component yet means v is still on the
+                # stack, so it is in the component of u
+                if comp[v] < 0 and order[v] < low[u]:
+                    low[u] = order[v]
+            else:
+                work.pop()
+                if low[u] == order[u]:
+                    while True:
+                        w = stack.pop()
+                        comp[w] = count
+                        if w == u:
+                            break
+                    count += 1
+                if work:
+                    parent = work[-1][0]
+                    if low[u] < low[parent]:
+                        low[parent] = low[u]
+
+    # Tarjan finishes components in reverse topological order
+    last = count - 1
+    return count, [last - c if c >= 0 else -1 for c in comp]
+
+
+def condensation(G: Graph) -> Tuple[CSRGraph, List[int]]:
+    """Build the condensation of a directed graph, the DAG with one node per
+    strongly connected component and an edge between two components if any
+    edge of G joins them.
+
+    Since components are numbered in topological order, range(count) is a
+    topological order of the condensation, so cyclic graphs can still be
+    scheduled component by component in O(V + E).
+
+    Args:
+        G (Graph): The directed graph.
+
+    Returns:
+        Tuple[CSRGraph, List[int]]: The condensation as an unweighted
+            CSRGraph whose nodes are the component ids 0..count - 1, and the
+            component id of every node index of G, see
+            strongly_connected_components.
+
+    """
+    count, comp = strongly_connected_components(G)
+    neighbors_idx = G.neighbors_idx
+
+    # bucket the node indices by component
+    start = [0] * (count + 1)
+    for c in comp:
+        if c >= 0:
+            start[c + 1] += 1
+    for c in range(count):
+        start[c + 1] += start[c]
+    members = [0] * start[count]
+    fill = start[:count]
+    for idx, c in enumerate(comp):
+        if c >= 0:
+            members[fill[c]] = idx
+            fill[c] += 1
+
+    offsets = array("i", [0])
+    targets = array("i")
+    # seen[d] == c if the edge c -> d is already in targets
+    seen = [-1] * count
+    for c in range(count):
+        seen[c] = c
+        for i in range(start[c], start[c + 1]):
+            for v_idx in neighbors_idx(members[i]):
+                d = comp[v_idx]
+                if seen[d] != c:
+                    seen[d] = c
+                    targets.append(d)
+        offsets.append(len(targets))
+    return CSRGraph(range(count), offsets, targets), comp
+
+
+# Pearce-Kelly algorithm
+class DynamicTopologicalOrder(Generic[NODE_T]):
+    """A topological order of a DAG kept up to date as edges are added.
+
+    Uses the Pearce-Kelly algorithm. Adding an edge u -> v that already goes
+    forward in the order costs O(1). Otherwise only the affected region, the
+    nodes positioned between v and u, is searched: forward from v for nodes
+    reachable from it and backward from u for nodes reaching it. If u is
+    reachable from v the edge would close a cycle and is rejected before
+    anything changes; otherwise the two sets of nodes swap places, keeping
+    their relative orders, within the positions they already hold.
+
+    The class keeps its own index of in-edges, so edges and nodes must only
+    be added or removed through it, never on the wrapped graph directly.
+    Nodes can't be removed, which could renumber them. The graph can
+    otherwise be read directly.
+    """
+
+    def __init__(self, graph: Optional[UnweightedGraph[NODE_T]] = None):
+        """Wrap a graph, computing its order once with topological_sort.
+
+        Args:
+            graph (Optional[UnweightedGraph[NODE_T]], optional): The DAG to
+                maintain. Defaults to a new, empty UnweightedGraph.
+
+        Raises:
+            CycleError: If graph has a cycle.
+
+        """
+        self.graph: UnweightedGraph[NODE_T] = UnweightedGraph() if graph is None else graph
+        g = self.graph
+        order = topological_sort(g)
+        if len(order) != g.num_nodes():
+            raise CycleError("Graph has a cycle")
+
+        bound = g.index_bound()
+        # _order is the node indices by position, _position its inverse with
+        # -1 for indices left unused by removed nodes
+        self._order: List[int] = [g.get_idx(node) for node in order]
+        self._position: List[int] = [-1] * bound
+        for pos, idx in enumerate(self._order):
+            self._position[idx] = pos
+        # in-edges by node index, for the backward search
+        self._predecessors: List[List[int]] = [[] for _ in range(bound)]
+        for u_idx in g.node_indices():
+            for v_idx in g.neighbors_idx(u_idx):
+                self._predecessors[v_idx].append(u_idx)
+
+    def add_node(self, node: NODE_T) -> bool:
+        """Add a node, placed last in the order.
+
+        Args:
+            node (NODE_T): The node to add.
+
+        Returns:
+            bool: True if the node was added, False if it already exists.
+
+        """
+        if not self.graph.add_node(node):
+            return False
+        idx = self.graph.get_idx(node)
+        self._position.extend([-1] * (idx + 1 - len(self._position)))
+        self._predecessors.extend([] for _ in range(idx + 1 - len(self._predecessors)))
+        self._position[idx] = len(self._order)
+        self._order.append(idx)
+        return True
+
+    def add_edge(self, source: NODE_T, dest: NODE_T) -> None:
+        """Add the edge source -> dest, reordering the affected region.
+
+        Args:
+            source (NODE_T): The source node, added if new.
+            dest (NODE_T): The destination node, added if new.
+
+        Raises:
+            CycleError: If the edge would create a cycle, in which case
+                neither the graph nor the order is changed.
+
+        """
+        if source == dest:
+            raise CycleError(f"Edge {source} -> {dest} is a self loop")
+        g = self.graph
+        if g.has_node(source) and g.has_node(dest):
+            if g.has_edge(source, dest):
+                return
+        else:
+            # a new node has no edges yet, so this edge can't close a cycle
+            # and the search below can't fail
+            self.add_node(source)
+            self.add_node(dest)
+
+        u_idx, v_idx = g.get_idx(source), g.get_idx(dest)
+        position = self._position
+        lower, upper = position[v_idx], position[u_idx]
+        if upper < lower:
+            forward = backward = None
+        else:
+            forward = self._search_forward(v_idx, upper)
+            if forward is None:
+                raise CycleError(f"Edge {source} -> {dest} would create a cycle")
+            backward = self._search_backward(u_idx, lower)
+
+        g.add_edge(source, dest)
+        self._predecessors[v_idx].append(u_idx)
+        if forward is not None:
+            self._reorder(backward, forward)
+
+    def remove_edge(self, source: NODE_T, dest: NODE_T) -> None:
+        """Remove the edge source -> dest. The order stays valid as it is.
+
+        Args:
+            source (NODE_T): The source node.
+            dest (NODE_T): The destination node.
+
+        Raises:
+            NodeNotFoundError: If either node doesn't exist.
+            EdgeNotFoundError: If the edge doesn't exist.
+
+        """
+        g = self.graph
+        g.remove_edge(source, dest)
+        self._predecessors[g.get_idx(dest)].remove(g.get_idx(source))
+
+    def _search_forward(self, start: int, upper: int) -> Optional[List[int]]:
+        """Return the nodes reachable from start positioned before upper, or
+        None if the node at upper is reachable."""
+        position = self._position
+        neighbors_idx = self.graph.neighbors_idx
+        seen = {start}
+        stack = [start]
+        while stack:
+            for w in neighbors_idx(stack.pop()):
+                pos = position[w]
+                if pos == upper:
+                    return None
+                if pos < upper and w not in seen:
+                    seen.add(w)
+                    stack.append(w)
+        return list(seen)
+
+    def _search_backward(self, start: int, lower: int) -> List[int]:
+        """Return the nodes reaching start positioned after lower."""
+        position = self._position
+        predecessors = self._predecessors
+        seen = {start}
+        stack = [start]
+        while stack:
+            for w in predecessors[stack.pop()]:
+                if position[w] > lower and w not in seen:
+                    seen.add(w)
+                    stack.append(w)
+        return list(seen)
+
+    def _reorder(self, backward: List[int], forward: List[int]) -> None:
+        """Move the backward nodes before the forward ones, within the
+        positions they hold, keeping the relative order of each set."""
+        position, order = self._position, self._order
+        backward.sort(key=position.__getitem__)
+        forward.sort(key=position.__getitem__)
+        moved = backward + forward
+        slots = sorted(position[idx] for idx in moved)
+        for pos, idx in zip(slots, moved):
+            position[idx] = pos
+            order[pos] = idx
+
+    def order(self) -> List[NODE_T]:
+        """Return the nodes in topological order, without recomputing it.
+
+        Returns:
+            List[NODE_T]: The nodes, every edge going from an earlier node to
+                a later one.
+
+        """
+        node_at = self.graph.node_at
+        return [node_at(idx) for idx in self._order]
+
+    def position(self, node: NODE_T) -> int:
+        """Return the position of a node in the order.
+
+        Args:
+            node (NODE_T): The node.
+
+        Returns:
+            int: Its index in order().
+
+        Raises:
+            NodeNotFoundError: If the node doesn't exist.
+
+        """
+        return self._position[self.graph.get_idx(node)]
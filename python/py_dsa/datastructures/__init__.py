@@ -1,20 +1,76 @@
-"""Import all functions and classes in datastructures as top level modules"""
+"""Expose all functions and classes in datastructures as top level names.
 
-from .bloom_filter import *  # noqa: F401,F403
-from .bounded_blocking_queue import *  # noqa: F401,F403
-from .circular_queue import *  # noqa: F401,F403
-from .cms import *  # noqa: F401,F403
-from .djs import *  # noqa: F401,F403
-from .lfu_cache import *  # noqa: F401,F403
-from .lru_cache import *  # noqa: F401,F403
-from .max_stack import *  # noqa: F401,F403
-from .open_addr_hash_map import *  # noqa: F401,F403
-from .skip_list import *  # noqa: F401,F403
-from .streaming_median import *  # noqa: F401,F403
-# from .sorted_linked_list import *  # noqa: F401,F403
+Each submodule is only imported the first time one of its names is accessed
+(PEP 562), so using one data structure doesn't pay for the imports of the rest.
+"""
 
-# from .Treap import * # noqa: F401,F403
-# from .TreapMap import * # noqa: F401,F403
-from .trie import *  # noqa: F401,F403
-from .graph import *  # noqa: F401,F403
-from .doubly_linked_list import *  # noqa: F401,F403
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "BloomFilter": "bloom_filter",
+        "BoundedBlockingQueue": "bounded_blocking_queue",
+        "CircularQueue": "circular_queue",
+        "CountMinSketch": "cms",
+        "DisjointSet": "djs",
+        "LFUCache": "lfu_cache",
+        "lfu_cache": "lfu_cache",
+        "Node": "lru_cache",
+        "LRUCache": "lru_cache",
+        "lru_cache": "lru_cache",
+        "MaxStack": "max_stack",
+        "HashMap": "open_addr_hash_map",
+        "SkipNode": "skip_list",
+        "SkipList": "skip_list",
+        "StreamingMedian": "streaming_median",
+        # "SortedLinkedList": "sorted_linked_list",
+        # "Treap": "Treap",
+        # "TreapMap": "TreapMap",
+        "TrieNode": "trie",
+        "Trie": "trie",
+        "GraphError": "graph",
+        "NodeNotFoundError": "graph",
+        "EdgeNotFoundError": "graph",
+        "FrozenGraphError": "graph",
+        "CycleError": "graph",
+        "Graph": "graph",
+        "BaseGraph": "graph",
+        "WeightedGraph": "graph",
+        "UnweightedGraph": "graph",
+        "CSRGraph": "graph",
+        "MatchingGraph": "graph",
+        "save_graph": "graph_io",
+        "load_graph": "graph_io",
+        "EdgeListReader": "graph_io",
+        "read_edgelist": "graph_io",
+        "AbstractNode": "doubly_linked_list",
+        "DoublyLinkedList": "doubly_linked_list",
+        # type variables, from the module that bound them last under the
+        # old star imports
+        "KEY_T": "lru_cache",
+        "VAL_T": "lru_cache",
+        "NODE_T": "graph",
+        "T": "doubly_linked_list",
+        "NodeType": "doubly_linked_list",
+    },
+)
+
+if TYPE_CHECKING:
+    from .bloom_filter import *  # noqa: F401,F403
+    from .bounded_blocking_queue import *  # noqa: F401,F403
+    from .circular_queue import *  # noqa: F401,F403
+    from .cms import *  # noqa: F401,F403
+    from .djs import *  # noqa: F401,F403
+    from .lfu_cache import *  # noqa: F401,F403
+    from .lru_cache import *  # noqa: F401,F403
+    from .max_stack import *  # noqa: F401,F403
+    from .open_addr_hash_map import *  # noqa: F401,F403
+    from .skip_list import *  # noqa: F401,F403
+    from .streaming_median import *  # noqa: F401,F403
+    from .trie import *  # noqa: F401,F403
+    from .graph import *  # noqa: F401,F403
+    from .graph_io import *  # noqa: F401,F403
+    from .doubly_linked_list import *  # noqa: F401,F403
@@ -1,14 +1,43 @@
-import matplotlib
-
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import networkx as nx
+from array import array
 from collections import defaultdict
+from itertools import chain, repeat
+from operator import itemgetter
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List, Dict, Iterator, Set
+from types import MappingProxyType
+from typing import (
+    Any,
+    TypeVar,
+    Generic,
+    List,
+    Dict,
+    Iterable,
+    Iterator,
+    KeysView,
+    Mapping,
+    Set,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from py_dsa._optional import require
 
 NODE_T = TypeVar("NODE_T")
 
+# shared, never mutated, row for nodes without out-edges so reads don't
+# insert empty rows into the adjacency defaultdicts
+_NO_EDGES: Dict = {}
+
+
+class _Tombstone:
+    """Marks the slot of a removed node in BaseGraph._nodes."""
+
+    def __repr__(self) -> str:
+        return "<removed node>"
+
+
+_TOMBSTONE = _Tombstone()
+
 
 class GraphError(Exception):
     """Base exception for graph operations."""
@@ -28,6 +57,19 @@ class EdgeNotFoundError(GraphError):
     pass
 
 
+class FrozenGraphError(GraphError):
+    """Raised when attempting to modify a frozen graph snapshot."""
+
+    pass
+
+
+class CycleError(GraphError):
+    """Raised when adding an edge would create a cycle in a graph that must
+    stay acyclic."""
+
+    pass
+
+
 class Graph(ABC, Generic[NODE_T]):
     """ABC for a graph type in this library. Can make a graph
     undirected or directed simply by adding edges both ways.
@@ -57,6 +99,65 @@ class Graph(ABC, Generic[NODE_T]):
     def num_nodes(self) -> int:  # noqa: D102
         pass
 
+    # Index-native accessors used by the algorithms. These defaults only rely
+    # on the abstract methods above, subclasses override them with versions
+    # that don't copy or re-hash anything.
+
+    def node_at(self, idx: int) -> NODE_T:
+        """Return the node with the given index.
+
+        Args:
+            idx (int): The node index.
+
+        Returns:
+            NODE_T: The node.
+
+        """
+        return list(self.get_nodes())[idx]
+
+    def neighbors_idx(self, idx: int) -> Iterable[int]:
+        """Return the indices of the out-neighbors of the node with index idx.
+
+        Args:
+            idx (int): The node index.
+
+        Returns:
+            Iterable[int]: The neighbor indices.
+
+        """
+        return [self.get_idx(v) for v in self.get_edges(self.node_at(idx))]
+
+    def degree(self, node: NODE_T) -> int:
+        """Return the out-degree of a node.
+
+        Args:
+            node (NODE_T): The node.
+
+        Returns:
+            int: The number of out-edges of the node.
+
+        """
+        return len(self.get_edges(node))
+
+    def index_bound(self) -> int:
+        """Return an upper bound (exclusive) on node indices, to size arrays
+        indexed by node index. Equals num_nodes unless indices have gaps.
+
+        Returns:
+            int: One more than the largest node index.
+
+        """
+        return self.num_nodes()
+
+    def node_indices(self) -> Iterable[int]:
+        """Return the indices of all nodes in the graph, in increasing order.
+
+        Returns:
+            Iterable[int]: The node indices.
+
+        """
+        return range(self.num_nodes())
+
 
 class BaseGraph(Graph[NODE_T]):
     """Base implementation providing common node management functionality.
@@ -64,12 +165,26 @@ class BaseGraph(Graph[NODE_T]):
     This class handles the boilerplate of node indexing, storage, and basic
     validation, allowing subclasses to focus on their specific edge storage
     and retrieval logic.
+
+    Removed nodes leave a tombstone in their index slot, so the indices of
+    the remaining nodes stay valid. Once more than compact_threshold of the
+    slots are tombstones the graph is compacted, which renumbers the live
+    nodes densely (see compact). Set compact_threshold to None to only
+    compact on demand.
     """
 
+    # whether rows of _adjacency are dicts of edge weights
+    _weighted = False
+
     def __init__(self):
         self._nodes: List[NODE_T] = []
         self._node_to_idx: Dict[NODE_T, int] = {}
         self._idx_counter = 0
+        self._num_tombstones = 0
+        # in-edges of every node, only built on the first remove_node so
+        # graphs that never remove nodes don't pay for it
+        self._predecessors: Optional[Dict[NODE_T, Dict[NODE_T, None]]] = None
+        self.compact_threshold: Optional[float] = 0.5
 
     def add_node(self, node: NODE_T) -> bool:
         """Add a node to the graph.
@@ -102,6 +217,8 @@ class BaseGraph(Graph[NODE_T]):
             List[NODE_T]: A list of nodes in the graph.
 
         """
+        if self._num_tombstones:
+            return [node for node in self._nodes if node is not _TOMBSTONE]
         return self._nodes.copy()
 
     def get_idx(self, node: NODE_T) -> int:
@@ -127,9 +244,31 @@ class BaseGraph(Graph[NODE_T]):
         Returns:
             int: The number of nodes in the graph.
 
+        """
+        return len(self._nodes) - self._num_tombstones
+
+    def index_bound(self) -> int:
+        """Return an upper bound (exclusive) on node indices. Larger than
+        num_nodes while removed nodes leave tombstoned indices behind.
+
+        Returns:
+            int: One more than the largest node index.
+
         """
         return len(self._nodes)
 
+    def node_indices(self) -> Iterable[int]:
+        """Return the indices of all nodes in the graph, in increasing order,
+        skipping tombstoned indices.
+
+        Returns:
+            Iterable[int]: The node indices.
+
+        """
+        if self._num_tombstones:
+            return [i for i, node in enumerate(self._nodes) if node is not _TOMBSTONE]
+        return range(len(self._nodes))
+
     def has_node(self, node: NODE_T) -> bool:
         """Check if a node exists in the graph.
 
@@ -156,10 +295,266 @@ class BaseGraph(Graph[NODE_T]):
             if not self.has_node(node):
                 raise NodeNotFoundError(f"Node {node} not found in graph")
 
+    def _intern_nodes(self, nodes: Iterable[NODE_T]) -> None:
+        """Add every node not in the graph yet, in order of first appearance,
+        in a single pass.
+
+        Args:
+            nodes (Iterable[NODE_T]): The nodes, duplicates are allowed.
+
+        Raises:
+            TypeError: If any node is None, in which case no node is added.
+
+        """
+        node_to_idx = self._node_to_idx
+        new_nodes = [node for node in dict.fromkeys(nodes) if node not in node_to_idx]
+        if any(node is None for node in new_nodes):
+            raise TypeError("Node cannot be None")
+        start = self._idx_counter
+        node_to_idx.update(zip(new_nodes, range(start, start + len(new_nodes))))
+        self._nodes.extend(new_nodes)
+        self._idx_counter += len(new_nodes)
+
+    def _add_edges_from_arrays(self, src: Any, dst: Any, weights: Any) -> None:
+        """Shared implementation of add_edges_from_arrays.
+
+        Distinct nodes are found with np.unique and interned in one pass, then
+        the edges are grouped by source with a stable argsort so each adjacency
+        row is filled by a single dict.update. Later duplicates of an edge win,
+        as with add_edge.
+        """
+        np = require("numpy", "add_edges_from_arrays", "numpy")
+        src, dst = np.asarray(src), np.asarray(dst)
+        if src.ndim != 1 or src.shape != dst.shape:
+            raise ValueError("src and dst must be 1-D arrays of the same length")
+        # column_stack would coerce both to one dtype, e.g. int nodes to float
+        if src.dtype.kind != dst.dtype.kind:
+            raise TypeError(
+                f"src and dst must hold the same kind of nodes, got {src.dtype} and {dst.dtype}"
+            )
+        if weights is not None:
+            weights = np.asarray(weights)
+            if weights.shape != src.shape:
+                raise ValueError("weights must have one entry per edge")
+            if not (
+                np.issubdtype(weights.dtype, np.integer)
+                or np.issubdtype(weights.dtype, np.floating)
+            ):
+                raise TypeError("Edge weight must be a number")
+        if not len(src):
+            return
+
+        # intern the distinct nodes in order of first appearance, interleaving
+        # src and dst so ids match what an add_edge loop would assign
+        interleaved = np.column_stack((src, dst)).ravel()
+        uniq, first_seen, inverse = np.unique(
+            interleaved, return_index=True, return_inverse=True
+        )
+        self._intern_nodes(uniq[np.argsort(first_seen)].tolist())
+        node_to_idx = self._node_to_idx
+        uniq_idx = np.fromiter(
+            map(node_to_idx.__getitem__, uniq.tolist()), dtype=np.int64, count=len(uniq)
+        )
+        src_idx = uniq_idx[inverse.reshape(-1)[0::2]]
+        order = np.argsort(src_idx, kind="stable")
+        sorted_idx = src_idx[order]
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_idx)) + 1))
+        ends = chain(starts[1:].tolist(), [len(src)])
+        dsts = dst[order].tolist()
+        ws = None if weights is None else weights[order].tolist()
+
+        nodes, adjacency = self._nodes, self._adjacency
+        for u, start, end in zip(sorted_idx[starts].tolist(), starts.tolist(), ends):
+            row, targets = adjacency[nodes[u]], dsts[start:end]
+            if ws is None:
+                row.update(dict.fromkeys(targets))
+            else:
+                row.update(zip(targets, ws[start:end]))
+            self._link_predecessors(nodes[u], targets)
+
+    def node_at(self, idx: int) -> NODE_T:
+        """Return the node with the given index.
+
+        Args:
+            idx (int): The node index, as returned by get_idx.
+
+        Returns:
+            NODE_T: The node.
+
+        Raises:
+            NodeNotFoundError: If no node has this index.
+
+        """
+        if not 0 <= idx < len(self._nodes) or self._nodes[idx] is _TOMBSTONE:
+            raise NodeNotFoundError(f"No node with index {idx} in graph")
+        return self._nodes[idx]
+
+    def neighbors_idx(self, idx: int) -> Iterator[int]:
+        """Iterate over the indices of the out-neighbors of a node without
+        copying its adjacency.
+
+        Args:
+            idx (int): The node index, as returned by get_idx.
+
+        Returns:
+            Iterator[int]: The neighbor indices.
+
+        Raises:
+            NodeNotFoundError: If no node has this index.
+
+        """
+        row = self._adjacency.get(self.node_at(idx), _NO_EDGES)
+        return map(self._node_to_idx.__getitem__, row)
+
+    def degree(self, node: NODE_T) -> int:
+        """Return the out-degree of a node.
+
+        Args:
+            node (NODE_T): The node.
+
+        Returns:
+            int: The number of out-edges of the node.
+
+        Raises:
+            NodeNotFoundError: If the node doesn't exist.
+
+        """
+        self._validate_nodes_exist(node)
+        return len(self._adjacency.get(node, _NO_EDGES))
+
+    def _link_predecessors(self, source: NODE_T, dests: Iterable[NODE_T]) -> None:
+        """Record new edges from source in the predecessor index, if built."""
+        if self._predecessors is not None:
+            predecessors = self._predecessors
+            for dest in dests:
+                predecessors[dest][source] = None
+
+    def _build_predecessors(self) -> Dict[NODE_T, Dict[NODE_T, None]]:
+        """Build the predecessor index from the adjacency, once."""
+        if self._predecessors is None:
+            predecessors: Dict[NODE_T, Dict[NODE_T, None]] = defaultdict(dict)
+            for source, row in self._adjacency.items():
+                for dest in row:
+                    predecessors[dest][source] = None
+            self._predecessors = predecessors
+        return self._predecessors
+
+    def remove_edge(self, source: NODE_T, dest: NODE_T) -> None:
+        """Remove the edge from source to dest.
+
+        Args:
+            source (NODE_T): The source node.
+            dest (NODE_T): The destination node.
+
+        Raises:
+            NodeNotFoundError: If either node doesn't exist.
+            EdgeNotFoundError: If the edge doesn't exist.
+
+        """
+        self._validate_nodes_exist(source, dest)
+        row = self._adjacency.get(source, _NO_EDGES)
+        if dest not in row:
+            raise EdgeNotFoundError(f"No edge from {source} to {dest}")
+        del row[dest]
+        if self._predecessors is not None:
+            del self._predecessors[dest][source]
+
+    def remove_node(self, node: NODE_T) -> None:
+        """Remove a node and all edges into and out of it.
+
+        The node's index becomes a tombstone, so the indices of the other
+        nodes don't change, unless this removal pushes the number of
+        tombstones past compact_threshold and triggers compact. The first
+        removal builds an index of in-edges in O(V + E), after which a removal
+        costs O(degree) and keeping the index up to date costs O(1) per added
+        edge.
+
+        Args:
+            node (NODE_T): The node to remove.
+
+        Raises:
+            NodeNotFoundError: If the node doesn't exist.
+
+        """
+        self._validate_nodes_exist(node)
+        predecessors = self._build_predecessors()
+        adjacency = self._adjacency
+
+        for source in predecessors.pop(node, _NO_EDGES):
+            del adjacency[source][node]
+        for dest in adjacency.pop(node, _NO_EDGES):
+            if dest != node:
+                del predecessors[dest][node]
+
+        self._nodes[self._node_to_idx.pop(node)] = _TOMBSTONE
+        self._num_tombstones += 1
+        if (
+            self.compact_threshold is not None
+            and self._num_tombstones > self.compact_threshold * len(self._nodes)
+        ):
+            self.compact()
+
+    def compact(self) -> List[int]:
+        """Renumber the live nodes densely, in their current order, dropping
+        the tombstones left by remove_node.
+
+        Returns:
+            List[int]: Maps every old index to its new index, or -1 for
+                removed nodes, for callers that hold on to indices.
+
+        """
+        remap = [-1] * len(self._nodes)
+        live = []
+        for old_idx, node in enumerate(self._nodes):
+            if node is not _TOMBSTONE:
+                remap[old_idx] = len(live)
+                live.append(node)
+        self._nodes = live
+        self._node_to_idx = {node: i for i, node in enumerate(live)}
+        self._idx_counter = len(live)
+        self._num_tombstones = 0
+        return remap
+
+    def to_csr(self) -> "CSRGraph[NODE_T]":
+        """Build an immutable compressed sparse row snapshot of the graph.
+
+        Node ids in the snapshot are the ids assigned by get_idx. If nodes were
+        removed, the snapshot skips their slots and numbers the live nodes
+        densely in their current order, as compact would, but this graph and
+        its ids are left untouched. Later changes to this graph are not
+        reflected in the snapshot.
+
+        Returns:
+            CSRGraph[NODE_T]: The frozen snapshot.
+
+        """
+        nodes = self._nodes
+        node_to_idx = self._node_to_idx
+        if self._num_tombstones:
+            nodes = [node for node in nodes if node is not _TOMBSTONE]
+            node_to_idx = {node: i for i, node in enumerate(nodes)}
+        offsets = array("i", [0])
+        targets = array("i")
+        weights = array("d") if self._weighted else None
+        for node in nodes:
+            row = self._adjacency.get(node)
+            if row:
+                targets.extend(map(node_to_idx.__getitem__, row))
+                if weights is not None:
+                    weights.extend(row.values())
+            offsets.append(len(targets))
+        return CSRGraph(nodes, offsets, targets, weights)
+
+    def freeze(self) -> "CSRGraph[NODE_T]":
+        """Alias of to_csr."""
+        return self.to_csr()
+
 
 class WeightedGraph(BaseGraph[NODE_T]):
     """A graph with weighted edges stored as adjacency dictionaries."""
 
+    _weighted = True
+
     def __init__(self):
         super().__init__()
         self._adjacency: Dict[NODE_T, Dict[NODE_T, float]] = defaultdict(dict)
@@ -182,6 +577,62 @@ class WeightedGraph(BaseGraph[NODE_T]):
         self.add_node(source)
         self.add_node(dest)
         self._adjacency[source][dest] = weight
+        if self._predecessors is not None:
+            self._predecessors[dest][source] = None
+
+    def add_edges_from(
+        self,
+        edges: Iterable[Union[Tuple[NODE_T, NODE_T], Tuple[NODE_T, NODE_T, float]]],
+        weight: float = 1.0,
+    ) -> None:
+        """Add many edges at once.
+
+        Much faster than calling add_edge per edge: all weights are validated
+        before the graph is touched and new nodes are interned in one pass.
+        The whole iterable is buffered, so feed very large inputs in chunks.
+
+        Args:
+            edges (Iterable): (source, dest) or (source, dest, weight) tuples.
+            weight (float, optional): The weight of edges given without one.
+                Defaults to 1.0.
+
+        Raises:
+            TypeError: If any weight is not a number or any node is None, in
+                which case no edge is added.
+
+        """
+        edges = [edge if len(edge) == 3 else (*edge, weight) for edge in edges]
+        if not all(map(isinstance, map(itemgetter(2), edges), repeat((int, float)))):
+            raise TypeError("Edge weight must be a number")
+        self._intern_nodes(chain.from_iterable(map(itemgetter(0, 1), edges)))
+
+        adjacency = self._adjacency
+        for source, dest, w in edges:
+            adjacency[source][dest] = w
+        if self._predecessors is not None:
+            for source, dest, _ in edges:
+                self._predecessors[dest][source] = None
+
+    def add_edges_from_arrays(self, src: Any, dst: Any, weights: Any = None) -> None:
+        """Add many edges at once from NumPy arrays.
+
+        Args:
+            src (np.ndarray): 1-D array of source nodes.
+            dst (np.ndarray): 1-D array of destination nodes, same length as src.
+            weights (np.ndarray, optional): 1-D array of integer or float edge
+                weights. Defaults to 1.0 for every edge.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If the arrays have mismatched shapes.
+            TypeError: If weights is not a numeric array, src and dst have
+                different dtype kinds (e.g. int and float) or any node is None.
+
+        """
+        if weights is None:
+            np = require("numpy", "add_edges_from_arrays", "numpy")
+            weights = np.ones(len(src))
+        self._add_edges_from_arrays(src, dst, weights)
 
     def get_edges(self, source: NODE_T) -> Dict[NODE_T, float]:
         """Get the edges connected to a given source node.
@@ -197,7 +648,27 @@ class WeightedGraph(BaseGraph[NODE_T]):
 
         """
         self._validate_nodes_exist(source)
-        return self._adjacency[source].copy()
+        return dict(self._adjacency.get(source, _NO_EDGES))
+
+    def edges_view(self, source: NODE_T) -> Mapping[NODE_T, float]:
+        """Get the edges connected to a given source node without copying them.
+
+        Args:
+            source (NODE_T): The source node.
+
+        Returns:
+            Mapping[NODE_T, float]: A read-only view of the edges connected to
+                the source, mapping destination to weight. The view is live, it
+                reflects edges added after the call, so don't change the edges
+                of source while iterating it.
+
+        Raises:
+            NodeNotFoundError: If the source node doesn't exist.
+
+        """
+        self._validate_nodes_exist(source)
+        # the node's own row, even if empty, so the view sees later edges
+        return MappingProxyType(self._adjacency[source])
 
     def get_edge_weight(self, source: NODE_T, dest: NODE_T) -> float:
         """Get the weight of an edge between two nodes.
@@ -215,17 +686,22 @@ class WeightedGraph(BaseGraph[NODE_T]):
 
         """
         self._validate_nodes_exist(source, dest)
-        if dest not in self._adjacency[source]:
+        row = self._adjacency.get(source, _NO_EDGES)
+        if dest not in row:
             raise EdgeNotFoundError(f"No edge from {source} to {dest}")
-        return self._adjacency[source][dest]
+        return row[dest]
 
 
 class UnweightedGraph(BaseGraph[NODE_T]):
-    """A graph with unweighted edges stored as adjacency sets."""
+    """A graph with unweighted edges stored as adjacency sets.
+
+    Each row is a dict with None values, used as an insertion ordered set so
+    edges_view can hand out its keys view instead of a copy.
+    """
 
     def __init__(self):
         super().__init__()
-        self._adjacency: Dict[NODE_T, Set[NODE_T]] = defaultdict(set)
+        self._adjacency: Dict[NODE_T, Dict[NODE_T, None]] = defaultdict(dict)
 
     def add_edge(self, source: NODE_T, dest: NODE_T) -> None:
         """Add an edge between two nodes.
@@ -237,7 +713,49 @@ class UnweightedGraph(BaseGraph[NODE_T]):
         """
         self.add_node(source)
         self.add_node(dest)
-        self._adjacency[source].add(dest)
+        self._adjacency[source][dest] = None
+        if self._predecessors is not None:
+            self._predecessors[dest][source] = None
+
+    def add_edges_from(self, edges: Iterable[Tuple[NODE_T, NODE_T]]) -> None:
+        """Add many edges at once.
+
+        Much faster than calling add_edge per edge: new nodes are interned in
+        one pass before any edge is stored. The whole iterable is buffered, so
+        feed very large inputs in chunks.
+
+        Args:
+            edges (Iterable[Tuple[NODE_T, NODE_T]]): (source, dest) tuples.
+
+        Raises:
+            TypeError: If any node is None, in which case no edge is added.
+
+        """
+        edges = list(edges)
+        self._intern_nodes(chain.from_iterable(edges))
+
+        adjacency = self._adjacency
+        for source, dest in edges:
+            adjacency[source][dest] = None
+        if self._predecessors is not None:
+            for source, dest in edges:
+                self._predecessors[dest][source] = None
+
+    def add_edges_from_arrays(self, src: Any, dst: Any) -> None:
+        """Add many edges at once from NumPy arrays.
+
+        Args:
+            src (np.ndarray): 1-D array of source nodes.
+            dst (np.ndarray): 1-D array of destination nodes, same length as src.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If the arrays have mismatched shapes.
+            TypeError: If src and dst have different dtype kinds (e.g. int and
+                float) or any node is None.
+
+        """
+        self._add_edges_from_arrays(src, dst, None)
 
     def get_edges(self, source: NODE_T) -> Set[NODE_T]:
         """Get the edges connected to a given source node.
@@ -253,7 +771,27 @@ class UnweightedGraph(BaseGraph[NODE_T]):
 
         """
         self._validate_nodes_exist(source)
-        return self._adjacency[source].copy()
+        return set(self._adjacency.get(source, _NO_EDGES))
+
+    def edges_view(self, source: NODE_T) -> KeysView[NODE_T]:
+        """Get the edges connected to a given source node without copying them.
+
+        Args:
+            source (NODE_T): The source node.
+
+        Returns:
+            KeysView[NODE_T]: A read-only, set-like view of the nodes connected
+                to the source, in insertion order. The view is live, it
+                reflects edges added after the call, so don't change the edges
+                of source while iterating it.
+
+        Raises:
+            NodeNotFoundError: If the source node doesn't exist.
+
+        """
+        self._validate_nodes_exist(source)
+        # the node's own row, even if empty, so the view sees later edges
+        return self._adjacency[source].keys()
 
     def has_edge(self, source: NODE_T, dest: NODE_T) -> bool:
         """Check if an edge exists between two nodes.
@@ -270,28 +808,450 @@ class UnweightedGraph(BaseGraph[NODE_T]):
 
         """
         self._validate_nodes_exist(source, dest)
-        return dest in self._adjacency[source]
+        return dest in self._adjacency.get(source, _NO_EDGES)
+
+
+class CSRGraph(Graph[NODE_T]):
+    """An immutable compressed sparse row (CSR) snapshot of a WeightedGraph
+    or UnweightedGraph, made with BaseGraph.to_csr.
+
+    The out-edges of the node with id i are stored in
+    targets[offsets[i]:offsets[i + 1]], with the matching edge weights at the
+    same positions in weights (None for unweighted graphs). offsets and targets
+    are int32 and weights are float64, all exposed as read-only memoryviews, so
+    algorithms can walk the graph by integer id without hashing node objects.
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[NODE_T],
+        offsets: Union[array, memoryview],
+        targets: Union[array, memoryview],
+        weights: Optional[Union[array, memoryview]] = None,
+    ):
+        self._nodes = tuple(nodes)
+        self._node_to_idx: Dict[NODE_T, int] = {
+            node: i for i, node in enumerate(self._nodes)
+        }
+        self._offsets = memoryview(offsets).toreadonly()
+        self._targets = memoryview(targets).toreadonly()
+        self._weights = None if weights is None else memoryview(weights).toreadonly()
+
+        if len(self._offsets) != len(self._nodes) + 1:
+            raise ValueError("offsets must have one entry per node plus one")
+        if self._offsets[-1] != len(self._targets):
+            raise ValueError("offsets do not match the number of targets")
+        if self._weights is not None and len(self._weights) != len(self._targets):
+            raise ValueError("weights must have one entry per edge")
+        self._reverse: Optional["CSRGraph[NODE_T]"] = None
+
+    @property
+    def offsets(self) -> memoryview:
+        """Row offsets into targets, one entry per node plus one."""
+        return self._offsets
+
+    @property
+    def targets(self) -> memoryview:
+        """Destination node id of every edge, grouped by source node."""
+        return self._targets
+
+    @property
+    def weights(self) -> Optional[memoryview]:
+        """Weight of every edge, or None if the graph is unweighted."""
+        return self._weights
+
+    def is_weighted(self) -> bool:
+        """Return whether the snapshot stores edge weights.
+
+        Returns:
+            bool: True if the snapshot was taken from a weighted graph.
+
+        """
+        return self._weights is not None
+
+    def add_node(self, node: NODE_T) -> bool:
+        """Not supported, the snapshot is immutable.
+
+        Raises:
+            FrozenGraphError: Always.
+
+        """
+        raise FrozenGraphError("Cannot add nodes to a frozen graph")
+
+    def add_edge(self, source: NODE_T, dest: NODE_T, weight: float = None) -> None:
+        """Not supported, the snapshot is immutable.
+
+        Raises:
+            FrozenGraphError: Always.
+
+        """
+        raise FrozenGraphError("Cannot add edges to a frozen graph")
+
+    def get_edges(self, source: NODE_T) -> Union[Dict[NODE_T, float], Set[NODE_T]]:
+        """Get the edges connected to a given source node.
+
+        Args:
+            source (NODE_T): The source node.
+
+        Returns:
+            Union[Dict[NODE_T, float], Set[NODE_T]]: A dictionary of destination
+                to weight for weighted snapshots, otherwise a set of destinations.
+
+        Raises:
+            NodeNotFoundError: If the source node doesn't exist.
+
+        """
+        u = self.get_idx(source)
+        start, end = self._offsets[u], self._offsets[u + 1]
+        dests = [self._nodes[v] for v in self._targets[start:end]]
+        if self._weights is None:
+            return set(dests)
+        return dict(zip(dests, self._weights[start:end]))
+
+    def get_edge_weight(self, source: NODE_T, dest: NODE_T) -> float:
+        """Get the weight of an edge between two nodes.
+
+        Args:
+            source (NODE_T): The source node.
+            dest (NODE_T): The destination node.
+
+        Returns:
+            float: The weight of the edge, 1.0 for unweighted snapshots.
+
+        Raises:
+            NodeNotFoundError: If either node doesn't exist.
+            EdgeNotFoundError: If the edge doesn't exist.
+
+        """
+        u, v = self.get_idx(source), self.get_idx(dest)
+        for e in range(self._offsets[u], self._offsets[u + 1]):
+            if self._targets[e] == v:
+                return 1.0 if self._weights is None else self._weights[e]
+        raise EdgeNotFoundError(f"No edge from {source} to {dest}")
+
+    def has_edge(self, source: NODE_T, dest: NODE_T) -> bool:
+        """Check if an edge exists between two nodes.
+
+        Args:
+            source (NODE_T): The source node.
+            dest (NODE_T): The destination node.
+
+        Returns:
+            bool: True if the edge exists, False otherwise.
+
+        Raises:
+            NodeNotFoundError: If either node doesn't exist.
+
+        """
+        u, v = self.get_idx(source), self.get_idx(dest)
+        return v in self._targets[self._offsets[u] : self._offsets[u + 1]]
+
+    def get_nodes(self) -> List[NODE_T]:
+        """Return a list of all nodes in the graph, ordered by id.
+
+        Returns:
+            List[NODE_T]: A list of nodes in the graph.
+
+        """
+        return list(self._nodes)
+
+    def get_idx(self, node: NODE_T) -> int:
+        """Get the index of a node.
+
+        Args:
+            node (NODE_T): The node.
+
+        Returns:
+            int: The index of the node.
+
+        Raises:
+            NodeNotFoundError: If the node doesn't exist in the graph.
+
+        """
+        if node not in self._node_to_idx:
+            raise NodeNotFoundError(f"Node {node} not found in graph")
+        return self._node_to_idx[node]
+
+    def has_node(self, node: NODE_T) -> bool:
+        """Check if a node exists in the graph.
+
+        Args:
+            node (NODE_T): The node to check.
+
+        Returns:
+            bool: True if the node exists, False otherwise.
+
+        """
+        return node in self._node_to_idx
+
+    def num_nodes(self) -> int:
+        """Return the number of nodes in the graph.
+
+        Returns:
+            int: The number of nodes in the graph.
+
+        """
+        return len(self._nodes)
+
+    def num_edges(self) -> int:
+        """Return the number of edges in the graph.
+
+        Returns:
+            int: The number of edges in the graph.
+
+        """
+        return len(self._targets)
+
+    def node_at(self, idx: int) -> NODE_T:
+        """Return the node with the given index.
+
+        Args:
+            idx (int): The node index.
+
+        Returns:
+            NODE_T: The node.
+
+        Raises:
+            NodeNotFoundError: If no node has this index.
+
+        """
+        if not 0 <= idx < len(self._nodes):
+            raise NodeNotFoundError(f"No node with index {idx} in graph")
+        return self._nodes[idx]
+
+    def neighbors_idx(self, idx: int) -> memoryview:
+        """Return the indices of the out-neighbors of a node as a zero-copy
+        slice of targets.
+
+        Args:
+            idx (int): The node index.
+
+        Returns:
+            memoryview: The neighbor indices.
+
+        Raises:
+            NodeNotFoundError: If no node has this index.
+
+        """
+        if not 0 <= idx < len(self._nodes):
+            raise NodeNotFoundError(f"No node with index {idx} in graph")
+        return self._targets[self._offsets[idx] : self._offsets[idx + 1]]
+
+    def degree(self, node: NODE_T) -> int:
+        """Return the out-degree of a node.
+
+        Args:
+            node (NODE_T): The node.
+
+        Returns:
+            int: The number of out-edges of the node.
+
+        Raises:
+            NodeNotFoundError: If the node doesn't exist.
+
+        """
+        u = self.get_idx(node)
+        return self._offsets[u + 1] - self._offsets[u]
+
+    def reverse(self) -> "CSRGraph[NODE_T]":
+        """Return the snapshot with every edge reversed, e.g. to walk in-edges.
+
+        Node ids are the same as in this snapshot. The reverse is built once,
+        in O(V + E) with a counting sort, and cached since snapshots never
+        change.
+
+        Returns:
+            CSRGraph[NODE_T]: The transposed snapshot.
+
+        """
+        if self._reverse is None:
+            n = len(self._nodes)
+            offsets, targets, weights = self._offsets, self._targets, self._weights
+            rev_offsets = array("i", [0]) * (n + 1)
+            for v in targets:
+                rev_offsets[v + 1] += 1
+            for i in range(n):
+                rev_offsets[i + 1] += rev_offsets[i]
+            fill = rev_offsets[:n]
+            rev_targets = array("i", [0]) * len(targets)
+            rev_weights = None if weights is None else array("d", [0.0]) * len(targets)
+            for u in range(n):
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = targets[i]
+                    j = fill[v]
+                    rev_targets[j] = u
+                    if rev_weights is not None:
+                        rev_weights[j] = weights[i]
+                    fill[v] = j + 1
+            self._reverse = CSRGraph(self._nodes, rev_offsets, rev_targets, rev_weights)
+            self._reverse._reverse = self
+        return self._reverse
+
+    def to_graph(self) -> Union["WeightedGraph[NODE_T]", "UnweightedGraph[NODE_T]"]:
+        """Build a mutable graph with the same nodes, ids and edges.
+
+        Returns:
+            Union[WeightedGraph[NODE_T], UnweightedGraph[NODE_T]]: A WeightedGraph
+                if the snapshot has weights, otherwise an UnweightedGraph.
+
+        """
+        graph = WeightedGraph() if self._weights is not None else UnweightedGraph()
+        graph._intern_nodes(self._nodes)
+        nodes, offsets, targets = self._nodes, self._offsets, self._targets
+        adjacency = graph._adjacency
+        for u, node in enumerate(nodes):
+            start, end = offsets[u], offsets[u + 1]
+            if start == end:
+                continue
+            dests = [nodes[v] for v in targets[start:end]]
+            if self._weights is None:
+                adjacency[node] = dict.fromkeys(dests)
+            else:
+                adjacency[node] = dict(zip(dests, self._weights[start:end].tolist()))
+        return graph
 
 
 class MatchingGraph(Graph[NODE_T]):
-    """A specialized graph for matching algorithms with residual graph support."""
+    """A specialized graph for matching algorithms with residual graph support.
+
+    Nodes get stable ids in insertion order, with the source at 0 and the
+    sink at 1, so get_idx is a dict lookup. Every (u, v) pair that has a
+    capacity or carries flow gets an edge number k, and the capacity, flow
+    and cost of edge k live in flat arrays. _out[u] and _in[v] map the other
+    endpoint's id to k. Reads look edges up without inserting anything, so
+    memory stays proportional to the number of edges actually added.
+    """
 
     def __init__(self, source: NODE_T, sink: NODE_T):
         if source == sink:
             raise ValueError("Source and sink must be different nodes")
 
-        self._adjacency = defaultdict(lambda: defaultdict(int))
-        self._residual = defaultdict(lambda: defaultdict(int))
-        self._nodes = set()
         self._source = source
         self._sink = sink
-        # Add source and sink to nodes set
-        self._nodes.add(source)
-        self._nodes.add(sink)
+        self._nodes: List[NODE_T] = [source, sink]
+        self._node_to_idx: Dict[NODE_T, int] = {source: 0, sink: 1}
+        # per node, the id of the other endpoint to the edge number
+        self._out: List[Dict[int, int]] = [{}, {}]
+        self._in: List[Dict[int, int]] = [{}, {}]
+        # per edge number
+        self._cap = array("q")
+        self._cost = array("d")
+        self._flow = array("q")
+        # 1 for edges added with add_edge, 0 for pairs that only carry flow
+        self._is_edge = bytearray()
+        # bumped by every capacity change
+        self._change_version = 0
+        # (u, v) of the changes after version _change_log_start, None until
+        # the first changes_since call turns logging on
+        self._change_log: Optional[List[Tuple[NODE_T, NODE_T]]] = None
+        self._change_log_start = 0
+        # bumped by every change to the residual graph
+        self._residual_version = 0
+
+    def _intern(self, node: NODE_T) -> int:
+        """Return the id of node, adding it if it isn't in the graph yet."""
+        idx = self._node_to_idx.get(node)
+        if idx is None:
+            idx = self._node_to_idx[node] = len(self._nodes)
+            self._nodes.append(node)
+            self._out.append({})
+            self._in.append({})
+        return idx
+
+    def _edge(self, u_idx: int, v_idx: int) -> int:
+        """Return the edge number of u -> v, adding the edge if it isn't in
+        the graph yet."""
+        k = self._out[u_idx].get(v_idx)
+        if k is None:
+            k = self._out[u_idx][v_idx] = self._in[v_idx][u_idx] = len(self._flow)
+            self._cap.append(0)
+            self._cost.append(0.0)
+            self._flow.append(0)
+            self._is_edge.append(0)
+        return k
+
+    def _find_edge(self, u: NODE_T, v: NODE_T) -> Optional[int]:
+        """Return the edge number of u -> v, or None if it has none.
+
+        Raises:
+            NodeNotFoundError: If either node doesn't exist.
+
+        """
+        u_idx = self._node_to_idx.get(u)
+        v_idx = self._node_to_idx.get(v)
+        if u_idx is None or v_idx is None:
+            raise NodeNotFoundError(f"Node {u} or {v} not found in graph")
+        return self._out[u_idx].get(v_idx)
+
+    def _validate_node(self, u: NODE_T) -> int:
+        u_idx = self._node_to_idx.get(u)
+        if u_idx is None:
+            raise NodeNotFoundError(f"Node {u} not found in graph")
+        return u_idx
 
     def reset_residual_graph(self) -> None:
         """Reset the residual graph to its initial state."""
-        self._residual = defaultdict(lambda: defaultdict(int))
+        self._flow = array("q", [0]) * len(self._flow)
+        self._residual_version += 1
+
+    def _log_change(self, u: NODE_T, v: NODE_T) -> None:
+        """Record a capacity change of u -> v."""
+        self._change_version += 1
+        log = self._change_log
+        if log is not None:
+            log.append((u, v))
+            # past this, replaying the log costs more than a rebuild, so
+            # drop it and let older versions start over
+            if len(log) > 2 * len(self._flow) + 64:
+                self._change_log = []
+                self._change_log_start = self._change_version
+
+    def get_change_version(self) -> int:
+        """Return a counter bumped by every capacity change, to pass to
+        changes_since later.
+
+        Returns:
+            int: The capacity version.
+
+        """
+        return self._change_version
+
+    def changes_since(self, version: Optional[int]) -> Optional[List[Tuple[NODE_T, NODE_T]]]:
+        """Return the edges whose capacity changed after a given version.
+
+        Lets solvers that keep state between runs, like MaxFlow, update only
+        what changed. Each one keeps its own version from get_change_version,
+        so any number of them can follow the same graph. Changes are logged
+        from the first call on, and the log is dropped when replaying it would
+        cost more than starting over.
+
+        Args:
+            version (Optional[int]): A version from get_change_version, or
+                None if the caller has none yet.
+
+        Returns:
+            Optional[List[Tuple[NODE_T, NODE_T]]]: The (u, v) pairs of the
+                changed edges, each once, or None if the changes since version
+                aren't known, meaning any edge may have changed.
+
+        """
+        log = self._change_log
+        if log is None:
+            self._change_log = []
+            self._change_log_start = self._change_version
+            return None
+        if version is None or version < self._change_log_start:
+            return None
+        return list(dict.fromkeys(log[version - self._change_log_start :]))
+
+    def get_residual_version(self) -> int:
+        """Return a counter that changes whenever the residual graph changes.
+
+        Returns:
+            int: The residual graph version.
+
+        """
+        return self._residual_version
 
     def get_source(self) -> NODE_T:
         """Return the source node of the matching graph.
@@ -311,16 +1271,18 @@ class MatchingGraph(Graph[NODE_T]):
         """
         return self._sink
 
-    def add_edge(self, u: NODE_T, v: NODE_T, w: int = 1) -> None:
+    def add_edge(self, u: NODE_T, v: NODE_T, w: int = 1, cost: float = 0) -> None:
         """Add an edge between two nodes with a specified weight.
 
         Args:
             u (NODE_T): The source node.
             v (NODE_T): The destination node.
             w (int, optional): The weight of the edge. Defaults to 1.
+            cost (float, optional): The cost per unit of flow on the edge, used
+                by min cost flow. Defaults to 0.
 
         Raises:
-            TypeError: If weight is not an integer.
+            TypeError: If weight is not an integer or cost is not a number.
             ValueError: If weight is negative.
 
         """
@@ -328,13 +1290,18 @@ class MatchingGraph(Graph[NODE_T]):
             raise TypeError("Edge weight must be an integer")
         if w < 0:
             raise ValueError("Edge weight cannot be negative")
+        if not isinstance(cost, (int, float)):
+            raise TypeError("Edge cost must be a number")
 
-        self._adjacency[u][v] = w
-        self._nodes.add(v)
-        self._nodes.add(u)
+        k = self._edge(self._intern(u), self._intern(v))
+        self._cap[k] = w
+        self._cost[k] = cost
+        self._is_edge[k] = 1
+        self._log_change(u, v)
 
     def add_node(self, u: NODE_T) -> None:
-        """Add a node to the graph.
+        """Add a node to the graph, removing the edges leaving it if it is
+        already in the graph. Flow on those edges is kept.
 
         Args:
             u (NODE_T): The node to be added.
@@ -345,8 +1312,13 @@ class MatchingGraph(Graph[NODE_T]):
         """
         if u == self._source or u == self._sink:
             raise ValueError("Cannot manually add source or sink nodes")
-        self._adjacency[u] = defaultdict(int)
-        self._nodes.add(u)
+        u_idx = self._intern(u)
+        for v_idx, k in self._out[u_idx].items():
+            if self._is_edge[k]:
+                self._cap[k] = 0
+                self._cost[k] = 0.0
+                self._is_edge[k] = 0
+                self._log_change(u, self._nodes[v_idx])
 
     def get_edges(self, u: NODE_T) -> Dict[NODE_T, int]:
         """Get the edges connected to a given node.
@@ -361,12 +1333,37 @@ class MatchingGraph(Graph[NODE_T]):
             NodeNotFoundError: If the node doesn't exist.
 
         """
-        if u not in self._nodes:
-            raise NodeNotFoundError(f"Node {u} not found in graph")
-        return dict(self._adjacency[u])
+        nodes, cap, is_edge = self._nodes, self._cap, self._is_edge
+        return {
+            nodes[v_idx]: cap[k]
+            for v_idx, k in self._out[self._validate_node(u)].items()
+            if is_edge[k]
+        }
+
+    def get_edge_costs(self, u: NODE_T) -> Dict[NODE_T, float]:
+        """Get the non-zero costs of the edges leaving a given node.
+
+        Args:
+            u (NODE_T): The node.
+
+        Returns:
+            Dict[NODE_T, float]: A dictionary of edge costs, edges that are not
+                included cost 0.
+
+        Raises:
+            NodeNotFoundError: If the node doesn't exist.
+
+        """
+        nodes, cost = self._nodes, self._cost
+        return {
+            nodes[v_idx]: cost[k]
+            for v_idx, k in self._out[self._validate_node(u)].items()
+            if cost[k]
+        }
 
     def get_residual_edges(self, u: NODE_T) -> Dict[NODE_T, int]:
-        """Get the residual edges connected to a given node.
+        """Get the residual edges leaving a given node, that is the flow on
+        every edge u -> v carrying any.
 
         Args:
             u (NODE_T): The node.
@@ -378,12 +1375,38 @@ class MatchingGraph(Graph[NODE_T]):
             NodeNotFoundError: If the node doesn't exist.
 
         """
-        if u not in self._nodes:
-            raise NodeNotFoundError(f"Node {u} not found in graph")
-        return dict(self._residual[u])
+        nodes, flow = self._nodes, self._flow
+        return {
+            nodes[v_idx]: flow[k]
+            for v_idx, k in self._out[self._validate_node(u)].items()
+            if flow[k]
+        }
+
+    def get_residual_in_edges(self, v: NODE_T) -> Dict[NODE_T, int]:
+        """Get the residual edges entering a given node, that is the flow on
+        every edge u -> v carrying any. Lets a search follow backward edges
+        without scanning every node.
+
+        Args:
+            v (NODE_T): The node.
+
+        Returns:
+            Dict[NODE_T, int]: Maps u to the flow on u -> v.
+
+        Raises:
+            NodeNotFoundError: If the node doesn't exist.
+
+        """
+        nodes, flow = self._nodes, self._flow
+        return {
+            nodes[u_idx]: flow[k]
+            for u_idx, k in self._in[self._validate_node(v)].items()
+            if flow[k]
+        }
 
     def get_nodes(self) -> Iterator[NODE_T]:
-        """Return an iterator over all nodes in the graph.
+        """Return an iterator over all nodes in the graph, in insertion order
+        starting with the source and the sink.
 
         Returns:
             Iterator[NODE_T]: An iterator over the nodes in the graph.
@@ -392,36 +1415,47 @@ class MatchingGraph(Graph[NODE_T]):
         return iter(self._nodes)
 
     def get_idx(self, node: NODE_T) -> int:
-        """Get the index of a node.
+        """Get the index of a node. Indices follow insertion order and never
+        change.
 
         Args:
             node (NODE_T): The node.
 
         Returns:
-            int: The index of the node, or -1 if not found.
+            int: The index of the node.
 
         Raises:
             NodeNotFoundError: If the node doesn't exist.
 
         """
-        if node not in self._nodes:
-            raise NodeNotFoundError(f"Node {node} not found in graph")
+        return self._validate_node(node)
+
+    def node_at(self, idx: int) -> NODE_T:
+        """Return the node with the given index.
+
+        Args:
+            idx (int): The node index.
 
-        idx = 0
-        for n in self._nodes:
-            if n == node:
-                return idx
-            idx += 1
-        return -1  # Should never reach here
+        Returns:
+            NODE_T: The node.
+
+        Raises:
+            NodeNotFoundError: If no node has this index.
+
+        """
+        if not 0 <= idx < len(self._nodes):
+            raise NodeNotFoundError(f"No node with index {idx} in graph")
+        return self._nodes[idx]
 
     def get_residual_nodes(self) -> Iterator[NODE_T]:
-        """Return an iterator over the residual nodes.
+        """Return an iterator over the residual nodes, which are all nodes of
+        the graph.
 
         Returns:
             Iterator[NODE_T]: An iterator over the residual nodes.
 
         """
-        return iter(self._residual.keys())
+        return iter(self._nodes)
 
     def edge_exists(self, u: NODE_T, v: NODE_T) -> bool:
         """Check if an edge exists between two nodes.
@@ -437,9 +1471,8 @@ class MatchingGraph(Graph[NODE_T]):
             NodeNotFoundError: If either node doesn't exist.
 
         """
-        if u not in self._nodes or v not in self._nodes:
-            raise NodeNotFoundError(f"Node {u} or {v} not found in graph")
-        return self._adjacency[u][v] > 0
+        k = self._find_edge(u, v)
+        return k is not None and self._cap[k] > 0
 
     def residual_edge_exists(self, u: NODE_T, v: NODE_T) -> bool:
         """Check if a residual edge exists between two nodes.
@@ -455,9 +1488,8 @@ class MatchingGraph(Graph[NODE_T]):
             NodeNotFoundError: If either node doesn't exist.
 
         """
-        if u not in self._nodes or v not in self._nodes:
-            raise NodeNotFoundError(f"Node {u} or {v} not found in graph")
-        return self._residual[u][v] > 0
+        k = self._find_edge(u, v)
+        return k is not None and self._flow[k] > 0
 
     def get_edge_weight(self, u: NODE_T, v: NODE_T) -> float:
         """Get the weight of an edge between two nodes.
@@ -473,9 +1505,25 @@ class MatchingGraph(Graph[NODE_T]):
             NodeNotFoundError: If either node doesn't exist.
 
         """
-        if u not in self._nodes or v not in self._nodes:
-            raise NodeNotFoundError(f"Node {u} or {v} not found in graph")
-        return self._adjacency[u][v]
+        k = self._find_edge(u, v)
+        return 0 if k is None else self._cap[k]
+
+    def get_edge_cost(self, u: NODE_T, v: NODE_T) -> float:
+        """Get the cost per unit of flow of an edge between two nodes.
+
+        Args:
+            u (NODE_T): The source node.
+            v (NODE_T): The destination node.
+
+        Returns:
+            float: The cost of the edge, or 0 if it has none or does not exist.
+
+        Raises:
+            NodeNotFoundError: If either node doesn't exist.
+
+        """
+        k = self._find_edge(u, v)
+        return 0 if k is None else self._cost[k]
 
     def get_residual_edge_weight(self, u: NODE_T, v: NODE_T) -> float:
         """Get the weight of a residual edge between two nodes.
@@ -491,28 +1539,33 @@ class MatchingGraph(Graph[NODE_T]):
             NodeNotFoundError: If either node doesn't exist.
 
         """
-        if u not in self._nodes or v not in self._nodes:
-            raise NodeNotFoundError(f"Node {u} or {v} not found in graph")
-        return self._residual[u][v]
+        k = self._find_edge(u, v)
+        return 0 if k is None else self._flow[k]
 
-    def update_residual_edge_weight(self, u: NODE_T, v: NODE_T, w: float) -> None:
+    def update_residual_edge_weight(self, u: NODE_T, v: NODE_T, w: int) -> None:
         """Update the weight of a residual edge.
 
         Args:
             u (NODE_T): The source node.
             v (NODE_T): The destination node.
-            w (float): The new weight of the residual edge.
+            w (int): The new weight of the residual edge.
 
         Raises:
             NodeNotFoundError: If either node doesn't exist.
+            TypeError: If weight is not an integer.
             ValueError: If weight is negative.
 
         """
-        if u not in self._nodes or v not in self._nodes:
+        u_idx = self._node_to_idx.get(u)
+        v_idx = self._node_to_idx.get(v)
+        if u_idx is None or v_idx is None:
             raise NodeNotFoundError(f"Node {u} or {v} not found in graph")
+        if not isinstance(w, int):
+            raise TypeError("Residual edge weight must be an integer")
         if w < 0:
             raise ValueError("Residual edge weight cannot be negative")
-        self._residual[u][v] = w
+        self._flow[self._edge(u_idx, v_idx)] = w
+        self._residual_version += 1
 
     def preliminary_assignment(self, u: NODE_T, v: NODE_T, w: int = 1) -> None:
         """Make a preliminary assignment for a bipartite graph.
@@ -527,28 +1580,50 @@ class MatchingGraph(Graph[NODE_T]):
             ValueError: If weight is not positive.
 
         """
-        if u not in self._nodes or v not in self._nodes:
+        u_idx = self._node_to_idx.get(u)
+        v_idx = self._node_to_idx.get(v)
+        if u_idx is None or v_idx is None:
             raise NodeNotFoundError(f"Node {u} or {v} not found in graph")
         if w <= 0:
             raise ValueError("Assignment weight must be positive")
 
         # For bipartite graphs to add initial flow
-        self._residual[self._source][u] += w
-        self._residual[u][v] += w
-        self._residual[v][self._sink] += w
+        flow = self._flow
+        flow[self._edge(0, u_idx)] += w
+        flow[self._edge(u_idx, v_idx)] += w
+        flow[self._edge(v_idx, 1)] += w
+        self._residual_version += 1
 
     def visualize(self, fname: str = "test.png") -> None:
         """Visualize the graph and save it to a file.
 
+        matplotlib and networkx are only imported here, so they are optional
+        dependencies of the package (``pip install py_dsa[viz]``).
+
         Args:
             fname (str, optional): The filename to save the visualization. Defaults to 'test.png'.
 
+        Raises:
+            ImportError: If matplotlib or networkx is not installed.
+
         """
+        try:
+            import matplotlib
+
+            matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+            import networkx as nx
+        except ImportError as e:
+            raise ImportError(
+                "MatchingGraph.visualize requires matplotlib and networkx, "
+                "install them with `pip install py_dsa[viz]`"
+            ) from e
+
         nx_graph = nx.DiGraph()
 
         # add nodes and edges to graph
-        for u in self._adjacency:
-            for v, w in self._adjacency[u].items():
+        for u in self._nodes:
+            for v, w in self.get_edges(u).items():
                 if w > 0:
                     nx_graph.add_edge(u, v)
 
@@ -562,11 +1637,12 @@ class MatchingGraph(Graph[NODE_T]):
         layers["source"].append(self._source)
         layers["sink"].append(self._sink)
 
-        for u in self._adjacency:
+        for u in self._nodes:
             if u != self._source and u != self._sink:
-                if any(v == self._sink for v in self._adjacency[u]):
+                edges = self.get_edges(u)
+                if self._sink in edges:
                     layers["sink_layer"].append(u)
-                elif any(v == self._source for v in self._adjacency[u]):
+                elif self._source in edges:
                     layers["source_layer"].append(u)
                 else:
                     layers["intermediate"].append(u)
@@ -596,7 +1672,7 @@ class MatchingGraph(Graph[NODE_T]):
         )
 
         for u, v in nx_graph.edges():
-            if v in self._residual[u] and self._residual[u][v] > 0:
+            if self.residual_edge_exists(u, v):
                 nx.draw_networkx_edges(
                     nx_graph,
                     pos,
@@ -0,0 +1,373 @@
+"""Reading and writing graphs.
+
+Edge lists
+----------
+EdgeListReader / read_edgelist stream whitespace, tab or comma separated edge
+lists (e.g. SNAP datasets), optionally gzip compressed, into a WeightedGraph or
+UnweightedGraph in fixed size chunks through add_edges_from.
+
+Binary format
+-------------
+save_graph writes a CSR snapshot of a graph as::
+
+    header   magic, version, flags, node table kind, #nodes, #edges,
+             node table size (little-endian, see _HEADER)
+    offsets  int32[#nodes + 1]
+    targets  int32[#edges]
+    weights  float64[#edges], only for weighted graphs
+    nodes    the node table
+
+Every section starts on an 8 byte boundary so load_graph can cast slices of a
+memory-mapped file straight into the CSRGraph arrays. Opening a multi-GB file
+is then near-instant, and worker processes mapping the same file share its
+pages through the OS page cache. Only the node table is decoded eagerly, since
+node objects have to be hashed for get_idx.
+"""
+
+import gzip
+import mmap
+import os
+import pickle
+import struct
+import sys
+import time
+from array import array
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from py_dsa.datastructures.graph import BaseGraph, CSRGraph, WeightedGraph, UnweightedGraph
+
+_MAGIC = b"PYDSAGR\x00"
+_VERSION = 1
+# magic, version, flags, node kind, num nodes, num edges, node table bytes
+_HEADER = struct.Struct("<8sHHIQQQ")
+_WEIGHTED = 1
+
+# node table kinds
+_NODES_INT = 0  # int64[#nodes]
+_NODES_STR = 1  # int64 offsets[#nodes + 1] then the utf-8 encoded strings
+_NODES_PICKLE = 2  # pickled list, only loaded with allow_pickle=True
+
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _pad(n: int) -> int:
+    """Round n up to a multiple of 8."""
+    return (n + 7) & ~7
+
+
+def _encode_nodes(nodes: List[Any]) -> Tuple[int, bytes]:
+    """Pick the most compact node table kind for nodes and encode it."""
+    if all(type(node) is int and _INT64_MIN <= node <= _INT64_MAX for node in nodes):
+        return _NODES_INT, _le_bytes(array("q", nodes), "q")
+    if all(type(node) is str for node in nodes):
+        encoded = [node.encode("utf-8") for node in nodes]
+        offsets = array("q", [0])
+        total = 0
+        for raw in encoded:
+            total += len(raw)
+            offsets.append(total)
+        return _NODES_STR, _le_bytes(offsets, "q") + b"".join(encoded)
+    return _NODES_PICKLE, pickle.dumps(list(nodes), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_nodes(kind: int, raw: memoryview, n: int, allow_pickle: bool) -> List[Any]:
+    """Decode a node table written by _encode_nodes."""
+    if kind == _NODES_INT:
+        return _native(raw, "q").tolist()
+    if kind == _NODES_STR:
+        offsets = _native(raw[: 8 * (n + 1)], "q").tolist()
+        blob = bytes(raw[8 * (n + 1) :])
+        return [blob[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(n)]
+    if kind == _NODES_PICKLE:
+        if not allow_pickle:
+            raise ValueError(
+                "Graph file stores pickled nodes, pass allow_pickle=True to load it "
+                "(only do so for files you trust)"
+            )
+        return pickle.loads(raw)
+    raise ValueError(f"Unknown node table kind {kind}")
+
+
+def _le_bytes(items: Union[array, memoryview], typecode: str) -> bytes:
+    """Return items as little-endian bytes, without an extra copy when they
+    already are a native little-endian buffer of the right type.
+    """
+    view = memoryview(items)
+    if sys.byteorder == "little" and view.format == typecode:
+        return view.tobytes()
+    arr = array(typecode, view)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _native(raw: memoryview, typecode: str) -> Union[memoryview, array]:
+    """View little-endian bytes as typed items, zero-copy on little-endian hosts."""
+    if sys.byteorder == "little":
+        return raw.cast(typecode)
+    arr = array(typecode, raw.tobytes())
+    arr.byteswap()
+    return arr
+
+
+def save_graph(graph: Union[BaseGraph, CSRGraph], path: Union[str, os.PathLike]) -> None:
+    """Write a graph to path in the py_dsa binary format.
+
+    Args:
+        graph (Union[BaseGraph, CSRGraph]): The graph to save. A WeightedGraph
+            or UnweightedGraph is snapshotted with to_csr first.
+        path (Union[str, os.PathLike]): The file to write.
+
+    """
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    nodes = csr.get_nodes()
+    kind, node_table = _encode_nodes(nodes)
+    flags = _WEIGHTED if csr.is_weighted() else 0
+
+    sections = [_le_bytes(csr.offsets, "i"), _le_bytes(csr.targets, "i")]
+    if csr.weights is not None:
+        sections.append(_le_bytes(csr.weights, "d"))
+    sections.append(node_table)
+
+    with open(path, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                _MAGIC, _VERSION, flags, kind, len(nodes), csr.num_edges(), len(node_table)
+            )
+        )
+        f.write(b"\0" * (_pad(_HEADER.size) - _HEADER.size))
+        for section in sections:
+            f.write(section)
+            f.write(b"\0" * (_pad(len(section)) - len(section)))
+
+
+def load_graph(
+    path: Union[str, os.PathLike], use_mmap: bool = True, allow_pickle: bool = False
+) -> CSRGraph:
+    """Load a graph written by save_graph.
+
+    Args:
+        path (Union[str, os.PathLike]): The file to read.
+        use_mmap (bool, optional): Memory-map the file instead of reading it,
+            so the edge arrays are paged in on demand and shared between
+            processes. Defaults to True.
+        allow_pickle (bool, optional): Allow loading a pickled node table,
+            which is used when nodes are neither all ints nor all strings.
+            Unpickling can run arbitrary code. Defaults to False.
+
+    Returns:
+        CSRGraph: The loaded snapshot, use its to_graph method to get a
+            mutable WeightedGraph or UnweightedGraph back.
+
+    Raises:
+        ValueError: If the file is not a valid py_dsa graph file, or holds
+            pickled nodes and allow_pickle is False.
+
+    """
+    with open(path, "rb") as f:
+        if use_mmap:
+            # the mapping stays valid after the file is closed, and is released
+            # once the CSRGraph's views of it are garbage collected
+            buf = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            buf = memoryview(f.read())
+
+    if len(buf) < _HEADER.size:
+        raise ValueError("Not a py_dsa graph file: file is too short")
+    magic, version, flags, kind, n, m, node_bytes = _HEADER.unpack_from(buf)
+    if magic != _MAGIC:
+        raise ValueError("Not a py_dsa graph file: bad magic number")
+    if version != _VERSION:
+        raise ValueError(f"Unsupported py_dsa graph file version {version}")
+
+    pos = _pad(_HEADER.size)
+    sizes = [4 * (n + 1), 4 * m]
+    if flags & _WEIGHTED:
+        sizes.append(8 * m)
+    sizes.append(node_bytes)
+    if pos + sum(_pad(size) for size in sizes[:-1]) + node_bytes > len(buf):
+        raise ValueError("Not a py_dsa graph file: file is truncated")
+
+    views = []
+    for size in sizes:
+        views.append(buf[pos : pos + size])
+        pos += _pad(size)
+
+    offsets = _native(views[0], "i")
+    targets = _native(views[1], "i")
+    weights = _native(views[2], "d") if flags & _WEIGHTED else None
+    nodes = _decode_nodes(kind, views[-1], n, allow_pickle)
+    return CSRGraph(nodes, offsets, targets, weights)
+
+
+class EdgeListReader:
+    """Streams an edge list file into a graph in chunks of bounded size.
+
+    Each non-empty, non-comment line holds a source and a destination node,
+    optionally followed by a weight column, separated by whitespace, tabs or
+    a custom delimiter such as ",". Files starting with the gzip magic bytes
+    are decompressed on the fly. Throughput is tracked while reading, see
+    edges_read, elapsed and edges_per_second.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        delimiter: Optional[str] = None,
+        weighted: Optional[bool] = None,
+        comments: Union[str, Tuple[str, ...]] = "#",
+        nodetype: Optional[Callable[[str], Any]] = None,
+        header: bool = False,
+        chunk_size: int = 100_000,
+        progress: Optional[Callable[["EdgeListReader"], None]] = None,
+    ):
+        """Configure the reader.
+
+        Args:
+            path (Union[str, os.PathLike]): The edge list file, plain or gzip.
+            delimiter (Optional[str], optional): Column separator, None splits
+                on any whitespace (spaces or tabs). Defaults to None.
+            weighted (Optional[bool], optional): Whether the third column is an
+                edge weight. None detects it from the first edge line.
+                Defaults to None.
+            comments (Union[str, Tuple[str, ...]], optional): Prefixes of lines
+                to skip. Defaults to "#".
+            nodetype (Optional[Callable[[str], Any]], optional): Converts node
+                tokens, e.g. int. Defaults to keeping them as strings.
+            header (bool, optional): Skip the first non-comment line, e.g. a
+                CSV header. Defaults to False.
+            chunk_size (int, optional): Number of lines handed to the graph at
+                a time, which bounds memory use. Defaults to 100_000.
+            progress (Optional[Callable[[EdgeListReader], None]], optional):
+                Called with the reader after every chunk. Defaults to None.
+
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.path = path
+        self.delimiter = delimiter
+        self.weighted = weighted
+        self.comments = comments
+        self.nodetype = nodetype
+        self.header = header
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.edges_read = 0
+        self.lines_read = 0
+        self.elapsed = 0.0
+
+    @property
+    def edges_per_second(self) -> float:
+        """Ingest throughput of the last read, in edges per second."""
+        return self.edges_read / self.elapsed if self.elapsed else 0.0
+
+    def _open(self) -> TextIO:
+        """Open the file as text, decompressing it if it is gzip."""
+        with open(self.path, "rb") as f:
+            compressed = f.read(2) == b"\x1f\x8b"
+        if compressed:
+            return gzip.open(self.path, "rt", encoding="utf-8")
+        return open(self.path, "r", encoding="utf-8")
+
+    def _parse(self, line_no: int, line: str) -> Tuple[Any, ...]:
+        """Split a line into (source, dest) or (source, dest, weight)."""
+        cols = line.split(self.delimiter)
+        if self.delimiter is not None:
+            cols = [col.strip() for col in cols]
+        if len(cols) < 2 or (self.weighted and len(cols) < 3):
+            raise ValueError(f"{self.path}:{line_no}: expected an edge, got {line!r}")
+        u, v = cols[0], cols[1]
+        if self.nodetype is not None:
+            u, v = self.nodetype(u), self.nodetype(v)
+        if not self.weighted:
+            return u, v
+        try:
+            return u, v, float(cols[2])
+        except ValueError:
+            raise ValueError(
+                f"{self.path}:{line_no}: invalid edge weight {cols[2]!r}"
+            ) from None
+
+    def chunks(self) -> Iterator[List[Tuple[Any, ...]]]:
+        """Yield lists of at most chunk_size parsed edges.
+
+        Yields:
+            List[Tuple[Any, ...]]: (source, dest) or (source, dest, weight) tuples.
+
+        """
+        comments, skip_header = self.comments, self.header
+        with self._open() as f:
+            lines = enumerate(f, 1)
+            while True:
+                block = list(islice(lines, self.chunk_size))
+                if not block:
+                    return
+                self.lines_read += len(block)
+                edges = []
+                for line_no, line in block:
+                    line = line.strip()
+                    if not line or line.startswith(comments):
+                        continue
+                    if skip_header:
+                        skip_header = False
+                        continue
+                    if self.weighted is None:
+                        self.weighted = len(line.split(self.delimiter)) >= 3
+                    edges.append(self._parse(line_no, line))
+                if edges:
+                    yield edges
+
+    def read_into(
+        self, graph: Optional[BaseGraph] = None
+    ) -> Union[WeightedGraph, UnweightedGraph]:
+        """Read the whole file into graph.
+
+        Args:
+            graph (Optional[BaseGraph], optional): The graph to add edges to. By
+                default a WeightedGraph is created for weighted files and an
+                UnweightedGraph otherwise. A WeightedGraph gets weight 1.0 for
+                unweighted files, an UnweightedGraph ignores weight columns.
+
+        Returns:
+            Union[WeightedGraph, UnweightedGraph]: The graph that was filled.
+
+        Raises:
+            ValueError: If a line can't be parsed, with its line number.
+
+        """
+        self.edges_read = self.lines_read = 0
+        start = time.perf_counter()
+        for edges in self.chunks():
+            if graph is None:
+                graph = WeightedGraph() if self.weighted else UnweightedGraph()
+            if isinstance(graph, UnweightedGraph) and self.weighted:
+                edges = [edge[:2] for edge in edges]
+            graph.add_edges_from(edges)
+            self.edges_read += len(edges)
+            self.elapsed = time.perf_counter() - start
+            if self.progress is not None:
+                self.progress(self)
+        self.elapsed = time.perf_counter() - start
+        if graph is None:
+            graph = WeightedGraph() if self.weighted else UnweightedGraph()
+        return graph
+
+
+def read_edgelist(
+    path: Union[str, os.PathLike],
+    graph: Optional[BaseGraph] = None,
+    **kwargs: Any,
+) -> Union[WeightedGraph, UnweightedGraph]:
+    """Read an edge list file into a graph, see EdgeListReader for the options.
+
+    Args:
+        path (Union[str, os.PathLike]): The edge list file, plain or gzip.
+        graph (Optional[BaseGraph], optional): The graph to add edges to.
+        **kwargs: Passed on to EdgeListReader.
+
+    Returns:
+        Union[WeightedGraph, UnweightedGraph]: The graph that was filled.
+
+    """
+    return EdgeListReader(path, **kwargs).read_into(graph)
@@ -9,7 +9,7 @@ setup(
     # long_description=open('README.md').read(),
     long_description_content_type="text/markdown",
     url="https://github.com/rnucuta/usefuldatastructures",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -17,8 +17,17 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "matplotlib",
-        "networkx",
         "bitarray",
     ],
+    extras_require={
+        # only needed for MatchingGraph.visualize
+        "viz": [
+            "matplotlib",
+            "networkx",
+        ],
+        # only needed for the array based bulk graph builders
+        "numpy": [
+            "numpy",
+        ],
+    },
 )
@@ -0,0 +1,119 @@
+import math
+import random
+import unittest
+from py_dsa.algorithms import ArbitrageDetector, find_arbitrage
+from py_dsa.datastructures import EdgeNotFoundError, UnweightedGraph, WeightedGraph
+
+
+def has_arbitrage(g):
+    """Floyd-Warshall over -log(rate), a negative diagonal is a loop."""
+    nodes = list(g.get_nodes())
+    dist = {(u, v): math.inf for u in nodes for v in nodes}
+    for u in nodes:
+        for v, rate in g.get_edges(u).items():
+            dist[u, v] = min(dist[u, v], -math.log(rate))
+    for k in nodes:
+        for i in nodes:
+            for j in nodes:
+                if dist[i, k] + dist[k, j] < dist[i, j]:
+                    dist[i, j] = dist[i, k] + dist[k, j]
+    return any(dist[u, u] < -1e-9 for u in nodes)
+
+
+def market(rng, n, m, spread):
+    """Rates derived from random prices, with random noise of size spread."""
+    price = {i: rng.uniform(0.5, 2.0) for i in range(n)}
+    g = WeightedGraph()
+    for node in range(n):
+        g.add_node(node)
+    for _ in range(m):
+        u, v = rng.sample(range(n), 2)
+        g.add_edge(u, v, price[u] / price[v] * (1 + rng.uniform(-spread, spread)))
+    return g
+
+
+class TestArbitrage(unittest.TestCase):
+    def assertArbitrage(self, g, detector, cycle):
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertEqual(len(set(cycle)), len(cycle) - 1)
+        rate = 1.0
+        for u, v in zip(cycle, cycle[1:]):
+            rate *= g.get_edge_weight(u, v)
+        self.assertGreater(rate, 1)
+        self.assertAlmostEqual(detector.cycle_rate(cycle), rate)
+
+    def test_matches_floyd_warshall(self):
+        rng = random.Random(0)
+        for trial in range(60):
+            n = rng.randint(2, 8)
+            g = market(rng, n, rng.randint(1, 3 * n), 0.05 if trial % 2 else 0.0)
+            expected = has_arbitrage(g)
+            for method in ("numpy", "spfa"):
+                detector = ArbitrageDetector(g, method)
+                cycle = detector.find_cycle()
+                self.assertEqual(cycle is not None, expected, msg=method)
+                if cycle is not None:
+                    self.assertArbitrage(g, detector, cycle)
+
+    def test_fair_rates_and_self_loops(self):
+        g = WeightedGraph()
+        for a, b, rate in (("USD", "EUR", 0.9), ("EUR", "JPY", 160.0), ("JPY", "USD", 1 / 144)):
+            g.add_edge(a, b, rate)
+            g.add_edge(b, a, 1 / rate)
+        for currency in ("USD", "EUR", "JPY"):
+            g.add_edge(currency, currency, 1.0)
+        self.assertIsNone(find_arbitrage(g))
+        self.assertIsNone(find_arbitrage(g.to_csr(), method="spfa"))
+        g.add_edge("EUR", "EUR", 1.01)
+        self.assertEqual(find_arbitrage(g), ["EUR", "EUR"])
+
+    def test_ticks(self):
+        g = WeightedGraph()
+        for a, b, rate in (("USD", "EUR", 0.9), ("EUR", "GBP", 0.85), ("GBP", "USD", 1.3)):
+            g.add_edge(a, b, rate)
+        for method in ("numpy", "spfa"):
+            detector = ArbitrageDetector(g, method)
+            self.assertIsNone(detector.find_cycle())
+            detector.set_rate("GBP", "USD", 1.4)
+            cycle = detector.find_cycle()
+            self.assertEqual(set(cycle), {"USD", "EUR", "GBP"})
+            self.assertAlmostEqual(detector.cycle_rate(cycle), 0.9 * 0.85 * 1.4)
+            detector.set_rate("GBP", "USD", 1.3)
+            self.assertIsNone(detector.find_cycle())
+
+    def test_large_market(self):
+        rng = random.Random(1)
+        g = market(rng, 300, 3000, 0.0)
+        for method in ("numpy", "spfa"):
+            self.assertIsNone(find_arbitrage(g, method))
+        detector = ArbitrageDetector(g)
+        u, v = next((u, v) for u in g.get_nodes() for v in g.get_edges(u) if u in g.get_edges(v))
+        detector.set_rate(u, v, g.get_edge_weight(u, v) * 1.001)
+        cycle = detector.find_cycle()
+        # the boosted conversion is the only one out of line
+        self.assertIn((u, v), list(zip(cycle, cycle[1:])))
+        self.assertGreater(detector.cycle_rate(cycle), 1)
+
+    def test_invalid(self):
+        g = WeightedGraph()
+        g.add_edge("a", "b", 0)
+        with self.assertRaises(ValueError):
+            ArbitrageDetector(g)
+        g = WeightedGraph()
+        g.add_edge("a", "b", 2)
+        with self.assertRaises(ValueError):
+            ArbitrageDetector(g, method="floyd")
+        detector = ArbitrageDetector(g)
+        with self.assertRaises(EdgeNotFoundError):
+            detector.set_rate("b", "a", 1)
+        with self.assertRaises(ValueError):
+            detector.set_rate("a", "b", -1)
+        u = UnweightedGraph()
+        u.add_edge("a", "b")
+        with self.assertRaises(TypeError):
+            ArbitrageDetector(u)
+        self.assertIsNone(find_arbitrage(WeightedGraph()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import itertools
+import random
+import unittest
+import numpy as np
+from py_dsa.algorithms import MinCostFlow, assignment, matching_cost_matrix
+from py_dsa.datastructures import MatchingGraph
+
+
+def brute_force(cost):
+    n, m = cost.shape
+    if n > m:
+        return brute_force(cost.T)
+    return min(
+        (sum(cost[i, p[i]] for i in range(n)) for p in itertools.permutations(range(m), n)),
+        default=0,
+    )
+
+
+class TestAssignment(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        for trial in range(200):
+            n, m = (int(x) for x in rng.integers(1, 6, 2))
+            cost = rng.integers(-10, 20, (n, m)).astype(float)
+            if trial % 3 == 0:
+                cost[rng.random((n, m)) < 0.3] = np.inf
+            best = brute_force(cost)
+            if best == np.inf:
+                with self.assertRaises(ValueError):
+                    assignment(cost)
+                continue
+            rows, cols = assignment(cost)
+            self.assertEqual(len(rows), min(n, m))
+            self.assertEqual(list(rows), sorted(set(rows)))
+            self.assertEqual(len(set(cols)), len(cols))
+            self.assertEqual(cost[rows, cols].sum(), best)
+
+    def test_rectangular(self):
+        cost = [[4, 1, 3, 9], [2, 0, 5, 9], [3, 2, 2, 0]]
+        rows, cols = assignment(cost)
+        self.assertEqual((list(rows), list(cols)), ([0, 1, 2], [1, 0, 3]))
+        rows, cols = assignment(np.array(cost).T)
+        self.assertEqual((list(rows), list(cols)), ([0, 1, 3], [1, 0, 2]))
+
+    def test_maximize(self):
+        cost = np.array([[1, 2], [3, 5]])
+        rows, cols = assignment(cost, maximize=True)
+        self.assertEqual(cost[rows, cols].sum(), 6)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            assignment([1, 2, 3])
+        with self.assertRaises(ValueError):
+            assignment([[np.nan, 1], [1, 1]])
+        with self.assertRaises(ValueError):
+            assignment([[1, np.inf], [2, np.inf]])
+        rows, cols = assignment(np.zeros((0, 3)))
+        self.assertEqual((len(rows), len(cols)), (0, 0))
+
+    def test_matching_graph_adapter(self):
+        rng = random.Random(0)
+        mg = MatchingGraph("s", "t")
+        for i in range(6):
+            mg.add_edge("s", ("w", i))
+            mg.add_edge(("j", i), "t")
+            for j in rng.sample(range(6), 4):
+                mg.add_edge(("w", i), ("j", j), cost=rng.randint(0, 30))
+        cost, left, right = matching_cost_matrix(mg)
+        self.assertEqual(cost.shape, (6, 6))
+        self.assertEqual(sorted(left), [("w", i) for i in range(6)])
+        for i, u in enumerate(left):
+            for j, v in enumerate(right):
+                expected = mg.get_edge_cost(u, v) if mg.edge_exists(u, v) else np.inf
+                self.assertEqual(cost[i, j], expected)
+        flow, total = MinCostFlow(mg).min_cost_flow()
+        self.assertEqual(flow, 6)
+        rows, cols = assignment(cost)
+        self.assertEqual(cost[rows, cols].sum(), total)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,7 @@ from py_dsa.algorithms import blindDFS, Robot
 from random import randint
 import string
 from py_dsa.algorithms.best_conversion_rate import best_conversion_rate
-from py_dsa.datastructures import WeightedGraph
+from py_dsa.datastructures import NodeNotFoundError, WeightedGraph
 import random
 import itertools
 from parameterized import parameterized
@@ -51,3 +51,12 @@ class TestBestConversionRate(unittest.TestCase):
         actual = best_conversion_rate(g, source, destination)
         self.assertAlmostEqual(actual, expected, places=6,
             msg=f"Failed for n={graph_size}, source={source}, dest={destination}")
+        self.assertAlmostEqual(best_conversion_rate(g.to_csr(), source, destination), expected, places=6)
+
+    def test_missing_currencies(self):
+        g, _ = self.random_complete_graph(3, seed=0)
+        for graph in (g, g.to_csr()):
+            # an unknown destination can't be reached, an unknown source is an error
+            self.assertEqual(best_conversion_rate(graph, "A", "Z"), 0)
+            with self.assertRaises(NodeNotFoundError):
+                best_conversion_rate(graph, "Z", "A")
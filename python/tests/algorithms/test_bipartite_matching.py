@@ -0,0 +1,69 @@
+import random
+import unittest
+from py_dsa.algorithms import MaxFlow, max_bipartite_matching
+from py_dsa.datastructures import MatchingGraph
+
+
+def assignment_graph(edges):
+    mg = MatchingGraph("s", "t")
+    for u, v in edges:
+        mg.add_edge("s", ("l", u))
+        mg.add_edge(("l", u), ("r", v))
+        mg.add_edge(("r", v), "t")
+    return mg
+
+
+class TestMaxBipartiteMatching(unittest.TestCase):
+    def assertMatching(self, mg, pairs):
+        lefts = [u for u, _ in pairs]
+        rights = [v for _, v in pairs]
+        self.assertEqual(len(set(lefts)), len(lefts))
+        self.assertEqual(len(set(rights)), len(rights))
+        for u, v in pairs:
+            self.assertTrue(mg.edge_exists(u, v))
+
+    def test_matches_max_flow(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            n = rng.randint(1, 20)
+            edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(1, 3 * n))]
+            mg = assignment_graph(edges)
+            pairs = max_bipartite_matching(mg)
+            self.assertMatching(mg, pairs)
+            self.assertEqual(len(pairs), MaxFlow(assignment_graph(edges), method="dinic").max_flow_val())
+            # written back as a flow, so max flow has nothing left to augment
+            self.assertEqual(MaxFlow(mg).max_flow_val(), len(pairs))
+
+    def test_augments_through_matched_nodes(self):
+        # greedily matching a-x leaves b unmatched unless a moves to y
+        mg = assignment_graph([("a", "x"), ("a", "y"), ("b", "x")])
+        mg.preliminary_assignment(("l", "a"), ("r", "x"))
+        pairs = max_bipartite_matching(mg)
+        self.assertEqual(sorted(pairs), [(("l", "a"), ("r", "y")), (("l", "b"), ("r", "x"))])
+
+    def test_warm_start_is_kept_when_maximum(self):
+        mg = assignment_graph([(0, 0), (0, 1), (1, 0), (1, 1)])
+        mg.preliminary_assignment(("l", 0), ("r", 1))
+        mg.preliminary_assignment(("l", 1), ("r", 0))
+        self.assertEqual(sorted(max_bipartite_matching(mg)),
+                         [(("l", 0), ("r", 1)), (("l", 1), ("r", 0))])
+
+    def test_rejects_other_structures(self):
+        mg = assignment_graph([(0, 0)])
+        mg.add_edge(("l", 0), ("r", 1), 2)
+        with self.assertRaises(ValueError):
+            max_bipartite_matching(mg)
+
+        mg = assignment_graph([(0, 0)])
+        mg.add_edge(("r", 0), ("r", 1))
+        with self.assertRaises(ValueError):
+            max_bipartite_matching(mg)
+
+        mg = assignment_graph([(0, 0)])
+        mg.add_edge(("l", 0), "t")
+        with self.assertRaises(ValueError):
+            max_bipartite_matching(mg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from py_dsa.algorithms import run_dag
+from py_dsa.datastructures import CycleError, NodeNotFoundError, UnweightedGraph
+
+
+def diamond():
+    g = UnweightedGraph()
+    for u, v in (("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")):
+        g.add_edge(u, v)
+    return g
+
+
+def fail():
+    raise RuntimeError("boom")
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []
+        self.running = 0
+        self.peak = 0
+
+    def task(self, node, seconds=0.01):
+        def run():
+            with self.lock:
+                self.events.append(("start", node))
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+            time.sleep(seconds)
+            with self.lock:
+                self.events.append(("end", node))
+                self.running -= 1
+            return node
+
+        return run
+
+
+class TestRunDag(unittest.TestCase):
+    def test_dependencies_and_bound(self):
+        g = UnweightedGraph()
+        for i in range(8):
+            g.add_edge("root", i)
+            g.add_edge(i, "sink")
+        rec = Recorder()
+        tasks = {node: rec.task(node) for node in g.get_nodes()}
+        run = run_dag(g, tasks, max_workers=3)
+        self.assertTrue(run.ok)
+        self.assertEqual(run.results, {node: node for node in g.get_nodes()})
+        self.assertLessEqual(rec.peak, 3)
+        self.assertGreater(rec.peak, 1)
+        position = {event: i for i, event in enumerate(rec.events)}
+        for u in g.get_nodes():
+            for v in g.get_edges(u):
+                self.assertLess(position["end", u], position["start", v])
+        for stats in run.stats.values():
+            self.assertEqual(stats.status, "done")
+            self.assertGreaterEqual(stats.seconds, 0.01)
+            self.assertLessEqual(stats.submitted, stats.finished)
+
+    def test_dispatches_before_layer_finishes(self):
+        g = UnweightedGraph()
+        g.add_edge("fast", "next")
+        g.add_node("slow")
+        rec = Recorder()
+        tasks = {"fast": rec.task("fast"), "next": rec.task("next"), "slow": rec.task("slow", 0.3)}
+        run = run_dag(g, tasks, max_workers=2)
+        self.assertTrue(run.ok)
+        self.assertLess(rec.events.index(("end", "next")), rec.events.index(("end", "slow")))
+
+    def test_fail_fast(self):
+        g = diamond()
+        g.add_edge("x", "y")
+        rec = Recorder()
+        tasks = {node: rec.task(node) for node in g.get_nodes()}
+        tasks["b"] = fail
+        tasks["x"] = rec.task("x", 0.2)
+        run = run_dag(g, tasks, max_workers=2)
+        self.assertFalse(run.ok)
+        self.assertIsInstance(run.errors["b"], RuntimeError)
+        self.assertEqual(run.stats["b"].status, "failed")
+        self.assertEqual(run.stats["d"].status, "skipped")
+        self.assertEqual(run.stats["y"].status, "cancelled")
+        self.assertNotIn("y", run.results)
+
+        run = run_dag(g, tasks, max_workers=2, fail_fast=False)
+        self.assertEqual(set(run.errors), {"b"})
+        self.assertEqual(set(run.results), {"a", "c", "x", "y"})
+        self.assertEqual(run.stats["d"].status, "skipped")
+
+    def test_executors(self):
+        g = diamond()
+        tasks = {node: partial(pow, 2, i) for i, node in enumerate("abcd")}
+        expected = {node: 2**i for i, node in enumerate("abcd")}
+        self.assertEqual(run_dag(g, tasks, executor="process", max_workers=2).results, expected)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            self.assertEqual(run_dag(g, tasks, executor=pool).results, expected)
+            # a shared executor is left running
+            self.assertEqual(pool.submit(pow, 3, 2).result(), 9)
+        del tasks["b"]
+        run = run_dag(g, tasks, max_workers=1)
+        self.assertTrue(run.ok)
+        self.assertIsNone(run.results["b"])
+
+    def test_invalid(self):
+        g = diamond()
+        with self.assertRaises(NodeNotFoundError):
+            run_dag(g, {"z": fail})
+        with self.assertRaises(ValueError):
+            run_dag(g, {}, executor="fiber")
+        with self.assertRaises(ValueError):
+            run_dag(g, {}, max_workers=0)
+        g.add_edge("d", "a")
+        with self.assertRaises(CycleError):
+            run_dag(g, {"a": fail})
+        self.assertTrue(run_dag(UnweightedGraph(), {}).ok)
+
+
+if __name__ == "__main__":
+    unittest.main()
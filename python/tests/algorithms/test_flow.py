@@ -1,5 +1,6 @@
+import random
 import unittest
-from py_dsa.algorithms import MaxFlow
+from py_dsa.algorithms import FlowStats, MaxFlow
 from py_dsa.datastructures import MatchingGraph
 from typing import List, Tuple
 
@@ -50,7 +51,8 @@ def construct_graph(m: int, n: int, k: int, counts: dict[int, List[Tuple[int, in
 # stack has to start with 1 and end with m
 # next card can either be same color and the next num
 # or diff color and same num
-def cards_game(m: int, n: int, k: int, counts: dict[int, List[Tuple[int, int]]], visname: str):
+def cards_game(m: int, n: int, k: int, counts: dict[int, List[Tuple[int, int]]], visname: str = None,
+               method: str = "edmonds_karp"):
     """
     m, n and k correspond to the range of the cards numeric value (1,..., m), the number of
     friends (n) and the number of colors (k).
@@ -60,31 +62,264 @@ def cards_game(m: int, n: int, k: int, counts: dict[int, List[Tuple[int, int]]],
     returns: max number of stacks which can be created
     """
     mg = construct_graph(m, n, k, counts)
-    mf = MaxFlow(mg)
+    mf = MaxFlow(mg, method=method)
     ans = mf.max_flow_val()
-    mg.visualize(fname = visname)
+    if visname:
+        mg.visualize(fname = visname)
     return ans
 
 class TestFlow(unittest.TestCase):
+    method = "edmonds_karp"
+
+    def visname(self, fname):
+        return fname
+
     def test_flow_1(self):
         self.assertEqual(cards_game(m=3, k=2, n=3, counts = {
             1: [(1,2),(3,2)],
             2: [(1,1), (2,1), (2,2)],
-            3: [(2,2), (3,2)]}, visname="test_flow_1.png"),
+            3: [(2,2), (3,2)]}, visname=self.visname("test_flow_1.png"), method=self.method),
             2)
 
     def test_flow_2(self):
         self.assertEqual(cards_game(m=3, k=2, n=3, counts = {
             1: [(1,2), (2,2), (2,2), (3,2)],
             2: [(1,1), (2,1)],
-            3: [(3,2)]}, visname="test_flow_2.png"),
+            3: [(3,2)]}, visname=self.visname("test_flow_2.png"), method=self.method),
             1)
 
     def test_flow_3(self):
         self.assertEqual(cards_game(m=29, k=6, n=8,
             counts = {1: [(3, 5), (11, 5), (10, 4), (1, 2), (23, 3), (17, 1), (3, 2), (7, 4)], 2: [(10, 3), (19, 1), (14, 1), (19, 3), (11, 3), (25, 3), (18, 5), (25, 1), (3, 5), (11, 4), (23, 3), (13, 4), (11, 2), (3, 1), (9, 4), (6, 4), (6, 2), (25, 3), (15, 3), (4, 2), (14, 3), (13, 1), (12, 1), (14, 3), (24, 4), (17, 5), (7, 2), (28, 1), (3, 2), (2, 2), (22, 4), (9, 3), (1, 2), (18, 4), (22, 2), (3, 3), (21, 3), (28, 4)], 3: [(5, 1), (22, 5), (11, 5), (26, 3), (26, 5), (21, 3), (18, 4), (22, 1), (9, 1), (17, 3), (5, 1), (15, 5), (3, 3), (18, 2), (6, 2), (19, 5), (28, 2), (19, 4), (3, 1), (22, 1), (13, 2), (9, 2), (23, 5), (10, 2), (13, 5), (27, 3), (6, 2), (5, 2), (14, 2), (27, 3), (19, 1), (2, 3), (14, 5), (25, 4), (19, 3), (25, 5), (18, 5), (5, 3), (1, 5), (6, 4), (23, 3), (16, 2), (17, 2), (9, 3), (12, 4), (18, 2), (9, 2), (8, 2), (23, 4), (24, 4), (13, 4), (3, 5), (11, 3), (9, 3), (8, 1), (17, 3), (28, 3), (4, 1), (20, 5), (23, 2), (2, 1), (3, 3), (2, 4), (9, 2), (6, 4), (21, 2), (24, 4), (10, 3), (26, 1), (26, 3), (27, 2), (23, 4), (16, 5), (12, 4), (24, 1), (5, 3), (11, 3), (12, 1), (15, 4), (4, 1), (13, 4), (7, 3), (6, 1), (7, 5), (16, 3), (21, 1), (12, 4), (25, 3), (22, 2), (25, 4), (2, 1), (23, 5), (15, 3), (4, 5), (8, 1), (19, 1), (15, 5), (12, 5), (27, 4), (2, 1), (8, 4), (13, 4), (20, 3), (8, 5), (19, 3), (22, 3), (18, 4), (7, 3), (9, 2)], 4: [(18, 4), (5, 1), (8, 2), (4, 2), (27, 5), (27, 5), (9, 4), (4, 1), (24, 5), (15, 1), (9, 2), (25, 4), (26, 3), (10, 2), (8, 5), (20, 2), (11, 2), (28, 1), (6, 5), (10, 3), (7, 3), (28, 1), (4, 2), (2, 1), (25, 5), (26, 3), (9, 5), (21, 4), (27, 4), (27, 1), (2, 5), (14, 4), (16, 5), (13, 3), (12, 2), (27, 3), (8, 5), (8, 1), (10, 3), (6, 2), (1, 1), (18, 4), (27, 1), (12, 2), (24, 2), (10, 5), (25, 1), (5, 2), (2, 4), (13, 1), (20, 2), (17, 2), (14, 4), (4, 5), (26, 4), (26, 2), (25, 1), (2, 4), (12, 2), (14, 1), (5, 1), (13, 2), (21, 5), (7, 5), (20, 2), (1, 2), (26, 3), (25, 3), (3, 1), (6, 3), (20, 2), (6, 3), (10, 5), (12, 3), (27, 2), (24, 1), (22, 1), (19, 2), (8, 4), (20, 4), (23, 1), (25, 1), (21, 5), (22, 3), (8, 4), (28, 2), (22, 4), (1, 1), (10, 5), (18, 5), (7, 3), (9, 2), (27, 5), (26, 1)], 5: [(9, 4), (16, 4), (5, 3), (7, 2), (27, 4), (17, 1), (25, 3), (17, 5), (11, 5), (26, 5), (4, 3), (25, 4), (21, 2), (28, 1), (9, 1), (26, 1), (10, 1), (3, 5), (16, 1), (25, 3), (28, 5), (14, 1), (27, 4), (12, 3), (10, 3), (12, 3), (19, 4), (23, 5), (27, 4), (6, 2), (18, 2), (27, 4), (19, 4), (27, 3), (5, 5), (24, 3), (9, 5), (20, 2), (16, 5), (27, 2), (15, 2), (14, 4), (13, 2), (7, 2), (19, 2), (4, 5), (5, 2), (5, 4), (25, 4), (7, 5), (23, 2), (10, 1), (15, 5), (14, 4), (6, 1), (21, 3), (28, 1), (27, 1), (4, 1), (12, 1), (2, 4), (3, 3), (8, 1), (25, 2), (6, 4), (18, 4), (16, 1), (13, 5), (6, 5), (20, 3), (25, 2), (24, 2), (20, 1), (14, 1), (23, 3), (21, 5), (24, 1), (19, 5), (25, 2), (27, 4), (23, 5), (21, 5), (27, 2), (13, 1), (12, 1), (10, 1), (11, 4), (23, 4), (12, 5), (19, 4), (7, 2), (27, 1), (12, 5)], 6: [(6, 5), (15, 4), (13, 2), (8, 4), (24, 2), (18, 3), (2, 2), (8, 3), (11, 5), (11, 4), (4, 4), (14, 3), (8, 3), (26, 4), (6, 3), (24, 3), (21, 2), (17, 5), (9, 3), (1, 4), (11, 3), (18, 4), (12, 1), (6, 5), (8, 2), (22, 1), (11, 1), (25, 2), (21, 1), (3, 5), (7, 3), (11, 1), (12, 4), (22, 4), (14, 3), (6, 3), (16, 3), (25, 5), (10, 1), (23, 5), (17, 5), (3, 4), (5, 5), (13, 1), (19, 4), (5, 3), (14, 4), (5, 2), (25, 1), (25, 4), (6, 3), (23, 2), (18, 5), (9, 2), (12, 4), (8, 1), (24, 5), (21, 3), (23, 1), (5, 1), (11, 5), (15, 2), (25, 4), (4, 4), (15, 1), (9, 5), (26, 3), (28, 4), (17, 3), (18, 5), (12, 1), (17, 2), (1, 1), (17, 3), (19, 4), (10, 1), (16, 1), (2, 2), (4, 3), (7, 3), (27, 2), (7, 5), (4, 2), (27, 1), (23, 2), (24, 3), (16, 5), (28, 4), (17, 4), (5, 1), (27, 1), (2, 1), (19, 1), (16, 5), (22, 5), (4, 5), (4, 4), (17, 3), (1, 2), (10, 5), (23, 3), (28, 3), (21, 1), (16, 3), (28, 2), (7, 2), (13, 2), (18, 1), (20, 1), (14, 2), (13, 1), (18, 4), (23, 2), (7, 1), (18, 2), (1, 1), (1, 4), (23, 2), (28, 2), (11, 1), (18, 5), (16, 5), (16, 1), (7, 1), (14, 2), (16, 5), (4, 2), (16, 3), (11, 5), (17, 1), (25, 4), (4, 5), (5, 3), (6, 3)], 7: [(21, 4), (17, 2), (13, 5), (13, 3), (2, 2), (10, 5), (13, 1)], 8: [(22, 2), (24, 1), (3, 3), (16, 5), (18, 2), (12, 1), (4, 1), (19, 3), (9, 1), (6, 1), (10, 5), (3, 3), (6, 1), (18, 3), (22, 3), (27, 2), (27, 3), (16, 4), (3, 4), (14, 2), (19, 2), (1, 3), (24, 1), (14, 1), (1, 3), (1, 4), (16, 5), (22, 3), (19, 3), (28, 4), (10, 2), (2, 1), (7, 1), (13, 5), (11, 1), (7, 4), (28, 2), (10, 1), (7, 5), (10, 1), (6, 1), (8, 3), (27, 5), (19, 3), (12, 4), (5, 1), (2, 2), (10, 4), (16, 2), (20, 1), (16, 2), (27, 3), (28, 4), (18, 2), (23, 2), (21, 5), (19, 4), (28, 3), (13, 2), (25, 5), (8, 3), (23, 1), (25, 2), (7, 3), (4, 2), (13, 1), (7, 2), (15, 2), (18, 5), (22, 2), (9, 1), (1, 4), (22, 3), (4, 2), (9, 2), (25, 3), (9, 1), (23, 5), (28, 3), (1, 1), (2, 5), (3, 5), (25, 5), (18, 3), (5, 1), (25, 1), (6, 2), (17, 4), (5, 4), (12, 3), (9, 4), (16, 2), (15, 1), (17, 3), (17, 3), (21, 2), (16, 2), (6, 5), (24, 5), (7, 5), (6, 3), (10, 3), (8, 2), (14, 4), (2, 5), (24, 4), (8, 5), (11, 4), (21, 2), (6, 1), (17, 3), (23, 2), (3, 4), (21, 3), (21, 2), (7, 4), (16, 1)]},
-            visname="test_flow_3.png"),
+            visname=self.visname("test_flow_3.png"), method=self.method),
             0)
 
+    def test_min_cut_and_flow_paths(self):
+        rng = random.Random(1)
+        for _ in range(30):
+            n = rng.randint(2, 10)
+            mg = MatchingGraph("s", "t")
+            for _ in range(rng.randint(0, 30)):
+                u, v = rng.randrange(n), rng.randrange(n)
+                mg.add_edge("s" if u == 0 else "t" if u == 1 else u,
+                            "s" if v == 0 else "t" if v == 1 else v, rng.randint(1, 5))
+            mf = MaxFlow(mg, method=self.method)
+            value = mf.max_flow_val()
+
+            source_side, sink_side, cut_edges = mf.min_cut()
+            self.assertIn("s", source_side)
+            self.assertIn("t", sink_side)
+            self.assertFalse(source_side & sink_side)
+            self.assertEqual(sum(mg.get_edge_weight(u, v) for u, v in cut_edges), value)
+
+            paths = mf.flow_paths()
+            self.assertEqual(sum(b for _, b in paths), value)
+            used = {}
+            for path, b in paths:
+                self.assertGreater(b, 0)
+                self.assertEqual((path[0], path[-1]), ("s", "t"))
+                self.assertEqual(len(set(path)), len(path))
+                for u, v in zip(path, path[1:]):
+                    used[u, v] = used.get((u, v), 0) + b
+            for (u, v), f in used.items():
+                self.assertLessEqual(f, mg.get_residual_edge_weight(u, v))
+
+    def test_reroutes_along_backward_edge(self):
+        # the only shortest path s-a-b-t blocks b, the second unit has to come
+        # in through c and cancel a -> b, continuing from a over d and e
+        mg = MatchingGraph("s", "t")
+        for u, v in (("s", "a"), ("a", "b"), ("b", "t"), ("s", "c"), ("c", "f"), ("f", "b"),
+                     ("a", "d"), ("d", "e"), ("e", "t")):
+            mg.add_edge(u, v)
+        mf = MaxFlow(mg, method=self.method)
+        self.assertEqual(mf.max_flow_val(), 2)
+        self.assertEqual(mg.get_residual_edge_weight("a", "b"), 0)
+        self.assertEqual(sorted(path for path, _ in mf.flow_paths()),
+                         [["s", "a", "d", "e", "t"], ["s", "c", "f", "b", "t"]])
+
+class TestFlowDinic(TestFlow):
+    method = "dinic"
+
+    def visname(self, fname):
+        return None
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            MaxFlow(MatchingGraph("s", "t"), method="simplex")
+
+    def test_matches_edmonds_karp(self):
+        rng = random.Random(0)
+        for _ in range(30):
+            n = rng.randint(2, 12)
+            edges = [(rng.randrange(n), rng.randrange(n), rng.randint(1, 5)) for _ in range(rng.randint(0, 40))]
+            values = []
+            for method in ("edmonds_karp", self.method):
+                mg = MatchingGraph("s", "t")
+                for u, v, w in edges:
+                    mg.add_edge("s" if u == 0 else "t" if u == 1 else u,
+                                "s" if v == 0 else "t" if v == 1 else v, w)
+                values.append(MaxFlow(mg, method=method).max_flow_val())
+                self.assertFlowIsValid(mg)
+            self.assertEqual(values[0], values[1])
+
+    def test_warm_start(self):
+        mg = MatchingGraph("s", "t")
+        for u, v in (("s", "a"), ("s", "b"), ("a", "x"), ("a", "y"), ("b", "x"), ("x", "t"), ("y", "t")):
+            mg.add_edge(u, v)
+        mg.preliminary_assignment("a", "x")
+        self.assertEqual(MaxFlow(mg, method=self.method).max_flow_val(), 2)
+        self.assertFlowIsValid(mg)
+
+    def assertFlowIsValid(self, mg):
+        net = {}
+        for u in mg.get_nodes():
+            for v, c in mg.get_edges(u).items():
+                f = mg.get_residual_edge_weight(u, v)
+                self.assertLessEqual(f, c)
+                net[u] = net.get(u, 0) - f
+                net[v] = net.get(v, 0) + f
+        for node, excess in net.items():
+            if node not in (mg.get_source(), mg.get_sink()):
+                self.assertEqual(excess, 0)
+
+class TestFlowPushRelabel(TestFlowDinic):
+    method = "push_relabel"
+
+    def test_flow_into_source_is_netted(self):
+        # excess that can't reach t is pushed back, possibly along s <- a
+        mg = MatchingGraph("s", "t")
+        mg.add_edge("s", "a", 5)
+        mg.add_edge("a", "s", 5)
+        mg.add_edge("a", "t", 2)
+        self.assertEqual(MaxFlow(mg, method=self.method).max_flow_val(), 2)
+        self.assertFlowIsValid(mg)
+
+class TestFlowIncremental(unittest.TestCase):
+    def test_resolve_after_capacity_changes(self):
+        nodes = ["s", "t"] + list(range(7))
+        for seed in range(40):
+            for method in MaxFlow.METHODS:
+                rng = random.Random(seed)
+                mg = MatchingGraph("s", "t")
+                for _ in range(20):
+                    mg.add_edge(*rng.sample(nodes, 2), rng.randint(1, 9))
+                mf = MaxFlow(mg, method=method)
+                for _ in range(6):
+                    fresh = MatchingGraph("s", "t")
+                    for u in mg.get_nodes():
+                        for v, w in mg.get_edges(u).items():
+                            fresh.add_edge(u, v, w)
+                    self.assertEqual(mf.max_flow_val(), MaxFlow(fresh, method="dinic").max_flow_val())
+                    TestFlowDinic.assertFlowIsValid(self, mg)
+                    # raise, lower or zero a few capacities, or add new edges
+                    for _ in range(rng.randint(1, 3)):
+                        mg.add_edge(*rng.sample(nodes, 2), rng.randint(0, 9))
+
+    def test_decrease_keeps_other_paths(self):
+        mg = MatchingGraph("s", "t")
+        for u, v, w in (("s", "a", 2), ("a", "t", 2), ("s", "b", 1), ("b", "t", 1), ("a", "b", 1)):
+            mg.add_edge(u, v, w)
+        mf = MaxFlow(mg, method="dinic")
+        self.assertEqual(mf.max_flow_val(), 3)
+        mg.add_edge("a", "t", 1)
+        self.assertEqual(mf.max_flow_val(), 2)
+        self.assertEqual(mg.get_residual_edge_weight("b", "t"), 1)
+
+    def test_cost_changes_reach_the_network(self):
+        mg = MatchingGraph("s", "t")
+        mg.add_edge("s", "a", 2, cost=1.0)
+        mg.add_edge("a", "t", 2, cost=2.0)
+        mf = MaxFlow(mg, method="dinic")
+        self.assertEqual(mf.max_flow_val(), 2)
+        mg.add_edge("a", "t", 2, cost=5.0)
+        net = mf.network()
+        a, t = net.node_to_idx["a"], net.node_to_idx["t"]
+        arc = next(i for i in range(0, len(net.head), 2)
+                   if (net.head[i + 1], net.head[i]) == (a, t))
+        self.assertEqual((net.cost[arc], net.cost[arc + 1]), (5.0, -5.0))
+
+    def test_solvers_sharing_a_graph(self):
+        mg = MatchingGraph("s", "t")
+        mg.add_edge("s", "a")
+        mg.add_edge("a", "t")
+        first = MaxFlow(mg, method="dinic")
+        second = MaxFlow(mg, method="dinic")
+        self.assertEqual(first.max_flow_val(), 1)
+        self.assertEqual(second.max_flow_val(), 1)
+        mg.add_edge("s", "b")
+        mg.add_edge("b", "t")
+        # second syncing its network must not hide the new edges from first
+        second.min_cut()
+        self.assertEqual(first.max_flow_val(), 2)
+        self.assertEqual(second.max_flow_val(), 2)
+
+    def test_change_log(self):
+        mg = MatchingGraph("s", "t")
+        mg.add_edge("s", "a")
+        self.assertIsNone(mg.changes_since(None))
+        version = mg.get_change_version()
+        mg.add_edge("a", "t")
+        mg.add_edge("s", "a", 2)
+        self.assertEqual(mg.changes_since(version), [("a", "t"), ("s", "a")])
+        self.assertEqual(mg.changes_since(mg.get_change_version()), [])
+        # a long log is dropped, older versions have to start over
+        for w in range(100):
+            mg.add_edge("s", "a", w)
+        self.assertIsNone(mg.changes_since(version))
+
+    def test_rebuild_after_reset(self):
+        mg = MatchingGraph("s", "t")
+        mg.add_edge("s", "a", 3)
+        mg.add_edge("a", "t", 3)
+        mf = MaxFlow(mg, method="push_relabel")
+        self.assertEqual(mf.max_flow_val(), 3)
+        mg.reset_residual_graph()
+        mg.add_edge("a", "t", 2)
+        self.assertEqual(mf.max_flow_val(), 2)
+
+class TestFlowStats(unittest.TestCase):
+    def build(self):
+        mg = MatchingGraph("s", "t")
+        for i in range(30):
+            mg.add_edge("s", ("l", i))
+            mg.add_edge(("r", i), "t")
+            for j in (i, (i + 1) % 30, (i * 7) % 30):
+                mg.add_edge(("l", i), ("r", j))
+        return mg
+
+    def test_counters(self):
+        for method in MaxFlow.METHODS:
+            stats = FlowStats()
+            value = MaxFlow(self.build(), method=method, stats=stats).max_flow_val()
+            self.assertEqual(value, MaxFlow(self.build(), method=method).max_flow_val())
+            self.assertGreaterEqual(stats.augmentations, value)
+            self.assertGreater(stats.vertices_visited, 0)
+            self.assertGreater(stats.arcs_scanned, 0)
+            self.assertGreater(stats.elapsed, 0)
+            self.assertLessEqual(sum(stats.seconds.values()), stats.elapsed)
+            self.assertEqual(stats.as_dict()["augmentations"], stats.augmentations)
+            if method != "edmonds_karp":
+                self.assertGreater(stats.phases, 0)
+
+    def test_progress(self):
+        for method in MaxFlow.METHODS:
+            calls = []
+            mf = MaxFlow(self.build(), method=method, progress=calls.append, progress_every=7)
+            mf.max_flow_val()
+            self.assertEqual(len(calls), mf.stats.augmentations // 7)
+            self.assertTrue(all(stats is mf.stats for stats in calls))
+
+    def test_reset_between_runs(self):
+        stats = FlowStats()
+        mf = MaxFlow(self.build(), method="dinic", stats=stats)
+        mf.max_flow_val()
+        mf.max_flow_val()
+        # the second run starts from a maximum flow
+        self.assertEqual(stats.augmentations, 0)
+
+    def test_invalid_progress_every(self):
+        with self.assertRaises(ValueError):
+            MaxFlow(self.build(), progress_every=0)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
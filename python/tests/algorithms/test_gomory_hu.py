@@ -0,0 +1,95 @@
+import random
+import unittest
+from py_dsa.algorithms import GomoryHuTree, MaxFlow
+from py_dsa.datastructures import MatchingGraph, UnweightedGraph, WeightedGraph
+
+
+def random_graph(rng, n, m):
+    g = WeightedGraph()
+    for i in range(n):
+        g.add_node(i)
+    for _ in range(m):
+        u, v = rng.sample(range(n), 2)
+        w = rng.randint(1, 9)
+        g.add_edge(u, v, w)
+        g.add_edge(v, u, w)
+    return g
+
+
+def max_flow_value(g, s, t):
+    mg = MatchingGraph(("node", s), ("node", t))
+    for u in g.get_nodes():
+        for v, w in g.get_edges(u).items():
+            mg.add_edge(("node", u), ("node", v), w)
+    return MaxFlow(mg, method="dinic").max_flow_val()
+
+
+def cut_value(g, side):
+    return sum(w for u in side for v, w in g.get_edges(u).items() if v not in side)
+
+
+class TestGomoryHuTree(unittest.TestCase):
+    def assertMatchesMaxFlow(self, g, tree):
+        nodes = list(g.get_nodes())
+        self.assertEqual(len(tree.edges()), len(nodes) - 1)
+        for i, u in enumerate(nodes):
+            for v in nodes[i + 1:]:
+                value = max_flow_value(g, u, v)
+                self.assertEqual(tree.min_cut_value(u, v), value)
+                cut, side = tree.min_cut(u, v)
+                self.assertEqual(cut, value)
+                self.assertIn(u, side)
+                self.assertNotIn(v, side)
+                self.assertEqual(cut_value(g, side), value)
+
+    def test_matches_max_flow(self):
+        rng = random.Random(0)
+        for _ in range(15):
+            n = rng.randint(2, 8)
+            g = random_graph(rng, n, rng.randint(0, 15))
+            self.assertMatchesMaxFlow(g, GomoryHuTree(g, max_workers=1))
+
+    def test_process_pool(self):
+        g = random_graph(random.Random(1), 12, 30)
+        serial = GomoryHuTree(g, max_workers=1)
+        pooled = GomoryHuTree(g, max_workers=2, batch_size=3)
+        self.assertEqual(pooled.parent, serial.parent)
+        self.assertEqual(pooled.weight, serial.weight)
+        self.assertMatchesMaxFlow(g, pooled)
+
+    def test_unweighted_one_way_edges(self):
+        g = UnweightedGraph()
+        for u, v in ((0, 1), (1, 2), (2, 0), (2, 3)):
+            g.add_edge(u, v)
+        tree = GomoryHuTree(g, max_workers=1)
+        self.assertEqual(tree.min_cut_value(0, 1), 2)
+        self.assertEqual(tree.min_cut_value(0, 3), 1)
+
+    def test_disconnected_and_single(self):
+        g = WeightedGraph()
+        g.add_edge("a", "b", 3)
+        g.add_node("c")
+        tree = GomoryHuTree(g, max_workers=1)
+        self.assertEqual(tree.min_cut_value("a", "b"), 3)
+        self.assertEqual(tree.min_cut_value("a", "c"), 0)
+        single = WeightedGraph()
+        single.add_node("x")
+        self.assertEqual(GomoryHuTree(single).edges(), [])
+
+    def test_invalid(self):
+        g = WeightedGraph()
+        g.add_edge("a", "b", 3)
+        g.add_edge("b", "a", 2)
+        with self.assertRaises(ValueError):
+            GomoryHuTree(g, max_workers=1)
+        g = WeightedGraph()
+        g.add_edge("a", "b", 3)
+        tree = GomoryHuTree(g, max_workers=1)
+        with self.assertRaises(ValueError):
+            tree.min_cut_value("a", "a")
+        with self.assertRaises(KeyError):
+            tree.min_cut_value("a", "z")
+
+
+if __name__ == "__main__":
+    unittest.main()
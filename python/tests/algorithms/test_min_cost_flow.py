@@ -0,0 +1,81 @@
+import itertools
+import random
+import unittest
+from py_dsa.algorithms import MaxFlow, MinCostFlow
+from py_dsa.datastructures import MatchingGraph
+
+
+def assignment_graph(costs):
+    mg = MatchingGraph("s", "t")
+    for i, row in enumerate(costs):
+        mg.add_edge("s", ("w", i))
+        for j, c in enumerate(row):
+            if c is not None:
+                mg.add_edge(("w", i), ("j", j), cost=c)
+    for j in range(len(costs[0])):
+        mg.add_edge(("j", j), "t")
+    return mg
+
+
+class TestMinCostFlow(unittest.TestCase):
+    def test_assignment_matches_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(20):
+            n = rng.randint(1, 6)
+            costs = [[rng.randint(-5, 20) for _ in range(n)] for _ in range(n)]
+            best = min(sum(costs[i][p[i]] for i in range(n)) for p in itertools.permutations(range(n)))
+            flow, cost = MinCostFlow(assignment_graph(costs)).min_cost_flow()
+            self.assertEqual(flow, n)
+            self.assertEqual(cost, best)
+
+    def test_flow_is_written_back(self):
+        mg = assignment_graph([[4, 1], [2, 9]])
+        self.assertEqual(MinCostFlow(mg).min_cost_flow(), (2, 3))
+        self.assertEqual(mg.get_residual_edge_weight(("w", 0), ("j", 1)), 1)
+        self.assertEqual(mg.get_residual_edge_weight(("w", 1), ("j", 0)), 1)
+        self.assertEqual(mg.get_residual_edge_weight(("w", 0), ("j", 0)), 0)
+
+    def test_max_flow_value_with_capacities(self):
+        rng = random.Random(1)
+        for _ in range(20):
+            mg, copy = MatchingGraph("s", "t"), MatchingGraph("s", "t")
+            nodes = ["s", "t", 0, 1, 2, 3, 4]
+            for _ in range(15):
+                u, v = rng.sample(nodes, 2)
+                w, c = rng.randint(1, 5), rng.randint(0, 10)
+                mg.add_edge(u, v, w, cost=c)
+                copy.add_edge(u, v, w)
+            flow, _ = MinCostFlow(mg).min_cost_flow()
+            self.assertEqual(flow, MaxFlow(copy, method="dinic").max_flow_val())
+
+    def test_flow_limit(self):
+        mg = MatchingGraph("s", "t")
+        mg.add_edge("s", "a", 2, cost=1)
+        mg.add_edge("a", "t", 2, cost=1)
+        mg.add_edge("s", "t", 2, cost=5)
+        self.assertEqual(MinCostFlow(mg).min_cost_flow(flow_limit=3), (3, 9))
+        with self.assertRaises(ValueError):
+            MinCostFlow(mg).min_cost_flow(flow_limit=-1)
+
+    def test_negative_cycle(self):
+        mg = MatchingGraph("s", "t")
+        mg.add_edge("s", "a")
+        mg.add_edge("a", "b", 1, cost=-2)
+        mg.add_edge("b", "a", 1, cost=1)
+        mg.add_edge("b", "t")
+        with self.assertRaises(ValueError):
+            MinCostFlow(mg).min_cost_flow()
+
+    def test_edge_costs(self):
+        mg = MatchingGraph("s", "t")
+        mg.add_edge("s", "a", 3, cost=2.5)
+        self.assertEqual(mg.get_edge_cost("s", "a"), 2.5)
+        self.assertEqual(mg.get_edge_costs("s"), {"a": 2.5})
+        mg.add_edge("s", "a", 3)
+        self.assertEqual(mg.get_edge_cost("s", "a"), 0)
+        with self.assertRaises(TypeError):
+            mg.add_edge("s", "a", 1, cost="cheap")
+
+
+if __name__ == "__main__":
+    unittest.main()
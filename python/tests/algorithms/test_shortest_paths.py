@@ -0,0 +1,122 @@
+import math
+import random
+import unittest
+from py_dsa.algorithms import astar_path, bidirectional_dijkstra, dijkstra, dijkstra_path
+from py_dsa.datastructures import NodeNotFoundError, UnweightedGraph, WeightedGraph
+
+
+def bellman_ford(g, source):
+    dist = {node: math.inf for node in g.get_nodes()}
+    dist[source] = 0
+    for _ in range(g.num_nodes()):
+        for u in g.get_nodes():
+            for v, w in g.get_edges(u).items():
+                dist[v] = min(dist[v], dist[u] + w)
+    return dist
+
+
+def random_graph(rng, n, m):
+    g = WeightedGraph()
+    for node in range(n):
+        g.add_node(node)
+    for _ in range(m):
+        g.add_edge(rng.randrange(n), rng.randrange(n), rng.randint(0, 20))
+    return g
+
+
+def grid(rows, cols, seed=0):
+    rng = random.Random(seed)
+    g = WeightedGraph()
+    for r in range(rows):
+        for c in range(cols):
+            for nb in ((r + 1, c), (r, c + 1)):
+                if nb[0] < rows and nb[1] < cols:
+                    w = 1 + rng.random()
+                    g.add_edge((r, c), nb, w)
+                    g.add_edge(nb, (r, c), w)
+    return g
+
+
+def manhattan(u, v):
+    return abs(u[0] - v[0]) + abs(u[1] - v[1])
+
+
+class TestShortestPaths(unittest.TestCase):
+    def assertPath(self, g, source, target, length, path):
+        self.assertEqual((path[0], path[-1]), (source, target))
+        self.assertAlmostEqual(sum(g.get_edge_weight(u, v) for u, v in zip(path, path[1:])), length)
+
+    def test_matches_bellman_ford(self):
+        rng = random.Random(0)
+        for _ in range(30):
+            n = rng.randint(1, 15)
+            g = random_graph(rng, n, rng.randint(0, 3 * n))
+            csr = g.to_csr()
+            for source in range(n):
+                expected = bellman_ford(g, source)
+                dist, pred = dijkstra(csr, source)
+                self.assertEqual(dist, {v: d for v, d in expected.items() if d < math.inf})
+                for v, u in pred.items():
+                    self.assertEqual(dist[u] + g.get_edge_weight(u, v), dist[v])
+                for target in range(n):
+                    for search in (dijkstra_path, bidirectional_dijkstra):
+                        length, path = search(csr, source, target)
+                        self.assertEqual(length, expected[target])
+                        if length < math.inf:
+                            self.assertPath(g, source, target, length, path)
+                        else:
+                            self.assertEqual(path, [])
+                    length, _ = astar_path(csr, source, target, lambda u, v: 0)
+                    self.assertEqual(length, expected[target])
+
+    def test_grid(self):
+        g = grid(30, 30)
+        csr = g.to_csr()
+        source, target = (0, 0), (29, 17)
+        dist, _ = dijkstra(csr, source)
+        expected = dist[target]
+        for search in (dijkstra_path, bidirectional_dijkstra):
+            length, path = search(csr, source, target)
+            self.assertAlmostEqual(length, expected)
+            self.assertPath(g, source, target, length, path)
+        length, path = astar_path(csr, source, target, manhattan)
+        self.assertAlmostEqual(length, expected)
+        self.assertPath(g, source, target, length, path)
+
+    def test_early_exit(self):
+        g = grid(30, 30)
+        dist, _ = dijkstra(g, (0, 0), target=(1, 1))
+        self.assertIn((1, 1), dist)
+        self.assertLess(len(dist), 30)
+        self.assertTrue(all(d <= dist[1, 1] for d in dist.values()))
+
+    def test_unweighted_and_errors(self):
+        g = UnweightedGraph()
+        for u, v in (("a", "b"), ("b", "c"), ("a", "d"), ("d", "c"), ("c", "e")):
+            g.add_edge(u, v)
+        self.assertEqual(dijkstra(g, "a")[0], {"a": 0, "b": 1, "d": 1, "c": 2, "e": 3})
+        self.assertEqual(bidirectional_dijkstra(g, "a", "e")[0], 3)
+        self.assertEqual(bidirectional_dijkstra(g, "c", "c"), (0, ["c"]))
+        self.assertEqual(dijkstra_path(g, "e", "a"), (math.inf, []))
+        with self.assertRaises(NodeNotFoundError):
+            dijkstra_path(g, "a", "z")
+        w = WeightedGraph()
+        w.add_edge("a", "b", -1)
+        for search in (dijkstra_path, bidirectional_dijkstra):
+            with self.assertRaises(ValueError):
+                search(w, "a", "b")
+
+    def test_csr_reverse(self):
+        g = random_graph(random.Random(1), 20, 60)
+        csr = g.to_csr()
+        rev = csr.reverse()
+        self.assertIs(csr.reverse(), rev)
+        self.assertIs(rev.reverse(), csr)
+        for u in g.get_nodes():
+            for v, w in g.get_edges(u).items():
+                self.assertEqual(rev.get_edge_weight(v, u), w)
+        self.assertEqual(rev.num_edges(), csr.num_edges())
+
+
+if __name__ == "__main__":
+    unittest.main()
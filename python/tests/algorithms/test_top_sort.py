@@ -0,0 +1,329 @@
+import unittest
+import random
+from py_dsa.algorithms import (
+    DynamicTopologicalOrder,
+    condensation,
+    is_bipartite,
+    strongly_connected_components,
+    topological_layers,
+    topological_sort,
+    validTree,
+)
+from py_dsa.datastructures import CycleError, EdgeNotFoundError, UnweightedGraph, WeightedGraph
+
+
+def random_dag(n, m, seed=0):
+    rng = random.Random(seed)
+    g = UnweightedGraph()
+    order = list(range(n))
+    rng.shuffle(order)
+    for node in order:
+        g.add_node(node)
+    for _ in range(m):
+        a, b = sorted(rng.sample(range(n), 2))
+        g.add_edge(order[a], order[b])
+    return g
+
+
+class TestTopologicalSort(unittest.TestCase):
+    def assertTopological(self, g, order):
+        self.assertEqual(sorted(order, key=str), sorted(g.get_nodes(), key=str))
+        position = {node: i for i, node in enumerate(order)}
+        for u in g.get_nodes():
+            for v in g.get_edges(u):
+                self.assertLess(position[u], position[v])
+
+    def test_random_dag(self):
+        g = random_dag(200, 800)
+        self.assertTopological(g, topological_sort(g))
+
+    def test_csr_snapshot(self):
+        g = random_dag(200, 800, seed=1)
+        order = topological_sort(g.to_csr())
+        self.assertTopological(g, order)
+        self.assertEqual(order, topological_sort(g))
+
+    def test_cycle(self):
+        g = WeightedGraph()
+        g.add_edge("a", "b")
+        g.add_edge("b", "c")
+        g.add_edge("c", "a")
+        self.assertEqual(topological_sort(g), [])
+        self.assertEqual(topological_sort(g.to_csr()), [])
+
+    def test_layers(self):
+        g = UnweightedGraph()
+        for u, v in (("a", "c"), ("b", "c"), ("c", "d"), ("a", "e"), ("e", "d")):
+            g.add_edge(u, v)
+        g.add_node("f")
+        self.assertEqual(
+            [sorted(layer) for layer in topological_layers(g)],
+            [["a", "b", "f"], ["c", "e"], ["d"]],
+        )
+        g = random_dag(200, 800, seed=4)
+        layers = topological_layers(g.to_csr())
+        self.assertTopological(g, [node for layer in layers for node in layer])
+        depth = {node: i for i, layer in enumerate(layers) for node in layer}
+        for node in g.get_nodes():
+            preds = [u for u in g.get_nodes() if node in g.get_edges(u)]
+            self.assertEqual(depth[node], max((depth[u] + 1 for u in preds), default=0))
+        g.add_edge(199, 0)
+        g.add_edge(0, 199)
+        self.assertEqual(topological_layers(g), [])
+
+    def test_after_removal(self):
+        g = random_dag(200, 800, seed=2)
+        g.compact_threshold = None
+        g.add_edge(199, 0)
+        g.add_edge(0, 199)
+        self.assertEqual(topological_sort(g), [])
+        for node in range(0, 200, 3):
+            g.remove_node(node)
+        self.assertTopological(g, topological_sort(g))
+
+
+def reachable(g, start):
+    seen, stack = {start}, [start]
+    while stack:
+        for v in g.get_edges(stack.pop()):
+            if v not in seen:
+                seen.add(v)
+                stack.append(v)
+    return seen
+
+
+class TestStronglyConnectedComponents(unittest.TestCase):
+    def assertComponents(self, g, count, comp):
+        nodes = list(g.get_nodes())
+        ids = {node: comp[g.get_idx(node)] for node in nodes}
+        self.assertEqual(set(ids.values()), set(range(count)))
+        reach = {node: reachable(g, node) for node in nodes}
+        for u in nodes:
+            for v in nodes:
+                same = v in reach[u] and u in reach[v]
+                self.assertEqual(ids[u] == ids[v], same)
+            for v in g.get_edges(u):
+                self.assertLessEqual(ids[u], ids[v])
+
+    def test_random_graphs(self):
+        rng = random.Random(0)
+        for _ in range(30):
+            n = rng.randint(1, 25)
+            g = UnweightedGraph()
+            for node in range(n):
+                g.add_node(node)
+            for _ in range(rng.randint(0, 2 * n)):
+                g.add_edge(rng.randrange(n), rng.randrange(n))
+            count, comp = strongly_connected_components(g)
+            self.assertComponents(g, count, comp)
+            self.assertEqual(strongly_connected_components(g.to_csr()), (count, comp))
+
+    def test_condensation(self):
+        g = WeightedGraph()
+        for u, v in (("a", "b"), ("b", "a"), ("b", "c"), ("c", "d"), ("d", "c"),
+                     ("a", "d"), ("e", "e"), ("d", "e")):
+            g.add_edge(u, v)
+        dag, comp = condensation(g)
+        self.assertEqual(dag.num_nodes(), 3)
+        ab, cd, e = (comp[g.get_idx(node)] for node in "ace")
+        self.assertEqual(comp[g.get_idx("b")], ab)
+        self.assertEqual(comp[g.get_idx("d")], cd)
+        self.assertEqual((ab, cd, e), (0, 1, 2))
+        self.assertEqual(sorted(dag.neighbors_idx(ab)), [cd])
+        self.assertEqual(sorted(dag.neighbors_idx(cd)), [e])
+        self.assertEqual(list(dag.neighbors_idx(e)), [])
+        self.assertEqual(topological_sort(dag), [0, 1, 2])
+
+    def test_long_path_and_removal(self):
+        g = UnweightedGraph()
+        g.compact_threshold = None
+        n = 20000
+        for i in range(n - 1):
+            g.add_edge(i, i + 1)
+        g.add_edge(n - 1, 0)
+        count, comp = strongly_connected_components(g)
+        self.assertEqual(count, 1)
+        g.remove_node(n // 2)
+        count, comp = strongly_connected_components(g)
+        self.assertEqual(count, n - 1)
+        self.assertEqual(comp[n // 2], -1)
+        self.assertEqual(comp[n // 2 + 1], 0)
+        self.assertEqual(comp[n // 2 - 1], n - 2)
+
+
+class TestValidTree(unittest.TestCase):
+    def test_edge_lists(self):
+        self.assertTrue(validTree(5, [[0, 1], [0, 2], [0, 3], [1, 4]]))
+        self.assertFalse(validTree(5, [[0, 1], [1, 2], [2, 3], [1, 3], [1, 4]]))
+        self.assertFalse(validTree(4, [[0, 1], [2, 3]]))
+        self.assertTrue(validTree(1, []))
+        self.assertFalse(validTree(0, []))
+
+    def test_repeated_edges_count_once(self):
+        self.assertTrue(validTree(2, [[0, 1], [0, 1]]))
+        self.assertTrue(validTree(2, [[0, 1], [1, 0]]))
+        self.assertTrue(validTree(3, [[0, 1], [1, 2], [1, 0], [2, 1]]))
+        self.assertFalse(validTree(3, [[0, 1], [1, 0]]))
+        self.assertFalse(validTree(1, [[0, 0]]))
+        self.assertFalse(validTree(3, [[0, 1], [1, 2], [0, 1], [2, 0]]))
+
+    def test_streams_and_stops_early(self):
+        read = []
+
+        def edges():
+            for edge in ((0, 1), (1, 2), (2, 0), (2, 3)):
+                read.append(edge)
+                yield edge
+
+        self.assertFalse(validTree(4, edges()))
+        self.assertEqual(read, [(0, 1), (1, 2), (2, 0)])
+
+    def test_long_path(self):
+        n = 100000
+        self.assertTrue(validTree(n, ((i, i + 1) for i in range(n - 1))))
+
+    def test_graphs(self):
+        g = UnweightedGraph()
+        for u, v in (("a", "b"), ("b", "a"), ("a", "c"), ("d", "c")):
+            g.add_edge(u, v)
+        self.assertTrue(validTree(g))
+        self.assertTrue(validTree(g.to_csr()))
+        g.add_edge("d", "b")
+        self.assertFalse(validTree(g))
+        g.remove_edge("d", "b")
+        g.add_edge("e", "e")
+        self.assertFalse(validTree(g))
+        g.remove_node("e")
+        g.add_node("f")
+        self.assertFalse(validTree(g))
+
+
+class TestIsBipartite(unittest.TestCase):
+    def assertOddCycle(self, g, cycle):
+        self.assertEqual(len(cycle) % 2, 1)
+        self.assertEqual(len(set(cycle)), len(cycle))
+        for u, v in zip(cycle, cycle[1:] + cycle[:1]):
+            self.assertTrue(g.has_edge(u, v) or g.has_edge(v, u))
+
+    def test_dict(self):
+        self.assertTrue(is_bipartite({0: [1, 3], 1: [0, 2], 2: [1, 3], 3: [0, 2]}))
+        self.assertFalse(is_bipartite({0: [1, 2, 3], 1: [0, 2], 2: [0, 1, 3], 3: [0, 2]}))
+
+    def test_random_graphs(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            n = rng.randint(1, 20)
+            g = UnweightedGraph()
+            for node in range(n):
+                g.add_node(node)
+            for _ in range(rng.randint(0, n + 3)):
+                g.add_edge(rng.randrange(n), rng.randrange(n))
+            ok, cycle = is_bipartite(g, witness=True)
+            self.assertEqual(is_bipartite(g.to_csr()), ok)
+            if ok:
+                self.assertIsNone(cycle)
+                continue
+            self.assertOddCycle(g, cycle)
+
+    def test_witness(self):
+        g = UnweightedGraph()
+        n = 50001
+        for i in range(n):
+            g.add_edge(i, (i + 1) % n)
+        ok, cycle = is_bipartite(g.to_csr(), witness=True)
+        self.assertFalse(ok)
+        self.assertEqual(len(cycle), n)
+        self.assertOddCycle(g, cycle)
+        g.remove_node(0)
+        self.assertEqual(is_bipartite(g, witness=True), (True, None))
+        g = UnweightedGraph()
+        g.add_edge("x", "x")
+        self.assertEqual(is_bipartite(g, witness=True), (False, ["x"]))
+
+
+class TestDynamicTopologicalOrder(unittest.TestCase):
+    def assertTopological(self, g, order):
+        TestTopologicalSort.assertTopological(self, g, order)
+
+    def test_random_insertions(self):
+        rng = random.Random(0)
+        for _ in range(10):
+            n = rng.randint(2, 30)
+            dto = DynamicTopologicalOrder()
+            for node in range(n):
+                dto.add_node(node)
+            for _ in range(3 * n):
+                u, v = rng.randrange(n), rng.randrange(n)
+                cyclic = u in reachable(dto.graph, v)
+                edges = sum(len(dto.graph.get_edges(x)) for x in range(n))
+                if cyclic:
+                    with self.assertRaises(CycleError):
+                        dto.add_edge(u, v)
+                    self.assertFalse(dto.graph.has_edge(u, v))
+                    self.assertEqual(sum(len(dto.graph.get_edges(x)) for x in range(n)), edges)
+                else:
+                    dto.add_edge(u, v)
+                order = dto.order()
+                self.assertTopological(dto.graph, order)
+                for i, node in enumerate(order):
+                    self.assertEqual(dto.position(node), i)
+
+    def test_wraps_graph(self):
+        g = random_dag(100, 300, seed=3)
+        g.compact_threshold = None
+        g.remove_node(50)
+        dto = DynamicTopologicalOrder(g)
+        self.assertTopological(g, dto.order())
+        first = dto.order()[0]
+        dto.add_node("a")
+        dto.add_node("b")
+        dto.add_edge("b", "a")
+        dto.add_edge("a", first)
+        self.assertLess(dto.position("b"), dto.position(first))
+        self.assertTopological(g, dto.order())
+        with self.assertRaises(CycleError):
+            dto.add_edge(first, "b")
+        with self.assertRaises(CycleError):
+            dto.add_edge("a", "a")
+
+    def test_rejected_edge_leaves_no_trace(self):
+        dto = DynamicTopologicalOrder()
+        dto.add_edge(1, 2)
+        with self.assertRaises(CycleError):
+            dto.add_edge("x", "x")
+        self.assertFalse(dto.graph.has_node("x"))
+        self.assertEqual(dto.order(), [1, 2])
+        with self.assertRaises(CycleError):
+            dto.add_edge(2, 1)
+        self.assertEqual(dto.graph.num_nodes(), 2)
+        self.assertFalse(dto.graph.has_edge(2, 1))
+        self.assertEqual(dto.order(), [1, 2])
+        # an edge from a new node into the order moves it before its target
+        dto.add_edge(0, 1)
+        self.assertEqual(dto.order(), [0, 1, 2])
+
+    def test_remove_edge_then_reorder(self):
+        g = UnweightedGraph()
+        dto = DynamicTopologicalOrder(g)
+        for u, v in (("v", "x"), ("x", "w"), ("w", "u")):
+            dto.add_edge(u, v)
+        dto.remove_edge("w", "u")
+        self.assertFalse(g.has_edge("w", "u"))
+        # u now comes last, so this edge has to reorder, which must not see w -> u
+        dto.add_edge("u", "v")
+        order = dto.order()
+        self.assertEqual(sorted(order), ["u", "v", "w", "x"])
+        self.assertTopological(g, order)
+        with self.assertRaises(EdgeNotFoundError):
+            dto.remove_edge("w", "u")
+
+    def test_cyclic_graph(self):
+        g = UnweightedGraph()
+        g.add_edge(1, 2)
+        g.add_edge(2, 1)
+        with self.assertRaises(CycleError):
+            DynamicTopologicalOrder(g)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,375 @@
+import random
+import unittest
+import numpy as np
+from py_dsa.datastructures import (
+    WeightedGraph,
+    UnweightedGraph,
+    CSRGraph,
+    MatchingGraph,
+    FrozenGraphError,
+    NodeNotFoundError,
+    EdgeNotFoundError,
+)
+
+
+class TestCSRGraph(unittest.TestCase):
+    def weighted_graph(self):
+        g = WeightedGraph()
+        g.add_edge("a", "b", 2.0)
+        g.add_edge("a", "c", 0.5)
+        g.add_edge("c", "b", 3)
+        g.add_node("d")
+        return g
+
+    def test_layout_matches_ids(self):
+        g = self.weighted_graph()
+        csr = g.to_csr()
+        self.assertIsInstance(csr, CSRGraph)
+        self.assertEqual(csr.offsets.format, "i")
+        self.assertEqual(csr.targets.format, "i")
+        self.assertEqual(csr.weights.format, "d")
+        self.assertEqual(list(csr.offsets), [0, 2, 2, 3, 3])
+        self.assertEqual(list(csr.targets), [g.get_idx("b"), g.get_idx("c"), g.get_idx("b")])
+        self.assertEqual(list(csr.weights), [2.0, 0.5, 3.0])
+        for node in g.get_nodes():
+            self.assertEqual(csr.get_idx(node), g.get_idx(node))
+            self.assertEqual(csr.get_edges(node), g.get_edges(node))
+        self.assertEqual(csr.num_nodes(), 4)
+        self.assertEqual(csr.num_edges(), 3)
+        self.assertEqual(csr.get_edge_weight("c", "b"), 3.0)
+        with self.assertRaises(EdgeNotFoundError):
+            csr.get_edge_weight("b", "c")
+        with self.assertRaises(NodeNotFoundError):
+            csr.get_edges("z")
+
+    def test_unweighted(self):
+        g = UnweightedGraph()
+        g.add_edge(1, 2)
+        g.add_edge(2, 3)
+        csr = g.freeze()
+        self.assertIsNone(csr.weights)
+        self.assertFalse(csr.is_weighted())
+        self.assertEqual(csr.get_edges(1), {2})
+        self.assertTrue(csr.has_edge(2, 3))
+        self.assertFalse(csr.has_edge(3, 2))
+
+    def test_snapshot_is_immutable(self):
+        g = self.weighted_graph()
+        csr = g.to_csr()
+        with self.assertRaises(FrozenGraphError):
+            csr.add_edge("a", "d", 1.0)
+        with self.assertRaises(FrozenGraphError):
+            csr.add_node("e")
+        with self.assertRaises(TypeError):
+            csr.targets[0] = 3
+        # later changes to the source graph don't leak into the snapshot
+        g.add_edge("d", "a", 1.0)
+        self.assertEqual(csr.get_edges("d"), {})
+
+
+class TestIndexAccessors(unittest.TestCase):
+    def test_views_are_read_only_and_live(self):
+        g = WeightedGraph()
+        g.add_edge("a", "b", 2.0)
+        edges = g.edges_view("a")
+        with self.assertRaises(TypeError):
+            edges["c"] = 1.0
+        g.add_edge("a", "c", 1.0)
+        self.assertEqual(dict(edges), {"b": 2.0, "c": 1.0})
+
+        u = UnweightedGraph()
+        u.add_edge(1, 2)
+        neighbors = u.edges_view(1)
+        self.assertEqual(neighbors, {2})
+        self.assertFalse(hasattr(neighbors, "add"))
+        u.add_edge(1, 3)
+        self.assertEqual(neighbors, {2, 3})
+
+    def test_view_of_node_without_edges_is_live(self):
+        g = WeightedGraph()
+        g.add_node("a")
+        edges = g.edges_view("a")
+        g.add_edge("a", "b", 1.0)
+        self.assertEqual(dict(edges), {"b": 1.0})
+
+        u = UnweightedGraph()
+        u.add_edge(1, 2)
+        neighbors = u.edges_view(2)
+        u.add_edge(2, 3)
+        self.assertEqual(neighbors, {3})
+
+    def test_get_edges_returns_copies(self):
+        g = WeightedGraph()
+        g.add_edge("a", "b", 2.0)
+        g.add_edge("a", "c", 1.0)
+        edges = g.get_edges("a")
+        self.assertIsInstance(edges, dict)
+        for dest in edges:
+            g.remove_edge("a", dest)
+        self.assertEqual(edges, {"b": 2.0, "c": 1.0})
+        self.assertEqual(g.get_edges("a"), {})
+
+        u = UnweightedGraph()
+        u.add_edge(1, 2)
+        u.add_edge(1, 3)
+        neighbors = u.get_edges(1)
+        self.assertIsInstance(neighbors, set)
+        for dest in neighbors:
+            u.remove_edge(1, dest)
+        self.assertEqual(neighbors, {2, 3})
+        self.assertEqual(u.get_edges(1), set())
+
+    def test_reads_do_not_grow_adjacency(self):
+        g = UnweightedGraph()
+        g.add_edge(1, 2)
+        self.assertEqual(len(g.get_edges(2)), 0)
+        self.assertFalse(g.has_edge(2, 1))
+        self.assertEqual(g.degree(2), 0)
+        self.assertNotIn(2, g._adjacency)
+
+    def test_node_at_neighbors_idx_degree(self):
+        g = WeightedGraph()
+        g.add_edge("a", "b")
+        g.add_edge("a", "c")
+        g.add_edge("c", "b")
+        for graph in (g, g.to_csr()):
+            self.assertEqual([graph.node_at(i) for i in range(3)], ["a", "b", "c"])
+            self.assertEqual(list(graph.neighbors_idx(0)), [1, 2])
+            self.assertEqual(list(graph.neighbors_idx(1)), [])
+            self.assertEqual(graph.degree("a"), 2)
+            self.assertEqual(graph.degree("b"), 0)
+            with self.assertRaises(NodeNotFoundError):
+                graph.node_at(3)
+            with self.assertRaises(NodeNotFoundError):
+                graph.neighbors_idx(-1)
+            with self.assertRaises(NodeNotFoundError):
+                graph.degree("z")
+
+
+class TestBulkIngestion(unittest.TestCase):
+    def random_edges(self, m=2000, n=300, seed=0):
+        rng = random.Random(seed)
+        return [(rng.randrange(n), rng.randrange(n), rng.random()) for _ in range(m)]
+
+    def assertSameGraph(self, g, h):
+        self.assertEqual(g.get_nodes(), h.get_nodes())
+        for node in g.get_nodes():
+            self.assertEqual(g.get_idx(node), h.get_idx(node))
+            self.assertEqual(list(g.edges_view(node)), list(h.edges_view(node)))
+            if isinstance(g, WeightedGraph):
+                self.assertEqual(dict(g.get_edges(node)), dict(h.get_edges(node)))
+
+    def test_weighted_matches_add_edge_loop(self):
+        edges = self.random_edges()
+        expected = WeightedGraph()
+        for u, v, w in edges:
+            expected.add_edge(u, v, w)
+
+        g = WeightedGraph()
+        g.add_edges_from(edges)
+        self.assertSameGraph(expected, g)
+
+        h = WeightedGraph()
+        src, dst, w = (np.array(col) for col in zip(*edges))
+        h.add_edges_from_arrays(src, dst, w)
+        self.assertSameGraph(expected, h)
+
+    def test_unweighted_matches_add_edge_loop(self):
+        edges = [(u, v) for u, v, _ in self.random_edges(seed=1)]
+        expected = UnweightedGraph()
+        for u, v in edges:
+            expected.add_edge(u, v)
+
+        g = UnweightedGraph()
+        g.add_edges_from(iter(edges))
+        self.assertSameGraph(expected, g)
+
+        h = UnweightedGraph()
+        h.add_edges_from_arrays(*(np.array(col) for col in zip(*edges)))
+        self.assertSameGraph(expected, h)
+
+    def test_default_weight_and_existing_nodes(self):
+        g = WeightedGraph()
+        g.add_edge("a", "b", 5)
+        g.add_edges_from([("a", "c"), ("c", "a", 2), ("a", "b", 1)], weight=3)
+        self.assertEqual(g.get_nodes(), ["a", "b", "c"])
+        self.assertEqual(dict(g.get_edges("a")), {"b": 1, "c": 3})
+        g.add_edges_from_arrays(np.array(["d"]), np.array(["a"]))
+        self.assertEqual(g.get_edge_weight("d", "a"), 1.0)
+
+    def test_validation_is_atomic(self):
+        g = WeightedGraph()
+        with self.assertRaises(TypeError):
+            g.add_edges_from([(1, 2, 1.0), (2, 3, "heavy")])
+        with self.assertRaises(TypeError):
+            g.add_edges_from([(1, 2), (None, 3)])
+        with self.assertRaises(TypeError):
+            g.add_edges_from_arrays(np.array([1]), np.array([2]), np.array(["x"]))
+        with self.assertRaises(ValueError):
+            g.add_edges_from_arrays(np.array([1, 2]), np.array([2]))
+        self.assertEqual(g.num_nodes(), 0)
+
+    def test_arrays_of_different_kinds_are_rejected(self):
+        g = UnweightedGraph()
+        with self.assertRaises(TypeError):
+            g.add_edges_from_arrays(np.array([1, 2]), np.array([2.0, 3.0]))
+        self.assertEqual(g.num_nodes(), 0)
+        # same kind, different widths is fine and keeps int nodes
+        g.add_edges_from_arrays(np.array([1], dtype=np.int32), np.array([2], dtype=np.int64))
+        self.assertEqual([type(node) for node in g.get_nodes()], [int, int])
+
+
+class TestRemoval(unittest.TestCase):
+    def graph(self):
+        g = WeightedGraph()
+        g.add_edges_from([("a", "b", 1.0), ("b", "c", 2.0), ("c", "a", 3.0),
+                          ("a", "d", 4.0), ("d", "d", 5.0)])
+        g.compact_threshold = None
+        return g
+
+    def test_remove_edge(self):
+        g = self.graph()
+        g.remove_edge("a", "b")
+        self.assertEqual(dict(g.get_edges("a")), {"d": 4.0})
+        with self.assertRaises(EdgeNotFoundError):
+            g.remove_edge("a", "b")
+        with self.assertRaises(NodeNotFoundError):
+            g.remove_edge("a", "z")
+
+    def test_remove_node_keeps_indices(self):
+        g = self.graph()
+        idx = {node: g.get_idx(node) for node in g.get_nodes()}
+        g.remove_node("d")
+        g.remove_node("b")
+        self.assertEqual(g.get_nodes(), ["a", "c"])
+        self.assertEqual(g.num_nodes(), 2)
+        self.assertEqual(g.index_bound(), 4)
+        self.assertEqual(list(g.node_indices()), [idx["a"], idx["c"]])
+        self.assertEqual(g.get_idx("c"), idx["c"])
+        self.assertFalse(g.has_node("b"))
+        self.assertEqual(dict(g.get_edges("a")), {})
+        self.assertEqual(dict(g.get_edges("c")), {"a": 3.0})
+        with self.assertRaises(NodeNotFoundError):
+            g.node_at(idx["b"])
+        with self.assertRaises(NodeNotFoundError):
+            g.remove_node("b")
+
+        # edges added after the first removal are tracked for later removals
+        g.add_edge("e", "c", 1.0)
+        g.add_edges_from([("a", "e", 1.0)])
+        g.remove_node("e")
+        self.assertEqual(dict(g.get_edges("a")), {})
+        self.assertEqual(g.get_idx("a"), idx["a"])
+
+    def test_compact(self):
+        g = self.graph()
+        g.remove_node("b")
+        remap = g.compact()
+        self.assertEqual(remap, [0, -1, 1, 2])
+        self.assertEqual(g.get_nodes(), ["a", "c", "d"])
+        self.assertEqual([g.get_idx(n) for n in "acd"], [0, 1, 2])
+        self.assertEqual(g.index_bound(), 3)
+        self.assertEqual(sorted(g.neighbors_idx(0)), [2])
+        g.add_node("e")
+        self.assertEqual(g.get_idx("e"), 3)
+
+    def test_auto_compact_and_snapshot(self):
+        g = UnweightedGraph()
+        g.add_edges_from((i, i + 1) for i in range(9))
+        for i in range(5):
+            g.remove_node(i)
+        # 5 of 10 slots are tombstones, not yet past the threshold
+        self.assertEqual(g.index_bound(), 10)
+        g.remove_node(5)
+        self.assertEqual(g.index_bound(), 4)
+        self.assertEqual(g.get_idx(6), 0)
+
+        g.compact_threshold = None
+        g.remove_node(9)
+        csr = g.to_csr()
+        self.assertEqual(csr.get_nodes(), [6, 7, 8])
+        self.assertEqual(list(csr.offsets), [0, 1, 2, 2])
+        self.assertEqual(g.index_bound(), 4)
+
+    def test_snapshot_leaves_ids_alone(self):
+        g = WeightedGraph()
+        g.compact_threshold = None
+        g.add_edges_from([("a", "b", 1.0), ("b", "c", 2.0), ("c", "d", 3.0), ("d", "a", 4.0)])
+        g.remove_node("b")
+        ids = {node: g.get_idx(node) for node in g.get_nodes()}
+        csr = g.freeze()
+        self.assertEqual({node: g.get_idx(node) for node in g.get_nodes()}, ids)
+        self.assertEqual(g.index_bound(), 4)
+        self.assertEqual(ids, {"a": 0, "c": 2, "d": 3})
+        self.assertEqual(csr.get_nodes(), ["a", "c", "d"])
+        self.assertEqual(csr.get_idx("d"), 2)
+        self.assertEqual(csr.get_edges("c"), {"d": 3.0})
+        self.assertEqual(csr.get_edges("d"), {"a": 4.0})
+
+    def test_arrays_path_updates_predecessors(self):
+        g = UnweightedGraph()
+        g.add_edge(0, 1)
+        g.remove_edge(0, 1)
+        g.remove_node(0)
+        g.add_edges_from_arrays(np.array([2, 3]), np.array([1, 1]))
+        g.remove_node(1)
+        self.assertEqual(set(g.get_edges(2)), set())
+        self.assertEqual(set(g.get_edges(3)), set())
+
+
+class TestMatchingGraph(unittest.TestCase):
+    def test_stable_insertion_order_ids(self):
+        mg = MatchingGraph("s", "t")
+        for i in range(100):
+            mg.add_edge("s", i)
+            mg.add_edge(i, "t")
+        self.assertEqual([mg.get_idx(n) for n in ("s", "t", 0, 1, 99)], [0, 1, 2, 3, 101])
+        self.assertEqual(list(mg.get_nodes())[:4], ["s", "t", 0, 1])
+        self.assertEqual(mg.node_at(mg.get_idx(42)), 42)
+        with self.assertRaises(NodeNotFoundError):
+            mg.get_idx("x")
+        for idx in (-1, 102):
+            with self.assertRaises(NodeNotFoundError):
+                mg.node_at(idx)
+
+    def test_reads_do_not_allocate(self):
+        mg = MatchingGraph("s", "t")
+        mg.add_edge("s", "a", 2)
+        mg.add_edge("a", "t", 2)
+        for u in mg.get_nodes():
+            for v in mg.get_nodes():
+                mg.edge_exists(u, v)
+                mg.get_edge_weight(u, v)
+                mg.get_residual_edge_weight(u, v)
+                mg.residual_edge_exists(u, v)
+        self.assertEqual(len(mg._flow), 2)
+        self.assertEqual(mg.get_edges("t"), {})
+        self.assertEqual(mg.get_edges("a"), {"t": 2})
+
+    def test_residual_edges(self):
+        mg = MatchingGraph("s", "t")
+        mg.add_edge("s", "a")
+        mg.add_edge("a", "b")
+        mg.add_edge("b", "t")
+        mg.preliminary_assignment("a", "b")
+        self.assertEqual(mg.get_residual_edges("a"), {"b": 1})
+        self.assertEqual(mg.get_residual_in_edges("b"), {"a": 1})
+        mg.update_residual_edge_weight("a", "b", 0)
+        self.assertEqual(mg.get_residual_in_edges("b"), {})
+        with self.assertRaises(TypeError):
+            mg.update_residual_edge_weight("a", "b", 0.5)
+        mg.reset_residual_graph()
+        self.assertEqual(mg.get_residual_edges("s"), {})
+        self.assertEqual(mg._flow.typecode, "q")
+
+    def test_add_node_clears_out_edges(self):
+        mg = MatchingGraph("s", "t")
+        mg.add_edge("a", "t", 3, cost=2)
+        mg.add_node("a")
+        self.assertEqual(mg.get_edges("a"), {})
+        self.assertEqual(mg.get_edge_costs("a"), {})
+        self.assertFalse(mg.edge_exists("a", "t"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import gzip
+import os
+import tempfile
+import unittest
+from py_dsa.datastructures import (
+    EdgeListReader,
+    read_edgelist,
+    WeightedGraph,
+    UnweightedGraph,
+    CSRGraph,
+    save_graph,
+    load_graph,
+)
+
+
+class TestBinaryGraphFormat(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "graph.bin")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def assertSameGraph(self, g, h):
+        self.assertEqual(g.get_nodes(), h.get_nodes())
+        for node in g.get_nodes():
+            self.assertEqual(g.get_idx(node), h.get_idx(node))
+            self.assertEqual(g.get_edges(node), h.get_edges(node))
+
+    def test_weighted_round_trip(self):
+        g = WeightedGraph()
+        g.add_edges_from([("usd", "eur", 0.9), ("eur", "gbp", 0.85), ("gbp", "usd", 1.3)])
+        g.add_node("jpy")
+        save_graph(g, self.path)
+        for use_mmap in (True, False):
+            loaded = load_graph(self.path, use_mmap=use_mmap)
+            self.assertIsInstance(loaded, CSRGraph)
+            self.assertTrue(loaded.is_weighted())
+            self.assertSameGraph(g.to_csr(), loaded)
+
+            thawed = loaded.to_graph()
+            self.assertIsInstance(thawed, WeightedGraph)
+            self.assertSameGraph(g, thawed)
+            thawed.add_edge("jpy", "usd", 0.007)
+            self.assertEqual(thawed.get_edge_weight("jpy", "usd"), 0.007)
+
+    def test_unweighted_int_nodes(self):
+        g = UnweightedGraph()
+        g.add_edges_from([(i, (i * 7) % 50) for i in range(50)])
+        save_graph(g, self.path)
+        loaded = load_graph(self.path)
+        self.assertIsNone(loaded.weights)
+        self.assertEqual(list(loaded.targets), list(g.to_csr().targets))
+        thawed = loaded.to_graph()
+        self.assertIsInstance(thawed, UnweightedGraph)
+        self.assertSameGraph(g, thawed)
+
+    def test_empty_graph(self):
+        save_graph(UnweightedGraph(), self.path)
+        loaded = load_graph(self.path)
+        self.assertEqual(loaded.num_nodes(), 0)
+        self.assertEqual(loaded.num_edges(), 0)
+
+    def test_pickled_nodes_need_opt_in(self):
+        g = WeightedGraph()
+        g.add_edge((0, 1), (1, 0), 2.5)
+        save_graph(g, self.path)
+        with self.assertRaises(ValueError):
+            load_graph(self.path)
+        loaded = load_graph(self.path, allow_pickle=True)
+        self.assertEqual(loaded.get_edge_weight((0, 1), (1, 0)), 2.5)
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"definitely not a graph, just some text" * 2)
+        with self.assertRaises(ValueError):
+            load_graph(self.path)
+
+        g = UnweightedGraph()
+        g.add_edges_from([(1, 2), (2, 3)])
+        save_graph(g, self.path)
+        with open(self.path, "rb+") as f:
+            f.truncate(40)
+        with self.assertRaises(ValueError):
+            load_graph(self.path)
+
+
+SNAP_SAMPLE = """# Directed graph: sample.txt
+# FromNodeId\tToNodeId
+0\t1
+0\t2
+
+1 2
+2\t0
+"""
+
+
+class TestEdgeListReader(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, name, text, compress=False):
+        path = os.path.join(self.tmpdir.name, name)
+        opener = gzip.open if compress else open
+        with opener(path, "wt") as f:
+            f.write(text)
+        return path
+
+    def test_snap_whitespace(self):
+        g = read_edgelist(self.write("sample.txt", SNAP_SAMPLE), nodetype=int)
+        self.assertIsInstance(g, UnweightedGraph)
+        self.assertEqual(g.get_nodes(), [0, 1, 2])
+        self.assertEqual(set(g.get_edges(0)), {1, 2})
+        self.assertEqual(set(g.get_edges(2)), {0})
+
+    def test_gzip_matches_plain(self):
+        plain = read_edgelist(self.write("a.txt", SNAP_SAMPLE))
+        packed = read_edgelist(self.write("a.txt.gz", SNAP_SAMPLE, compress=True))
+        self.assertEqual(plain.get_nodes(), packed.get_nodes())
+        for node in plain.get_nodes():
+            self.assertEqual(plain.get_edges(node), packed.get_edges(node))
+
+    def test_weighted_csv_with_header(self):
+        path = self.write("rates.csv", "from,to,rate\nusd, eur, 0.9\neur,usd,1.1\n")
+        g = read_edgelist(path, delimiter=",", header=True)
+        self.assertIsInstance(g, WeightedGraph)
+        self.assertEqual(g.get_edge_weight("usd", "eur"), 0.9)
+        self.assertEqual(g.get_edge_weight("eur", "usd"), 1.1)
+
+        # an explicitly unweighted target drops the weight column
+        u = read_edgelist(path, graph=UnweightedGraph(), delimiter=",", header=True)
+        self.assertTrue(u.has_edge("usd", "eur"))
+
+    def test_chunks_and_throughput(self):
+        lines = "".join(f"{i} {i + 1} {i / 10}\n" for i in range(95))
+        seen = []
+        reader = EdgeListReader(
+            self.write("chain.txt", lines),
+            nodetype=int,
+            chunk_size=10,
+            progress=lambda r: seen.append(r.edges_read),
+        )
+        g = reader.read_into()
+        self.assertEqual(seen, list(range(10, 100, 10)) + [95])
+        self.assertEqual(max(len(c) for c in reader.chunks()), 10)
+        self.assertEqual(reader.edges_read, 95)
+        self.assertGreater(reader.edges_per_second, 0)
+        self.assertEqual(g.num_nodes(), 96)
+        self.assertEqual(g.get_edge_weight(10, 11), 1.0)
+
+    def test_bad_line_reports_line_number(self):
+        path = self.write("bad.txt", "1 2 0.5\n2 3 heavy\n")
+        with self.assertRaisesRegex(ValueError, ":2:"):
+            read_edgelist(path)
+        with self.assertRaisesRegex(ValueError, ":1:"):
+            read_edgelist(self.write("short.txt", "lonely\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
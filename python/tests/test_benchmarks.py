@@ -0,0 +1,56 @@
+import unittest
+from collections import Counter
+
+from benchmarks import generators, suite
+from py_dsa.algorithms import topological_sort
+
+
+class TestGenerators(unittest.TestCase):
+    def test_seeded(self):
+        self.assertEqual(generators.erdos_renyi(50, 200, seed=3),
+                         generators.erdos_renyi(50, 200, seed=3))
+        self.assertNotEqual(generators.power_law(50, 2, seed=3),
+                            generators.power_law(50, 2, seed=4))
+
+    def test_shapes(self):
+        self.assertEqual(len(generators.grid(4, 5)), 4 * 4 + 5 * 3)
+        self.assertEqual(len(set((u, v) for u, v, _ in generators.erdos_renyi(20, 100))), 100)
+        dag = generators.layered_dag(5, 10, 3)
+        self.assertEqual(len(topological_sort(dag)), 50)
+        mg = generators.bipartite_matching(10, 8, 2)
+        self.assertEqual(len(mg.get_edges("s")), 10)
+        roads = generators.road_grid(4, 5)
+        self.assertEqual(roads.get_edge_weight(0, 1), roads.get_edge_weight(1, 0))
+        self.assertEqual(sum(roads.degree(node) for node in roads.get_nodes()), 2 * 31)
+        dense = generators.dense_network(20, 1.0, 5)
+        self.assertEqual(len(dense.get_edges(0)), 20)
+
+    def test_eulerian_circuit_is_balanced(self):
+        pairs = generators.eulerian_circuit(5, 200, seed=1)
+        out_degree = Counter(u for u, _ in pairs)
+        in_degree = Counter(v for _, v in pairs)
+        self.assertEqual(out_degree, in_degree)
+        self.assertTrue(all(u != v for u, v in pairs))
+
+
+class TestSuite(unittest.TestCase):
+    def test_run_and_compare(self):
+        report = suite.run(["small"], cases=["topological_sort"], repeat=1)
+        self.assertEqual(len(report["results"]), 2)
+        for result in report["results"]:
+            self.assertGreater(result["ops_per_sec"], 0)
+            self.assertGreater(result["peak_bytes"], 0)
+        self.assertEqual(suite.compare(report, report), [])
+
+        slower = {"results": [dict(r, seconds=r["seconds"] * 2) for r in report["results"]]}
+        regressions = suite.compare(report, slower, threshold=0.5)
+        self.assertEqual({r["metric"] for r in regressions}, {"seconds"})
+        self.assertEqual(len(regressions), 2)
+
+    def test_unknown_case(self):
+        with self.assertRaises(ValueError):
+            suite.run(["small"], cases=["nope"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+# seconds allowed for a cold `import py_dsa`, the timing test only runs when
+# this is set since wall-clock budgets are flaky on loaded machines
+IMPORT_BUDGET = os.environ.get("PY_DSA_IMPORT_BUDGET")
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OPTIONAL_DEPS = ("matplotlib", "networkx", "numpy")
+
+LOADED_SNIPPET = """
+import json, sys
+import py_dsa
+after_package = sorted(sys.modules)
+from py_dsa.datastructures import MatchingGraph
+from py_dsa.algorithms import MaxFlow
+print(json.dumps([after_package, sorted(sys.modules)]))
+"""
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import py_dsa
+print(time.perf_counter() - start)
+"""
+
+
+def run_snippet(snippet):
+    return subprocess.run(
+        [sys.executable, "-c", snippet],
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+class TestImportTime(unittest.TestCase):
+    def test_import_loads_no_submodules(self):
+        after_package, _ = json.loads(run_snippet(LOADED_SNIPPET))
+        self.assertEqual(
+            {m for m in after_package if m.startswith("py_dsa")}, {"py_dsa", "py_dsa._lazy"}
+        )
+        for dep in OPTIONAL_DEPS:
+            self.assertNotIn(dep, after_package)
+
+    def test_flow_does_not_load_visualization_deps(self):
+        _, after_flow = json.loads(run_snippet(LOADED_SNIPPET))
+        self.assertIn("py_dsa.datastructures.graph", after_flow)
+        for dep in OPTIONAL_DEPS:
+            self.assertNotIn(dep, after_flow)
+
+    @unittest.skipUnless(IMPORT_BUDGET, "set PY_DSA_IMPORT_BUDGET to time the import")
+    def test_import_within_budget(self):
+        # best of a few runs so a noisy neighbour doesn't fail the build
+        elapsed = min(float(run_snippet(IMPORT_SNIPPET)) for _ in range(3))
+        budget = float(IMPORT_BUDGET)
+        self.assertLess(elapsed, budget,
+            msg=f"import py_dsa took {elapsed:.3f}s, budget is {budget:.3f}s")
+
+
+if __name__ == "__main__":
+    unittest.main()
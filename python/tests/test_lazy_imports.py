@@ -0,0 +1,73 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOADED_SNIPPET = """
+import json, sys
+before = set(sys.modules)
+import py_dsa.datastructures
+py_dsa.datastructures.LRUCache
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_lru_cache_loads_nothing_else(self):
+        out = subprocess.run(
+            [sys.executable, "-c", LOADED_SNIPPET],
+            cwd=PACKAGE_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        loaded = set(json.loads(out))
+        self.assertEqual(
+            {m for m in loaded if m.startswith("py_dsa")},
+            {
+                "py_dsa",
+                "py_dsa._lazy",
+                "py_dsa.datastructures",
+                "py_dsa.datastructures.lru_cache",
+                # LRUCache is built on top of the linked list
+                "py_dsa.datastructures.doubly_linked_list",
+            },
+        )
+        for heavy in ("bitarray", "hashlib", "threading", "matplotlib", "networkx"):
+            self.assertNotIn(heavy, loaded)
+
+    def test_public_names_resolve(self):
+        for pkg_name in ("py_dsa.datastructures", "py_dsa.algorithms"):
+            pkg = importlib.import_module(pkg_name)
+            for name in pkg.__all__:
+                self.assertIsNotNone(getattr(pkg, name), msg=f"{pkg_name}.{name}")
+                self.assertIn(name, dir(pkg))
+
+    def test_type_variables_resolve(self):
+        from typing import TypeVar
+        import py_dsa.datastructures as ds
+        for name in ("T", "NODE_T", "KEY_T", "VAL_T", "NodeType"):
+            self.assertIsInstance(getattr(ds, name), TypeVar, msg=name)
+        self.assertIs(ds.NodeType, importlib.import_module(
+            "py_dsa.datastructures.doubly_linked_list").NodeType)
+
+    def test_name_sharing_submodule_is_the_function(self):
+        # a direct submodule import must not shadow the function of the same name
+        from py_dsa.datastructures.lfu_cache import LFUCache  # noqa: F401
+        from py_dsa.datastructures import lfu_cache
+        self.assertTrue(callable(lfu_cache))
+        self.assertNotEqual(type(lfu_cache).__name__, "module")
+        self.assertEqual(LFUCache.__module__, "py_dsa.datastructures.lfu_cache")
+
+    def test_unknown_name_raises(self):
+        import py_dsa.algorithms
+        with self.assertRaises(AttributeError):
+            py_dsa.algorithms.does_not_exist
+
+
+if __name__ == "__main__":
+    unittest.main()